@@ -0,0 +1,283 @@
+# Рассылка сообщений по сокетам с очередью на каждое соединение
+import asyncio
+import json
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Tuple, Union
+
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from Settings import settings
+
+# region необязательные кодеки
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+# endregion
+
+# region политики для медленных клиентов
+POLICY_DROP = "drop"  # новое сообщение выбрасывается
+POLICY_COALESCE = "coalesce"  # старое сообщение с тем же event заменяется новым
+POLICY_DISCONNECT = "disconnect"  # клиент отключается
+# При drop и coalesce потеря сообщения с номером все равно отключает клиента: он переподключится
+# с last_seq и догонит пропущенное, а не будет молча жить с дырой в номерах
+# endregion
+
+
+# region форматы сообщений
+CODEC_JSON = "json"  # текстовые кадры, по умолчанию
+CODEC_ORJSON = "orjson"  # тот же JSON в бинарных кадрах, кодируется быстрее
+CODEC_MSGPACK = "msgpack"  # компактные бинарные кадры
+SUBPROTOCOL_PREFIX = "sigame."  # подпротокол sigame.msgpack и т.п.
+# endregion
+
+
+def encode(data: dict) -> str:
+    """
+    Кодирует сообщение один раз для всех получателей
+    :param data:
+    :return: JSON строка
+    """
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def available_codecs() -> Tuple[str, ...]:
+    """
+    Форматы, для которых установлены библиотеки, в порядке предпочтения
+    """
+    codecs = []
+    if msgpack is not None:
+        codecs.append(CODEC_MSGPACK)
+    if orjson is not None:
+        codecs.append(CODEC_ORJSON)
+    codecs.append(CODEC_JSON)
+    return tuple(codecs)
+
+
+def negotiate(requested: Optional[str], subprotocols: Iterable[str] = ()) -> Tuple[str, Optional[str]]:
+    """
+    Выбирает формат по параметру codec или по подпротоколу sigame.<codec>
+    :param requested: Значение параметра codec
+    :param subprotocols: Подпротоколы из Sec-WebSocket-Protocol в порядке клиента
+    :return: (формат, подпротокол для accept или None)
+    """
+    codecs = available_codecs()
+    if requested in codecs:
+        return requested, None
+    for subprotocol in subprotocols:
+        if subprotocol.startswith(SUBPROTOCOL_PREFIX) and subprotocol[len(SUBPROTOCOL_PREFIX):] in codecs:
+            return subprotocol[len(SUBPROTOCOL_PREFIX):], subprotocol
+    return CODEC_JSON, None  # неизвестный или неустановленный формат - обычный JSON
+
+
+def decode(codec: str, payload: Union[str, bytes]) -> dict:
+    """
+    Разбирает сообщение клиента в его формате
+    """
+    if codec == CODEC_MSGPACK and isinstance(payload, bytes):
+        return msgpack.unpackb(payload, raw=False)
+    if codec == CODEC_ORJSON:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+async def receive(websocket: WebSocket, codec: str) -> dict:
+    """
+    Читает одно сообщение клиента, текстовое или бинарное
+    :raise ValueError: Сообщение не разобралось или это не объект
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    payload = message.get("bytes")
+    data = decode(codec, payload if payload is not None else message["text"])
+    if not isinstance(data, dict):
+        raise ValueError("сообщение клиента должно быть объектом")
+    return data
+
+
+class Frame:
+    """
+    Сообщение, которое кодируется не больше одного раза на каждый формат,
+    сколько бы получателей его ни ждали
+    """
+    __slots__ = ("_data", "_encoded", "seq")
+
+    def __init__(self, data: dict = None, text: str = None, seq: int = None):
+        """
+        :param data: Сообщение
+        :param text: Уже закодированный JSON, например от другого воркера
+        :param seq: Номер сообщения игры, None - служебное сообщение без номера
+        """
+        self._data: Optional[dict] = data
+        self.seq: Optional[int] = seq
+        self._encoded: Dict[str, Union[str, bytes]] = {} if text is None else {CODEC_JSON: text}
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            self._data = json.loads(self._encoded[CODEC_JSON])
+        return self._data
+
+    @property
+    def text(self) -> str:
+        """
+        JSON строка: обычные клиенты, догонка и пересылка другим воркерам
+        """
+        return self.encode(CODEC_JSON)
+
+    def encode(self, codec: str) -> Union[str, bytes]:
+        """
+        :return: str для текстового кадра, bytes для бинарного
+        """
+        encoded = self._encoded.get(codec)
+        if encoded is None:
+            if codec == CODEC_MSGPACK:
+                encoded = msgpack.packb(self.data, use_bin_type=True)
+            elif codec == CODEC_ORJSON:
+                encoded = orjson.dumps(self.data, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                encoded = encode(self.data)
+            self._encoded[codec] = encoded
+        return encoded
+
+
+class Connection:
+    """
+    Соединение игрока: ограниченная очередь отправки и своя задача-писатель.
+    Отправка в очередь не ждет сеть, поэтому медленный телефон не тормозит комнату.
+    """
+
+    def __init__(self, websocket: WebSocket, queue_size: int = None, policy: str = None, codec: str = CODEC_JSON):
+        self.websocket = websocket
+        self.codec: str = codec
+        self.queue_size: int = queue_size or settings["send_queue_size"]
+        self.policy: str = policy or settings["slow_consumer_policy"]
+
+        # Очередь в виде [(event, frame), ]
+        self._queue: Deque[Tuple[Optional[str], Frame]] = deque()
+        self._has_data = asyncio.Event()
+        self.closed: bool = False
+        self.dropped: int = 0  # сколько сообщений выброшено
+
+        self._writer = asyncio.create_task(self.__write_loop())
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Сколько сообщений ждут отправки
+        """
+        return len(self._queue)
+
+    def push(self, frame: Frame, event: Optional[str] = None) -> bool:
+        """
+        Кладет сообщение в очередь, кодирует его писатель в формате соединения
+        :param frame: Сообщение
+        :param event: Ключ для склейки сообщений
+        :return: Принято ли сообщение
+        """
+        if self.closed:
+            return False
+
+        if len(self._queue) >= self.queue_size:
+            if self.policy == POLICY_DISCONNECT:
+                self.__abort(1013, "slow_consumer")
+                return False
+
+            self.dropped += 1
+            lost = self.__coalesce(event) if self.policy == POLICY_COALESCE else frame
+            if lost.seq is not None:  # клиент увидит пропуск номеров, догонит его после переподключения
+                self.__abort(1013, "resync")
+                return False
+            if lost is frame:
+                return False
+
+        self._queue.append((event, frame))
+        self._has_data.set()
+        return True
+
+    def __coalesce(self, event: Optional[str]) -> Frame:
+        """
+        Освобождает место: убирает старое сообщение с тем же event, иначе самое старое
+        :return: Выброшенное сообщение
+        """
+        if event is not None:
+            for i, (queued_event, frame) in enumerate(self._queue):
+                if queued_event == event:
+                    del self._queue[i]
+                    return frame
+        return self._queue.popleft()[1]
+
+    async def send_json(self, data: dict):
+        """
+        Отправка одного сообщения этому соединению
+        """
+        self.push(Frame(data), data.get("event"))
+
+    async def __write_loop(self):
+        try:
+            while True:
+                await self._has_data.wait()
+                while self._queue:
+                    _, frame = self._queue.popleft()
+                    payload = frame.encode(self.codec)
+                    if isinstance(payload, bytes):
+                        await self.websocket.send_bytes(payload)
+                    else:
+                        await self.websocket.send_text(payload)
+                self._has_data.clear()
+        except asyncio.CancelledError:
+            pass
+        except Exception:  # сокет закрыт, чтение в main.py получит WebSocketDisconnect
+            self.closed = True
+            self._queue.clear()
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        """
+        Останавливает писателя и закрывает сокет
+        """
+        if self.closed:
+            return
+        self.stop()
+        await self.__close_socket(code, reason)
+
+    def __abort(self, code: int, reason: str):
+        """
+        Закрытие из push: очередь больше не принимает сообщения сразу, сокет закрывается задачей
+        """
+        self.stop()
+        asyncio.create_task(self.__close_socket(code, reason))
+
+    async def __close_socket(self, code: int, reason: str):
+        try:
+            await self.websocket.close(code, reason)
+        except Exception:
+            pass
+
+    def stop(self):
+        """
+        Останавливает писателя, когда сокет уже закрыт клиентом
+        """
+        self.closed = True
+        self._queue.clear()
+        self._writer.cancel()
+
+
+def deliver(connections: Iterable[Optional[Connection]], frame: Frame, event: Optional[str] = None) -> int:
+    """
+    Раскладывает сообщение по очередям, каждый формат кодируется один раз на все соединения
+    :param connections: Получатели
+    :param frame: Сообщение
+    :param event: Ключ для склейки сообщений
+    :return: Сколько соединений приняли сообщение
+    """
+    accepted = 0
+    for connection in connections:
+        if connection is not None and connection.push(frame, event):
+            accepted += 1
+    return accepted
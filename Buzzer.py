@@ -0,0 +1,136 @@
+# Кнопка ответа: кто нажал первым с поправкой на задержку сети
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from Settings import settings
+
+# Рассылка по комнате: (сообщение) -> None
+Cast = Callable[[dict], Awaitable[None]]
+
+
+def now_ms() -> float:
+    return time.perf_counter() * 1000
+
+
+class Buzzer:
+    """
+    Арбитраж нажатий одной игры.
+    Время нажатия берется при получении сообщения из сокета (до очереди актора),
+    из него вычитается половина RTT игрока, измеренного пингами.
+    Первое нажатие открывает окно buzz_window_ms, после окна побеждает
+    наименьшее исправленное время, а не тот, чью корутину цикл событий запустил раньше.
+    """
+
+    def __init__(self, game_id: int, broad_cast: Cast, main_cast: Cast):
+        self.game_id: int = game_id
+        self._broad_cast: Cast = broad_cast
+        self._main_cast: Cast = main_cast
+
+        # {user_GUID: сглаженный RTT, мс}
+        self.rtt: Dict[str, float] = {}
+
+        self.is_open: bool = False
+        # [(исправленное время, время получения, user_GUID), ]
+        self._candidates: List[Tuple[float, float, str]] = []
+        self._window: Optional[asyncio.TimerHandle] = None
+        self._pinger: Optional[asyncio.Task] = None
+
+    # region RTT
+    def start_pinging(self):
+        if self._pinger is None:
+            self._pinger = asyncio.create_task(self.__ping_loop())
+
+    async def __ping_loop(self):
+        while True:
+            try:
+                await self._broad_cast({"event": "ping", "t": now_ms()})
+            except Exception as e:
+                print(f"Ошибка пинга игры {self.game_id}: {e}")
+            await asyncio.sleep(settings["ping_interval"])
+
+    def pong(self, user_GUID: str, sent_ms, received_ms: float):
+        """
+        Ответ клиента на ping с тем же t
+        :param user_GUID:
+        :param sent_ms: t из ping
+        :param received_ms: Когда пришел ответ
+        """
+        if not isinstance(sent_ms, (int, float)) or not 0 <= received_ms - sent_ms < 60_000:
+            return
+        sample = received_ms - sent_ms
+        previous = self.rtt.get(user_GUID)
+        alpha = settings["rtt_ewma_alpha"]
+        self.rtt[user_GUID] = sample if previous is None else previous + alpha * (sample - previous)
+
+    def forget(self, user_GUID: str):
+        self.rtt.pop(user_GUID, None)
+    # endregion
+
+    # region арбитраж
+    def open(self):
+        """
+        Ведущий разрешил отвечать
+        """
+        self.__reset()
+        self.is_open = True
+
+    def close(self):
+        self.__reset()
+        self.is_open = False
+
+    def __reset(self):
+        if self._window is not None:
+            self._window.cancel()
+            self._window = None
+        self._candidates.clear()
+
+    def buzz(self, user_GUID: str, received_ms: float) -> bool:
+        """
+        Нажатие игрока, вызывается сразу при получении сообщения
+        :param user_GUID:
+        :param received_ms: Время получения
+        :return: Принято ли нажатие
+        """
+        if not self.is_open or any(candidate[2] == user_GUID for candidate in self._candidates):
+            return False
+
+        # половина RTT - задержка в одну сторону; поправку ограничиваем, чтобы нельзя было
+        # выиграть, нарочно задерживая pong
+        correction = min(self.rtt.get(user_GUID, 0) / 2, settings["max_rtt_correction_ms"])
+        self._candidates.append((received_ms - correction, received_ms, user_GUID))
+
+        if self._window is None:
+            self._window = asyncio.get_running_loop().call_later(
+                settings["buzz_window_ms"] / 1000, self.__decide)
+        return True
+
+    def __decide(self):
+        started = time.perf_counter_ns()
+        self._window = None
+        self.is_open = False
+        order = sorted(self._candidates)
+        self._candidates = []
+        decision_us = (time.perf_counter_ns() - started) / 1000
+
+        first = order[0][0]
+        winner = order[0][2]
+        asyncio.create_task(self.__announce(winner, [
+            {"user_GUID": user_GUID, "offset_ms": round(corrected - first, 3),
+             "rtt_ms": round(self.rtt.get(user_GUID, 0), 3)}
+            for corrected, _, user_GUID in order], decision_us))
+
+    async def __announce(self, winner: str, order: List[dict], decision_us: float):
+        try:
+            await self._broad_cast({"event": "buzz_winner", "user_GUID": winner})
+            await self._main_cast({"event": "buzz_order", "user_GUID": winner, "order": order,
+                                   "decision_us": round(decision_us, 1)})
+        except Exception as e:
+            print(f"Ошибка объявления победителя игры {self.game_id}: {e}")
+    # endregion
+
+    def stop(self):
+        self.close()
+        if self._pinger is not None:
+            self._pinger.cancel()
+            self._pinger = None
@@ -1,172 +1,170 @@
 # Хранение подключенных клиентов
 # версия 0.00.1
-import os
-import shutil
+import asyncio
+import time
 import uuid
 import random
-import json
-import xmltodict
-from datetime import datetime, timedelta
-from typing import Dict, Union, List, Set
-from urllib.parse import unquote
-from sqlalchemy import JSON
+from typing import Dict, List, Optional
+from sqlalchemy import JSON, select
 from sqlalchemy.orm import relationship
 from starlette.websockets import WebSocket
 
+from Broadcaster import Connection, Frame, deliver, CODEC_JSON
+from GameRegistry import registry
 from Settings import settings
-from models import db, Package
+from models import session_scope
 from models import Player, Game
-from my_db_func import find_game_id_for_user, unpack_zip_advanced, list_zip_contents
-
-
-async def upload_package(bin_data: bin, name_file: str, player: Player) -> dict:
-
-    existing_file_names = [f for f in os.listdir('.') if os.path.isdir(f)]
-    if name_file in existing_file_names:
-        return {"error": "name_pack_already_taken"}
-
-    upload_package_path: str = f"packages/{name_file}.zip"
-    finally_package_path: str = f"packages/unpacked/{name_file}"
-
-    with open(upload_package_path, 'wb') as f:  # Записываем полученную строку байтов как файл
-        f.write(bin_data)
-
-    error: bool = unpack_zip_advanced(upload_package_path, finally_package_path)
-
-    if error:
-        return {"error": "fail_extract_file"}
-
-    with open(finally_package_path + "/content.xml", encoding="utf8") as xml_file:
-        content = xmltodict.parse(xml_file.read())
-
-    if content is None:
-        return {"error": "error_decryption_content"}
-
-    name_package: str = ""
-    exists_package: Package = db.query(Package).filter(Package.name == name_package).first()
-    if exists_package is not None:
-        return {"error": "name_pack_already_taken"}
-
-    package: Package = Package(templates_pack=finally_package_path, name=name_package,
-                               content=content)  # загрузили пак
-    db.add(package)  # сохраняем в БД
-    db.commit()
-    db.refresh(package)  # обновляем данные из бд, на всякий
-
-    game = db.query(Game).filter(Game.id == player.game_id).first()  # ищем игру по коду
-    game.package_id = package.id
-    db.commit()  # коммитим без add, т.к. игра уже есть
+from PackageModel import CompiledPackage, package_cache
+from PackageStore import package_store
+from PackageCatalog import package_catalog
+from MediaServer import media_library
+from StateBackend import StateBackend, make_backend, ROLE_SCREEN, ROLE_LEADER
+from GameActor import GameActor, ActorStopped
+from ExpirySweeper import expiry_sweeper, expiry_cutoff
+from GameCodes import code_allocator
+from Buzzer import Buzzer, now_ms
+from LobbyBatch import LobbyBatch
+from Metrics import metrics, events_total, fanout_seconds
+from ReplayBuffer import ReplayBuffer, personal, AUDIENCE_ALL, AUDIENCE_PLAYERS, AUDIENCE_SCREEN, AUDIENCE_LEADER, \
+    AUDIENCE_MAIN
+
+# Служебные сообщения без номера: не меняют состояние игры и не догоняются после переподключения
+UNVERSIONED_EVENTS = ("ping", "upload_progress")
+# События клиента, которые считаются в метриках поименно, остальные - как other
+KNOWN_EVENTS = ("player_ready", "player_unready", "start_game", "change_round", "open_buzzer", "close_buzzer",
+                "buzz", "pong")
 
 
 class ConnectionManager:
 
-    def __init__(self):
+    def __init__(self, backend: StateBackend = None):
 
         # region создание списков подключений
-        # Хранение активных соединений в виде {game_id: {user_GUID: WebSocket, }}
-        self.active_connections: Dict[int, Dict[str, Union[WebSocket, str, None]]] = {}
-
-        # Храним данные в виде {game_id: {"screen_GUID": user_GUID, "leader_GUID": user_GUID}}
-        self.main_roles: Dict[int, Dict[str, Union[str, None]]] = {}
-
-        # Храним готовность в в иде {game_id: {"user_GUID": bool}}
-        self.ready_players: Dict[int, Set[str]] = {}
-
-        self.settings: Dict[int, ""] = {}
-        # endregion
-
-        # region удаляем старые игры
-        old_games = db.query(Game).filter(
-            Game.time_created < datetime.today() - timedelta(hours=settings["game_lifetime"])).all()
-        print("старые игры:", old_games)
-        if old_games:
-            for old_game in old_games:
-                print("Игра удалена", old_game.code)
-                db.delete(old_game)
-            db.commit()
+        # Сокеты этого процесса в виде {game_id: {user_GUID: Connection, }}
+        self.active_connections: Dict[int, Dict[str, Connection]] = {}
+
+        # Участники, роли, готовность и настройки комнат - в бэкенде, общем для воркеров
+        self.backend: StateBackend = backend or make_backend()
+
+        # Акторы живых игр {game_id: GameActor}, все изменения комнаты идут через них
+        self.actors: Dict[int, GameActor] = {}
+        # Кнопки ответа {game_id: Buzzer}
+        self.buzzers: Dict[int, Buzzer] = {}
+        # Склейка событий лобби {game_id: LobbyBatch}
+        self.lobbies: Dict[int, LobbyBatch] = {}
+        # Последние сообщения игр с номерами {game_id: ReplayBuffer}
+        self.replays: Dict[int, ReplayBuffer] = {}
+
+        # Пустые игры ждут переподключения {game_id: когда удалить (time.monotonic)}
+        self.dormant: Dict[int, float] = {}
+        self._teardown: Optional[asyncio.Task] = None
         # endregion
 
-        # region заполнение списков подключений
-        games = db.query(Game).all()
-        for game in games:
-            self.active_connections[game.id] = {}
-            self.main_roles[game.id] = {"screen_GUID": None, "leader_GUID": None}
-            self.ready_players[game.id] = set()
-            self.settings[game.id] = ""
-        # endregion
-
-        print("active_connections:", self.active_connections)
-        print("games:", db.query(Game).all())
-
-    def __get_screen_GUID(self, game_id) -> str:
+    async def startup(self):
         """
-        Выдает экран по id игры
-        :param game_id:
+        Загружает реестр живых игр и подключается к бэкенду состояния.
+        Устаревшие игры удаляет фоновая очистка, старт от их числа не зависит.
         :return:
         """
-        return self.main_roles[game_id]["screen_GUID"]
 
-    def __get_leader_GUID(self, game_id) -> str:
+        await registry.load(expiry_cutoff())
+        async with session_scope() as session:  # коды всех игр в БД, включая устаревшие, которые еще не удалены
+            code_allocator.load((await session.execute(select(Game.code))).scalars().all())
+
+        await self.backend.start(self.__deliver_remote, self.__on_control)
+        await self.backend.seed_ids(registry.last_ids())
+
+        # после перезапуска сокетов нет, игры удалятся, если к ним не вернутся
+        for game_id in registry.games:
+            self.__make_dormant(game_id)
+        self._teardown = asyncio.create_task(self.__teardown_loop())
+        expiry_sweeper.start(self.__retire_expired, self.release_codes)
+        self.__register_metrics()
+
+        print("state backend:", type(self.backend).__name__)
+
+    def __register_metrics(self):
         """
-        Выдает ведущего по id игры
-        :param game_id:
-        :return:
+        Метрики, которые считаются из состояния менеджера в момент сбора
         """
-        return self.main_roles[game_id]["leader_GUID"]
-
-    def __get_active_players(self, game_id) -> list:
+        metrics.gauge("sigame_active_games", "Игры в памяти этого воркера",
+                      collect=lambda: {(): len(registry.games)})
+        metrics.gauge("sigame_dormant_games", "Пустые игры, ждущие переподключения",
+                      collect=lambda: {(): len(self.dormant)})
+        metrics.gauge("sigame_active_sockets", "Открытые сокеты этого воркера",
+                      collect=lambda: {(): sum(len(connections) for connections in self.active_connections.values())})
+        metrics.gauge("sigame_send_queue_depth", "Неотправленные сообщения в очередях сокетов игры", ("game_id",),
+                      collect=lambda: {(str(game_id),): sum(connection.queue_depth
+                                                            for connection in connections.values())
+                                       for game_id, connections in self.active_connections.items()})
+        metrics.gauge("sigame_send_queue_max_depth", "Самая длинная очередь сокета в игре", ("game_id",),
+                      collect=lambda: {(str(game_id),): max((connection.queue_depth
+                                                             for connection in connections.values()), default=0)
+                                       for game_id, connections in self.active_connections.items()})
+
+    async def shutdown(self):
+        if self._teardown is not None:
+            self._teardown.cancel()
+        expiry_sweeper.stop()
+        # сокеты этого воркера закрываются вместе с ним: освобождаем их роли и участие в комнатах
+        for game_id, connections in list(self.active_connections.items()):
+            for user_GUID in list(connections):
+                await self.backend.release_role(game_id, ROLE_SCREEN, user_GUID)
+                await self.backend.release_role(game_id, ROLE_LEADER, user_GUID)
+                await self.backend.remove_member(game_id, user_GUID)
+        await self.backend.stop()
+
+    async def __get_active_players(self, game_id) -> list:
         """
         Возвращает активных игроков в игре
         :param game_id:
         :return:
         """
         active_players_info = []
-        usual_players = db.query(Player).filter(Player.game_id == game_id).all()
+        usual_players = registry.get_players(game_id)
+
+        members = await self.backend.members(game_id)
+        ready_players = await self.backend.ready(game_id)
+        leader_GUID = (await self.backend.roles(game_id))[ROLE_LEADER]
 
         for usual_player in usual_players:
-            if usual_player.GUID in self.active_connections[game_id].keys() and not usual_player.is_screen:
+            if usual_player.GUID in members and not usual_player.is_screen:
                 active_players_info.append({
                     "user_name": usual_player.name,
-                    "player_ready": usual_player.GUID in self.ready_players[game_id],
+                    "player_ready": usual_player.GUID in ready_players,
                     "user_GUID": usual_player.GUID,
-                    "is_leader": usual_player.GUID == self.main_roles[game_id]["leader_GUID"]
+                    "is_leader": usual_player.GUID == leader_GUID
                 })
         return active_players_info
 
-    def check_add_player(self, player: Player) -> dict:
+    async def check_add_player(self, player: Player) -> dict:
         """
-        Добавление пользователя с пустым соединением
+        Проверка, можно ли добавить пользователя в игру
         :param player:
         :return:
         """
-
-        if player.game_id not in self.active_connections:  # если игра только создана задаем значение основных ролей
-            self.main_roles[player.game_id] = {"screen_GUID": None, "leader_GUID": None}
-            self.active_connections[player.game_id] = {}
-            self.ready_players[player.game_id] = set()
+        roles = await self.backend.roles(player.game_id)
 
         # region Проверки
         if player.is_screen and player.is_leader:
             return {"error": "leader_not_same_screen"}
 
         if player.is_screen:
-            if self.main_roles[player.game_id]["screen_GUID"] is not None:
+            if roles[ROLE_SCREEN] is not None:
                 return {"error": "duplicat_screen"}
 
         elif player.is_leader:
-            if self.main_roles[player.game_id]["leader_GUID"] is not None:
+            if roles[ROLE_LEADER] is not None:
                 return {"error": "duplicat_leader "}
 
         if not player.is_leader and not player.is_screen:
             if player.name == "":
                 return {"error": "empty_name"}
-            if db.query(Player).filter(Player.name == player.name,
-                                       Player.game_id == player.game_id).first() is not None:
-                return {"error": "duplicat_screen"}
 
-        # endregion
+        if player.name and registry.find_player_by_name(player.game_id, player.name) is not None:
+            return {"error": "duplicat_screen"}  # имя уникально в игре, в том числе у ведущего
 
-        # self.active_connections[game_id][user_GUID] = None  # создание пустого соединения для игрока
+        # endregion
 
         return {}
 
@@ -177,185 +175,457 @@ class ConnectionManager:
         :param player:
         :return: Сообщение о загрузке
         """
-        game: Game = player.game
+        game: Game = await registry.fetch_game(player.game_id)
         game.settings = settings
-        db.commit()
+        registry.update_game(game)
+        await self.backend.set_settings(player.game_id, settings)
+
+    # region акторы
+    def __actor(self, game_id: int) -> GameActor:
+        actor = self.actors.get(game_id)
+        if actor is None:
+            actor = self.actors[game_id] = GameActor(game_id)
+        return actor
+
+    def __buzzer(self, game_id: int) -> Buzzer:
+        buzzer = self.buzzers.get(game_id)
+        if buzzer is None:
+            buzzer = self.buzzers[game_id] = Buzzer(
+                game_id,
+                lambda data: self.broad_cast(data, game_id),
+                lambda data: self.main_cast(data, game_id))
+        return buzzer
+
+    def __lobby(self, game_id: int) -> LobbyBatch:
+        lobby = self.lobbies.get(game_id)
+        if lobby is None:
+            lobby = self.lobbies[game_id] = LobbyBatch(game_id, lambda data: self.main_cast(data, game_id))
+        return lobby
+
+    def __replay(self, game_id: int) -> ReplayBuffer:
+        replay = self.replays.get(game_id)
+        if replay is None:
+            replay = self.replays[game_id] = ReplayBuffer()
+        return replay
+
+    def __stop_game(self, game_id: int):
+        """
+        Останавливает актор, кнопку и лобби удаленной игры
+        """
+        self.replays.pop(game_id, None)
+        lobby = self.lobbies.pop(game_id, None)
+        if lobby is not None:
+            lobby.stop()
+        actor = self.actors.pop(game_id, None)
+        if actor is not None:
+            actor.stop()
+        buzzer = self.buzzers.pop(game_id, None)
+        if buzzer is not None:
+            buzzer.stop()
+
+    async def dispatch(self, player: Player, data: dict, received_ms: float = None):
+        """
+        Событие от сокета игрока, обрабатывается актором его игры по порядку.
+        Нажатия и pong не ждут очередь актора: им важно время получения.
+        :param player:
+        :param data: Сообщение клиента
+        :param received_ms: Когда сообщение прочитано из сокета
+        """
+        event = data.get("event")
+        events_total.inc(event=event if event in KNOWN_EVENTS else "settings" if event is None else "other")
+        if event in ("buzz", "pong"):
+            if self.backend.shared:  # кнопка есть только в одном процессе, см. switch_buzzer
+                return
+            buzzer = self.__buzzer(player.game_id)
+            received_ms = received_ms if received_ms is not None else now_ms()
+            if event == "pong":
+                buzzer.pong(player.GUID, data.get("t"), received_ms)
+            elif not player.is_leader and not player.is_screen:
+                buzzer.buzz(player.GUID, received_ms)
+            return
+
+        await self.__actor(player.game_id).tell(lambda: self.__handle(player, data))
+
+    async def __handle(self, player: Player, data: dict):
+        if "event" in data:
 
-    async def connect(self, websocket: WebSocket, user_GUID: str):
+            if data["event"] in ("player_ready", "player_unready"):
+                is_ready = data["event"] == "player_ready"
+                await self.player_ready(player, is_ready)
+                await self.send_personal(player, {"event": data["event"]})
+                self.__lobby(player.game_id).player_ready(player.GUID, is_ready)  # уйдет одним lobby_update
+
+            if data["event"] == "start_game":
+                await self.start_game(player)
+
+            if data["event"] == "change_round" and isinstance(data.get("round"), int):
+                await self.change_round(player, data["round"])
+
+            if data["event"] in ("open_buzzer", "close_buzzer") and player.is_leader:
+                await self.switch_buzzer(player, data["event"] == "open_buzzer")
+
+        if "settings" in data and player.is_leader:
+            await self.append_settings(player, data["settings"])
+    # endregion
+
+    async def connect(self, websocket: WebSocket, user_GUID: str, last_seq: int = None, codec: str = CODEC_JSON,
+                      subprotocol: Optional[str] = None):
         """
         Ищет пользователя по переданному GUID
         Устанавливает соединение с пользователем.
         websocket.accept() — подтверждает подключение.
+        :param last_seq: Последний номер сообщения, который видел клиент до обрыва
+        :param codec: Формат сообщений, выбранный при подключении
+        :param subprotocol: Подпротокол, который подтверждаем клиенту
         """
 
         # region поиск пользователя по входящему GUID
-        player = db.query(Player).filter(Player.GUID == user_GUID).first()
+        player = await registry.fetch_player(user_GUID)  # игрока мог создать другой воркер
 
         # Если что-то пошло не так
         if player is None:
             return None
 
-        await websocket.accept()  # подтверждаем соединение !важный момент!
+        await websocket.accept(subprotocol)  # подтверждаем соединение !важный момент!
+        # endregion
 
-        if player.game_id not in self.active_connections:
-            self.active_connections[player.game_id] = {}
-        self.active_connections[player.game_id][player.GUID] = websocket  # подключение игрока
+        try:
+            return await self.__actor(player.game_id).ask(lambda: self.__register(websocket, player, last_seq, codec))
+        except ActorStopped:  # игру удалили, пока подключались
+            return None
 
-        if player.is_screen:  # запоминаем экран, игра создается только при создании экрана
+    async def __register(self, websocket: WebSocket, player: Player, last_seq: Optional[int],
+                         codec: str = CODEC_JSON) -> Optional[Player]:
+        """
+        Регистрирует соединение игрока, выполняется актором игры.
+        Переподключившийся клиент получает только пропущенные сообщения,
+        полное состояние - если буфер их уже не помнит.
+        """
 
-            if self.main_roles[player.game_id]["screen_GUID"] is not None:
-                return None
+        # занятую роль не подключаем, чтобы не перетереть чужое соединение
+        if player.is_screen and not await self.backend.claim_role(player.game_id, ROLE_SCREEN, player.GUID):
+            return None
+        if player.is_leader and not await self.backend.claim_role(player.game_id, ROLE_LEADER, player.GUID):
+            return None
 
-            self.main_roles[player.game_id]["screen_GUID"] = player.GUID
+        connection = Connection(websocket, codec=codec)  # у каждого соединения своя очередь отправки
+        connections = self.active_connections.setdefault(player.game_id, {})
+        old = connections.get(player.GUID)
+        connections[player.GUID] = connection  # подключение игрока
+        if old is not None:  # переподключение раньше, чем заметили обрыв старого сокета
+            await old.close(4000, "replaced")
+        await self.backend.add_member(player.game_id, player.GUID)
+        self.dormant.pop(player.game_id, None)  # в игру вернулись, удалять не нужно
+
+        # region догонка пропущенного
+        replay = self.__replay(player.game_id)
+        seq = replay.seq
+        missed = replay.since(last_seq, player) if last_seq is not None else None
+        if missed is not None and len(missed) >= connection.queue_size:  # столько не влезет в очередь
+            missed = None
+        if missed is not None:
+            for frame, event in missed:
+                connection.push(frame, event)
+            await connection.send_json({"event": "resync", "user_GUID": player.GUID, "seq": seq,
+                                        "replayed": len(missed)})
+        # endregion
 
-            active_players_info = self.__get_active_players(player.game_id)
+        if player.is_screen:  # экран, игра создается только при создании экрана
 
-            await websocket.send_json(
-                {"event": "user_connect", "user_GUID": player.GUID, "players_info": active_players_info})
+            if missed is None:
+                active_players_info = await self.__get_active_players(player.game_id)
 
-        elif player.is_leader:  # запоминаем лидера
+                await connection.send_json({"event": "user_connect", "user_GUID": player.GUID,
+                                            "players_info": active_players_info, "seq": seq})
 
-            if self.main_roles[player.game_id]["leader_GUID"] is not None:
-                return None
+        elif player.is_leader:  # лидер
 
-            self.main_roles[player.game_id]["leader_GUID"] = player.GUID
-            package_list = ["test1", "test2", "test3"]
+            catalog = await package_catalog.page()  # первая страница, остальное - через /packages
 
-            active_players_info = self.__get_active_players(player.game_id)
+            if missed is None:
+                active_players_info = await self.__get_active_players(player.game_id)
 
-            await websocket.send_json({"user_GUID": player.GUID, "players_info": active_players_info})
+                await connection.send_json({"user_GUID": player.GUID, "players_info": active_players_info,
+                                            "seq": seq})
             await self.main_cast(
-                {"event": "user_connect", "user_GUID": player.GUID, "is_leader": True, "package_list": package_list},
+                {"event": "user_connect", "user_GUID": player.GUID, "is_leader": True,
+                 "package_list": catalog["packages"], "package_total": catalog["total"]},
                 player.game_id)
         else:
 
-            player_ready = player.game_id in self.ready_players and player.GUID in self.ready_players[
-                player.game_id]  # готов ли игрок
+            player_ready = player.GUID in await self.backend.ready(player.game_id)  # готов ли игрок
 
-            await websocket.send_json({"user_GUID": player.GUID, "user_ready": player_ready})
-            await self.main_cast({"event": "user_connect", "user_GUID": player.GUID, "user_name": player.name,
-                                    "user_ready": player_ready},
-                                 player.game_id)
-        # endregion
+            if missed is None:
+                await connection.send_json({"user_GUID": player.GUID, "user_ready": player_ready, "seq": seq})
+            if not self.backend.shared:
+                self.__buzzer(player.game_id).start_pinging()  # RTT игроков для честной кнопки
+            self.__lobby(player.game_id).player_connected(player.GUID, player.name, player_ready)
 
         return player
 
-    async def disconnect(self, player: Player):
+    async def disconnect(self, player: Player, websocket: WebSocket = None):
         """
         Закрывает соединение и удаляет его из списка активных подключений.
-        Если в комнате больше нет пользователей, удаляет игру из списка активных подключений.
+        Если в комнате больше нет пользователей ни на одном воркере, игра засыпает
+        и удаляется фоновой задачей, если за empty_game_grace_seconds никто не вернулся.
+        :param websocket: Сокет, который закрылся; None - текущее соединение игрока
         """
 
         if player.game_id == 0:
-            player.game_id = find_game_id_for_user(player.GUID)
+            player.game_id = registry.get_player(player.GUID).game_id
+
+        if player.game_id in self.actors:
+            try:
+                await self.actors[player.game_id].ask(lambda: self.__disconnect(player, websocket))
+            except ActorStopped:  # игру удалили вместе с соединениями
+                pass
 
-        if player.game_id in self.active_connections and player.GUID in self.active_connections[player.game_id].keys():
+    async def __disconnect(self, player: Player, websocket: WebSocket = None):
+        """
+        Выполняется актором игры.
+        Обрыв старого сокета после переподключения новое соединение не трогает.
+        """
+        connection = self.active_connections.get(player.game_id, {}).get(player.GUID)
+        if connection is not None and (websocket is None or connection.websocket is websocket):
 
-            # если это лидер или экран очищаем данные
-            if self.main_roles[player.game_id]["leader_GUID"] == player.GUID:
-                self.main_roles[player.game_id]["leader_GUID"] = None
-            if self.main_roles[player.game_id]["screen_GUID"] == player.GUID:
-                self.main_roles[player.game_id]["screen_GUID"] = None
+            # если это лидер или экран освобождаем роль
+            await self.backend.release_role(player.game_id, ROLE_LEADER, player.GUID)
+            await self.backend.release_role(player.game_id, ROLE_SCREEN, player.GUID)
 
             del self.active_connections[player.game_id][player.GUID]  # удаляем соединение
+            if player.game_id in self.buzzers:
+                self.buzzers[player.game_id].forget(player.GUID)
+            connection.stop()
+            if not self.active_connections[player.game_id]:
+                del self.active_connections[player.game_id]
+
+            if await self.backend.remove_member(player.game_id, player.GUID) == 0:  # игроков не осталось
+                self.__make_dormant(player.game_id)
+                return
 
-            if not self.active_connections[player.game_id]:  # если игроков не осталось удаляем игру
+            self.__lobby(player.game_id).player_disconnected(player.GUID)
 
-                db.delete(db.query(Game).filter(Game.id == player.game_id).first())
-                db.commit()
+    # region отложенное удаление пустых игр
+    def __make_dormant(self, game_id: int):
+        self.dormant[game_id] = time.monotonic() + settings["empty_game_grace_seconds"]
 
-                if player.game_id in self.active_connections:
-                    del self.active_connections[player.game_id]
-                if player.game_id in self.main_roles:
-                    del self.main_roles[player.game_id]
-                if player.game_id in self.ready_players:
-                    del self.ready_players[player.game_id]
+    async def __teardown_loop(self):
+        while True:
+            await asyncio.sleep(settings["teardown_interval"])
+            try:
+                await self.teardown_dormant()
+            except Exception as e:
+                print(f"Ошибка удаления пустых игр: {e}")
 
-                # удаляем пак
-                game: Game = player.game  # ищем игру
-                if game is None:
-                    return
+    async def teardown_dormant(self) -> int:
+        """
+        Удаляет пустые игры, у которых вышло время ожидания: из БД одним запросом,
+        паки освобождаются, файлы удалит очистка хранилища
+        :return: Сколько игр удалено
+        """
+        now = time.monotonic()
+        expired = [game_id for game_id, deadline in self.dormant.items() if deadline <= now]
+
+        retired: List[Game] = []
+        for game_id in expired:
+            try:
+                game = await self.__actor(game_id).ask(lambda game_id=game_id: self.__retire(game_id))
+            except ActorStopped:  # игру удалил другой воркер или очистка
+                game = None
+            if game is not None:
+                retired.append(game)
+            elif game_id not in registry.games:  # игру уже удалили раньше
+                self.__stop_game(game_id)
+
+        registry.delete_games([game.id for game in retired])
+        for game in retired:
+            await self.backend.drop_game(game.id)
+            await self.backend.control(game.id, {"event": "game_removed"})
+            package_store.release(game.package_id)  # пак удалит фоновая очистка, когда на него не останется ссылок
+            self.__stop_game(game.id)
+        await self.release_codes([game.code for game in retired])
+        return len(retired)
+
+    async def release_codes(self, codes: List[str]):
+        """
+        Коды удаленных игр снова можно выдавать
+        """
+        for code in codes:
+            code_allocator.release(code)
+            await self.backend.release_code(code)
 
-                package: Package = game.package  # ищем пак
-                if package is None or package.default:  # если пак найден или он изначально загруженный
-                    return
+    async def __retire(self, game_id: int) -> Optional[Game]:
+        """
+        Выполняется актором игры: за время ожидания в игру могли вернуться
+        :return: Убранная из памяти игра или None
+        """
+        if self.dormant.get(game_id, float("inf")) > time.monotonic():
+            return None
+        del self.dormant[game_id]
+        if await self.backend.members(game_id):  # игроки есть на другом воркере
+            return None
+        return registry.forget_game(game_id)
 
-                shutil.rmtree("packages/unpacked/" + package.name)
+    async def __retire_expired(self, game_ids: List[int]) -> List[int]:
+        """
+        Готовит устаревшие игры к удалению очисткой: убирает из памяти и освобождает паки.
+        Игры, в которых еще играют, не трогаем.
+        :return: id игр, которые можно удалять из БД
+        """
+        removable = []
+        for game_id in game_ids:
+            if game_id in registry.games:
+                try:
+                    if not await self.__actor(game_id).ask(lambda game_id=game_id: self.__retire_stale(game_id)):
+                        continue
+                except ActorStopped:  # игру уже удалили
+                    pass
+                self.__stop_game(game_id)
+            removable.append(game_id)
+        return removable
+
+    async def __retire_stale(self, game_id: int) -> bool:
+        """
+        Выполняется актором игры, поэтому не пересекается с подключением и началом раунда
+        :return: Можно ли удалять игру из БД
+        """
+        if await self.backend.members(game_id):
+            return False
+        game = registry.forget_game(game_id)
+        if game is not None:
+            self.dormant.pop(game_id, None)
+            await self.backend.drop_game(game_id)
+            await self.backend.control(game_id, {"event": "game_removed"})
+            package_store.release(game.package_id)
+        return True
+    # endregion
+
+    # region доставка
+    def __deliver(self, game_id: int, to: Optional[List[str]], frame: Frame, event: Optional[str],
+                  seq: Optional[int] = None, audience: Optional[str] = None):
+        """
+        Раскладывает кадр по сокетам этого воркера и запоминает его для догонки
+        :param game_id:
+        :param to: GUID получателей, None - все сокеты комнаты
+        :param frame: Сообщение
+        :param event: Ключ для склейки сообщений
+        :param seq: Номер сообщения игры
+        :param audience: Кому адресовано, для догонки после переподключения
+        """
+        if seq is not None:
+            self.__replay(game_id).append(seq, audience, frame, event)
+
+        connections = self.active_connections.get(game_id)
+        if not connections:
+            return
+        if to is None:
+            deliver(connections.values(), frame, event)
+        else:
+            deliver((connections.get(user_GUID) for user_GUID in to), frame, event)
 
-                db.delete(package)
-                db.commit()
+    def __deliver_remote(self, game_id: int, to: Optional[List[str]], text: str, event: Optional[str],
+                         seq: Optional[int] = None, audience: Optional[str] = None):
+        """
+        Кадр от другого воркера приходит JSON строкой, другие форматы кодируются из нее один раз
+        """
+        self.__deliver(game_id, to, Frame(text=text, seq=seq), event, seq, audience)
 
-            else:
-                await self.main_cast({"event": "user_disconnected", "user_GUID": player.GUID}, player.game_id)
+    async def __publish(self, game_id: int, to: Optional[List[str]], received_data: dict, audience: str):
+        """
+        Нумерует сообщение: свои сокеты получают его сразу, остальные воркеры - JSON строкой через бэкенд.
+        Каждый формат кодируется один раз на всех получателей.
+        """
+        started = time.perf_counter()
+        event = received_data.get("event")
+        seq = None
+        if event not in UNVERSIONED_EVENTS:
+            seq = await self.backend.next_seq(game_id)
+            received_data = {**received_data, "seq": seq}
+
+        frame = Frame(received_data, seq=seq)
+        self.__deliver(game_id, to, frame, event, seq, audience)
+        if self.backend.shared:  # в одном процессе JSON может и не понадобиться
+            await self.backend.publish(game_id, to, frame.text, event, seq, audience)
+        fanout_seconds.observe(time.perf_counter() - started,
+                               audience="personal" if audience.startswith("user:") else audience)
+
+    async def __on_control(self, game_id: int, message: dict):
+        """
+        Служебные сообщения других воркеров
+        """
+        if message.get("event") == "game_removed":  # игру удалил другой воркер
+            registry.forget_game(game_id)
+            self.__stop_game(game_id)
+            for connection in self.active_connections.pop(game_id, {}).values():
+                connection.stop()
+    # endregion
+
+    async def send_personal(self, player: Player, received_data: dict):
+        """
+        Отправка сообщения одному пользователю через его очередь
+        """
+        # сокет игрока может быть на другом воркере
+        await self.__publish(player.game_id, [player.GUID], received_data, personal(player.GUID))
 
     async def broad_cast(self, received_data: dict, received_game_id: int, cast_main_role: bool = False):
         """
         Рассылает сообщение всем пользователям в комнате.
+        Сообщение кодируется один раз и раскладывается по очередям соединений.
         :param received_data: Данные для отправки
         :param received_game_id: game_id
         :param cast_main_role: Отправлять для главным ролям
         :return:
         """
 
-        main_role_guid = self.main_roles[received_game_id].values()
-
-        if received_game_id in self.active_connections:
-            for user_GUID, connection in self.active_connections[received_game_id].items():  # рассылаем всем пользователям
-
-                if not cast_main_role and user_GUID in main_role_guid:
-                    continue
+        if cast_main_role:
+            await self.__publish(received_game_id, None, received_data, AUDIENCE_ALL)
+            return
 
-                if connection is not None:
-                    await connection.send_json(received_data)
+        members = await self.backend.members(received_game_id)
+        members.difference_update((await self.backend.roles(received_game_id)).values())
+        await self.__publish(received_game_id, list(members), received_data, AUDIENCE_PLAYERS)
 
     async def screen_cast(self, received_data: dict, received_game_id: int):
         """
         Отправка информации на экран
         """
-        if received_game_id in self.main_roles:
+        screen_player_GUID = (await self.backend.roles(received_game_id))[ROLE_SCREEN]  # ищем экран
+        if screen_player_GUID is None:
+            await self.broad_cast({"error": "screen_not_found"}, received_game_id)
+            return
 
-            screen_player_GUID = self.__get_screen_GUID(received_game_id)  # ищем экран
-            if screen_player_GUID is None:
-                await self.broad_cast({"error": "screen_not_found"}, received_game_id)
-                return
-
-            if received_game_id in self.active_connections and screen_player_GUID in self.active_connections[
-                received_game_id]:
-                connection = self.active_connections[received_game_id][screen_player_GUID]
-                await connection.send_json(received_data)
+        await self.__publish(received_game_id, [screen_player_GUID], received_data, AUDIENCE_SCREEN)
 
     async def leader_cast(self, received_data: dict, received_game_id: int):
         """
         Отправка информации на ведущего
         """
-        if received_game_id in self.main_roles:
-
-            leader_player_GUID = self.__get_leader_GUID(received_game_id)  # ищем экран
-            if leader_player_GUID is None:
-                await self.screen_cast({"error": "leader_not_found"}, received_game_id)
-                return
+        leader_player_GUID = (await self.backend.roles(received_game_id))[ROLE_LEADER]  # ищем ведущего
+        if leader_player_GUID is None:
+            await self.screen_cast({"error": "leader_not_found"}, received_game_id)
+            return
 
-            if received_game_id in self.active_connections and leader_player_GUID in self.active_connections[
-                received_game_id]:
-                connection = self.active_connections[received_game_id][leader_player_GUID]
-                await connection.send_json(received_data)
+        await self.__publish(received_game_id, [leader_player_GUID], received_data, AUDIENCE_LEADER)
 
     async def main_cast(self, received_data: dict, received_game_id: int):
+        """
+        Отправка информации на экран и ведущего, сообщение кодируется один раз
+        """
+        roles = await self.backend.roles(received_game_id)
+        screen_player_GUID = roles[ROLE_SCREEN]
+        leader_player_GUID = roles[ROLE_LEADER]
 
-        await self.screen_cast(received_data, received_game_id)
-        await self.leader_cast(received_data, received_game_id)
+        if screen_player_GUID is None:
+            await self.broad_cast({"error": "screen_not_found"}, received_game_id)
+        elif leader_player_GUID is None:
+            await self.screen_cast({"error": "leader_not_found"}, received_game_id)
 
-    async def player_ready(self, player: Player, is_ready: bool) -> list:
+        to = [user_GUID for user_GUID in (screen_player_GUID, leader_player_GUID) if user_GUID is not None]
+        await self.__publish(received_game_id, to, received_data, AUDIENCE_MAIN)
 
-        if player.game_id not in self.ready_players:
-            self.ready_players[player.game_id] = set()
-
-        if is_ready:
-            self.ready_players[player.game_id].add(player.GUID)
-        else:
-            self.ready_players[player.game_id].discard(player.GUID)
+    async def player_ready(self, player: Player, is_ready: bool) -> list:
 
-        return list(self.ready_players[player.game_id])
+        return list(await self.backend.set_ready(player.game_id, player.GUID, is_ready))
 
     async def start_game(self, player: Player):
         """
@@ -364,25 +634,86 @@ class ConnectionManager:
         :return:
         """
         if not player.is_leader:
-            await self.active_connections[player.game_id][player.GUID].send_json({"error": "is_not_leader"})
+            await self.send_personal(player, {"error": "is_not_leader"})
+            return
+
+        # пак могли назначить на другом воркере
+        game: Game = await registry.fetch_game(player.game_id, refresh=self.backend.shared)
+        package_id = game.package_id if game is not None and game.package_id is not None \
+            else settings["default_package_id"]
+
+        package: CompiledPackage = await package_cache.get(package_id)  # собранный пак из кэша
+        if package is None or not package.rounds:
+            await self.send_personal(player, {"error": "bad_package"})
+            return
+
+        game_info = package.info
+        first_round_info = package.rounds[0].info
+
+        screen_GUID = (await self.backend.roles(player.game_id))[ROLE_SCREEN]
+        if screen_GUID is not None:
+            await self.backend.set_ready(player.game_id, screen_GUID, True)
+        ready_players = await self.backend.set_ready(player.game_id, player.GUID, True)
+        members = await self.backend.members(player.game_id)
+
+        if members <= ready_players:  # если все подключенные игроки готовы
+            await self.__lobby(player.game_id).flush()  # лобби должно прийти раньше начала игры
+            prefetch = await media_library.manifest(package_id, 0)  # клиенты качают медиа раунда в фоне
+            await self.broad_cast({"event": "game_start", "first_round_info": first_round_info,
+                                   "prefetch": prefetch}, player.game_id)
+            await self.main_cast({"event": "game_start", "game_info": game_info,
+                                       "first_round_info": first_round_info,
+                                       "settings": await self.backend.get_settings(player.game_id),
+                                       "prefetch": prefetch},
+                                 player.game_id)
+        else:
+            await self.leader_cast({"error": "not_all_players_ready"}, player.game_id)
 
-        package = db.query(Package).filter(Package.id == 1).first()
-        if package is None:
-            await self.active_connections[player.game_id][player.GUID].send_json({"error": "bad_package"})
+    async def change_round(self, player: Player, round_index: int):
+        """
+        Переход к раунду, вместе с раундом уходит манифест предзагрузки его медиа
+        :param player: Ведущий
+        :param round_index: Номер раунда
+        :return:
+        """
+        if not player.is_leader:
+            await self.send_personal(player, {"error": "is_not_leader"})
+            return
 
-        content: dict = json.loads(unquote(package.content))
-        print(content)
+        game: Game = await registry.fetch_game(player.game_id, refresh=self.backend.shared)
+        if game is None:
+            return
+        package_id = game.package_id if game.package_id is not None else settings["default_package_id"]
 
-        game_info = content["package"]
-        first_round_info = content["rounds"][0]
+        package: CompiledPackage = await package_cache.get(package_id)
+        round_ = package.get_round(round_index) if package is not None else None
+        if round_ is None:
+            await self.send_personal(player, {"error": "bad_round"})
+            return
 
-        self.ready_players[player.game_id].add(self.__get_screen_GUID(player.game_id))
-        self.ready_players[player.game_id].add(player.GUID)
+        game.now_round = round_index
+        registry.update_game(game)
 
-        if list(self.active_connections[player.game_id].keys()).sort() == list(self.ready_players[player.game_id]).sort():  # если все подключенные игроки готовы
-            await self.broad_cast({"event": "game_start", "first_round_info": first_round_info}, player.game_id)
-            await self.main_cast({"event": "game_start", "game_info": game_info,
-                                       "first_round_info": first_round_info, "settings": self.settings[player.game_id]},
-                                 player.game_id)
+        prefetch = await media_library.manifest(package_id, round_index)
+        await self.broad_cast({"event": "round_start", "round": round_index, "round_info": round_.info,
+                               "prefetch": prefetch}, player.game_id, cast_main_role=True)
+
+    async def switch_buzzer(self, player: Player, is_open: bool):
+        """
+        Ведущий открывает или закрывает прием нажатий
+        :param player: Ведущий
+        :param is_open:
+        :return:
+        """
+        if self.backend.shared:
+            # нажатия и pong приходят на воркер игрока, а кнопка и часы пинга - в процессе ведущего,
+            # пока арбитраж не перенесен в бэкенд, кнопка работает только с одним воркером
+            await self.send_personal(player, {"error": "buzzer_unavailable"})
+            return
+        buzzer = self.__buzzer(player.game_id)
+        if is_open:
+            buzzer.open()
         else:
-            await self.leader_cast({"error": "not_all_players_ready"}, player.game_id)
\ No newline at end of file
+            buzzer.close()
+        await self.broad_cast({"event": "buzzer_open" if is_open else "buzzer_closed"}, player.game_id,
+                              cast_main_role=True)
@@ -0,0 +1,120 @@
+# Фоновое удаление игр старше game_lifetime
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional, Set
+
+from sqlalchemy import select, delete
+
+from GameRegistry import registry
+from Metrics import metrics
+from Settings import settings
+from models import session_scope, Game, Player
+
+# Подготовка игр к удалению: получает id, возвращает те, которые можно удалять
+Retire = Callable[[List[int]], Awaitable[List[int]]]
+# Возврат кодов удаленных игр для повторной выдачи
+Release = Callable[[List[str]], Awaitable[None]]
+
+
+def expiry_cutoff() -> datetime:
+    """
+    Игры, созданные раньше этого времени, считаются устаревшими
+    """
+    return datetime.today() - timedelta(hours=settings["game_lifetime"])
+
+
+class ExpirySweeper:
+    """
+    Периодически удаляет устаревшие игры пачками по expiry_sweep_batch запросами на множество id.
+    Один проход укладывается в expiry_sweep_budget_ms, остаток доберет следующий.
+    """
+
+    def __init__(self):
+        # region метрики
+        self.runs: int = 0
+        self.games_reaped: int = 0  # всего удалено игр
+        self.players_reaped: int = 0  # всего удалено игроков
+        self.last_games_reaped: int = 0
+        self.last_duration_ms: float = 0.0
+        self.reaped_total = metrics.counter("sigame_expiry_reaped_total", "Удалено очисткой устаревших игр",
+                                            ("kind",))
+        self.sweep_seconds = metrics.histogram("sigame_expiry_sweep_seconds", "Длительность прохода очистки",
+                                               buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.2, 0.5, 1.0, 2.5))
+        # endregion
+
+        self._retire: Optional[Retire] = None
+        self._release: Optional[Release] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, retire: Retire, release: Release):
+        """
+        :param retire: Убирает игры из памяти и освобождает их паки, живые игры не отдает на удаление
+        :param release: Возвращает коды удаленных игр
+        """
+        self._retire = retire
+        self._release = release
+        self._task = asyncio.create_task(self.__loop())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    async def __loop(self):
+        while True:  # первый проход сразу: убираем то, что устарело, пока сервер был выключен
+            try:
+                await self.sweep()
+            except Exception as e:
+                print(f"Ошибка удаления старых игр: {e}")
+            await asyncio.sleep(settings["expiry_sweep_interval"])
+
+    async def sweep(self) -> int:
+        """
+        Один проход с ограничением по времени
+        :return: Сколько игр удалено
+        """
+        started = time.perf_counter()
+        budget = settings["expiry_sweep_budget_ms"] / 1000
+        batch = settings["expiry_sweep_batch"]
+        cutoff = expiry_cutoff()
+
+        games_reaped = players_reaped = 0
+        skipped: Set[int] = set()  # живые игры, их не трогаем
+        while time.perf_counter() - started < budget:
+            async with session_scope() as session:
+                # {id игры: код}
+                expired = dict((await session.execute(
+                    select(Game.id, Game.code).where(Game.time_created < cutoff, Game.id.notin_(skipped))
+                    .order_by(Game.id).limit(batch))).all())
+            if not expired:
+                break
+
+            game_ids = await self._retire(list(expired))
+            skipped.update(set(expired) - set(game_ids))
+            if game_ids:
+                await registry.flush()  # запись из журнала реестра не должна вернуть удаленную игру
+                async with session_scope() as session:
+                    players_reaped += (await session.execute(
+                        delete(Player).where(Player.game_id.in_(game_ids)))).rowcount
+                    games_reaped += (await session.execute(delete(Game).where(Game.id.in_(game_ids)))).rowcount
+                await self._release([expired[game_id] for game_id in game_ids])
+
+            if len(expired) < batch:
+                break
+
+        self.runs += 1
+        self.games_reaped += games_reaped
+        self.players_reaped += players_reaped
+        self.last_games_reaped = games_reaped
+        self.last_duration_ms = (time.perf_counter() - started) * 1000
+        self.reaped_total.inc(games_reaped, kind="games")
+        self.reaped_total.inc(players_reaped, kind="players")
+        self.sweep_seconds.observe(self.last_duration_ms / 1000)
+        if games_reaped:
+            print(f"старых игр удалено: {games_reaped}, игроков: {players_reaped}, "
+                  f"за {self.last_duration_ms:.1f} мс")
+        return games_reaped
+
+
+# Очистка для всего приложения
+expiry_sweeper = ExpirySweeper()
@@ -0,0 +1,75 @@
+# Актор игры: одна задача обрабатывает все события комнаты по очереди
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from Settings import settings
+
+# Обработчик события: выполняется в задаче актора
+Handler = Callable[[], Awaitable[Any]]
+
+
+class ActorStopped(Exception):
+    """
+    Актор остановлен раньше, чем обработал событие: игру удалили
+    """
+
+
+class GameActor:
+    """
+    Владеет изменениями одной игры: события кладутся в ограниченный inbox
+    и выполняются строго по одному, поэтому обработчикам не нужны блокировки.
+    Разные игры не ждут друг друга.
+    """
+
+    def __init__(self, game_id: int, inbox_size: int = None):
+        self.game_id: int = game_id
+        # [(обработчик, future для ответа или None), ]
+        self.inbox: "asyncio.Queue[Tuple[Handler, Optional[asyncio.Future]]]" = asyncio.Queue(
+            inbox_size or settings["game_inbox_size"])
+        self._task: asyncio.Task = asyncio.create_task(self.__run())
+
+    async def tell(self, handler: Handler):
+        """
+        Ставит событие в очередь, не дожидаясь обработки.
+        Если inbox полон, ждет место - чтение сокета отправителя притормаживает.
+        """
+        await self.inbox.put((handler, None))
+
+    async def ask(self, handler: Handler) -> Any:
+        """
+        Ставит событие в очередь и ждет его результат
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.inbox.put((handler, future))
+        return await future
+
+    async def __run(self):
+        while True:
+            handler, future = await self.inbox.get()
+            try:
+                result = await handler()
+                if future is not None and not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                # stop() во время обработки: тот, кто ждет ответ в ask(), не должен висеть
+                if future is not None and not future.done():
+                    future.set_exception(ActorStopped(self.game_id))
+                raise
+            except Exception as e:
+                if future is not None and not future.done():
+                    future.set_exception(e)
+                else:
+                    print(f"Ошибка события игры {self.game_id}: {e}")
+            finally:
+                self.inbox.task_done()
+
+    def stop(self):
+        """
+        Останавливает актор, необработанные события отбрасываются,
+        ожидающие ответа получают ActorStopped
+        """
+        self._task.cancel()
+        while not self.inbox.empty():
+            _, future = self.inbox.get_nowait()
+            if future is not None and not future.done():
+                future.set_exception(ActorStopped(self.game_id))
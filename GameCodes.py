@@ -0,0 +1,84 @@
+# Выдача кодов игр без совпадений
+import array
+import asyncio
+import random
+from collections import deque
+from typing import Awaitable, Callable, Deque, Iterable, Optional, Set
+
+from Settings import settings
+
+# Проверка кода у других воркеров: занимает код и говорит, удалось ли
+Claim = Callable[[str], Awaitable[bool]]
+
+
+def shuffled_pool() -> array.array:
+    """
+    Все коды от game_code_min до game_code_max в случайном порядке, 4 байта на код.
+    Порядок нельзя угадать по соседним кодам, поэтому в чужую игру не попасть перебором подряд.
+    """
+    pool = array.array("I", range(settings["game_code_min"], settings["game_code_max"] + 1))
+    random.Random().shuffle(pool)  # зерно из os.urandom
+    return pool
+
+
+class CodeAllocator:
+    """
+    Коды из заранее перемешанного пула: выдача и возврат за O(1).
+    Сначала выдаются коды, которых еще не было, возвращенные после удаления игр
+    идут следом, поэтому старый код не сразу ведет в новую игру.
+    """
+
+    def __init__(self):
+        self._pool: Optional[array.array] = None
+        self._shuffling: Optional[asyncio.Task] = None
+        self._cursor: int = 0  # следующий невыданный код пула
+        self._free: Deque[str] = deque()  # коды удаленных игр
+        self._in_use: Set[str] = set()
+
+    def load(self, used_codes: Iterable[str]):
+        """
+        Запускает перемешивание пула в потоке, вызывается при старте.
+        Прогрев его не ждет, ждет только первая выдача кода.
+        :param used_codes: Коды игр, которые есть в БД
+        """
+        self._in_use = set(used_codes)
+        self._cursor = 0
+        self._free.clear()
+        self._shuffling = asyncio.create_task(asyncio.to_thread(shuffled_pool))
+
+    def __next(self) -> str:
+        if self._cursor >= len(self._pool) and not self._free:
+            self._cursor = 0  # второй круг: коды, которые пропустили, пока они были заняты
+        if self._cursor < len(self._pool):
+            self._cursor += 1
+            return str(self._pool[self._cursor - 1])
+        return self._free.popleft()
+
+    async def allocate(self, claim: Claim = None) -> str:
+        """
+        :param claim: Занимает код в общем состоянии воркеров
+        :return: Код, которого нет ни у одной живой игры
+        """
+        if self._pool is None:
+            self._pool = await self._shuffling
+        for _ in range(len(self._pool) + len(self._free)):
+            code = self.__next()
+            if code in self._in_use:
+                continue
+            if claim is not None and not await claim(code):  # код выдал другой воркер
+                continue
+            self._in_use.add(code)
+            return code
+        raise RuntimeError("свободных кодов игр нет")
+
+    def release(self, code: str):
+        """
+        Игра удалена из БД, код можно выдать снова
+        """
+        if code in self._in_use:
+            self._in_use.remove(code)
+            self._free.append(code)
+
+
+# Коды игр для всего приложения
+code_allocator = CodeAllocator()
@@ -0,0 +1,361 @@
+# Реестр живых игр и игроков в памяти
+import asyncio
+from datetime import datetime
+from typing import Dict, Tuple, List, Optional, Callable, Awaitable
+
+from sqlalchemy import select, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from Metrics import metrics
+from Settings import settings
+from models import session_scope, Game, Player
+
+# Операция записи: получает сессию, коммит делает журнал
+WriteOperation = Callable[[AsyncSession], Awaitable[None]]
+
+
+def _columns(obj) -> dict:
+    """
+    Снимок значений колонок ORM объекта (без связей)
+    :param obj: Game или Player
+    :return: {имя_колонки: значение}
+    """
+    return {column.key: getattr(obj, column.key) for column in obj.__table__.columns}
+
+
+class GameRegistry:
+    """
+    Авторитетное хранилище активных игр и игроков.
+    Все поиски идут по словарям за O(1), в БД изменения пишутся в фоне:
+    операции копятся в журнале и уходят пачкой в одной транзакции
+    раз в journal_flush_ms или по набору journal_batch_size, поэтому обработчики не ждут commit.
+    """
+
+    def __init__(self):
+
+        # region индексы
+        # {game_id: Game}
+        self.games: Dict[int, Game] = {}
+        # {code: Game}
+        self.games_by_code: Dict[str, Game] = {}
+        # {user_GUID: Player}
+        self.players: Dict[str, Player] = {}
+        # {(game_id, name): Player}
+        self.players_by_name: Dict[Tuple[int, str], Player] = {}
+        # {game_id: {user_GUID: Player}}
+        self.players_by_game: Dict[int, Dict[str, Player]] = {}
+        # endregion
+
+        self._next_game_id: int = 1
+        self._next_player_id: int = 1
+
+        # region журнал записи
+        # одна задача-писатель - запись идет строго в порядке изменений
+        self._journal: List[WriteOperation] = []
+        # Несохраненные снимки в журнале {(модель, id): индекс в журнале}, новый снимок заменяет старый
+        self._merges: Dict[Tuple[str, int], int] = {}
+        self._has_data: Optional[asyncio.Event] = None
+        self._full: Optional[asyncio.Event] = None  # набралась пачка или нужна запись прямо сейчас
+        self._idle: Optional[asyncio.Event] = None  # журнал пуст и ничего не пишется
+        self._writer: Optional[asyncio.Task] = None
+        self.batches: int = 0
+        self.batch_ops = metrics.histogram("sigame_journal_batch_ops", "Операций реестра в одной транзакции",
+                                           buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500))
+        metrics.gauge("sigame_journal_pending", "Операции реестра, ждущие записи в БД",
+                      collect=lambda: {(): len(self._journal)})
+        # endregion
+
+    # region загрузка
+    async def load(self, since: datetime = None):
+        """
+        Заполняет реестр из БД и запускает запись, вызывается один раз при старте
+        :param since: Загружать только игры, созданные после этого времени (устаревшие удалит очистка)
+        :return:
+        """
+        games_query = select(Game)
+        if since is not None:
+            games_query = games_query.where(Game.time_created >= since)
+
+        async with session_scope() as session:
+            games = (await session.execute(games_query)).scalars().all()
+            players = (await session.execute(
+                select(Player).where(Player.game_id.in_(games_query.with_only_columns(Game.id))))).scalars().all()
+            last_game_id = (await session.execute(select(func.max(Game.id)))).scalar() or 0
+            last_player_id = (await session.execute(select(func.max(Player.id)))).scalar() or 0
+        # после закрытия сессии объекты живут только в памяти
+
+        for game in games:
+            self.__index_game(game)
+        for player in players:
+            if player.game_id in self.games:
+                self.__index_player(player)
+
+        self._next_game_id = last_game_id + 1
+        self._next_player_id = last_player_id + 1
+
+        self._has_data = asyncio.Event()
+        self._full = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._writer = asyncio.create_task(self.__write_loop())
+    # endregion
+
+    # region индексация
+    def __index_game(self, game: Game):
+        self.games[game.id] = game
+        self.games_by_code[game.code] = game
+        self.players_by_game.setdefault(game.id, {})
+
+    def __index_player(self, player: Player):
+        self.players[player.GUID] = player
+        self.players_by_game.setdefault(player.game_id, {})[player.GUID] = player
+        if player.name:
+            self.players_by_name[(player.game_id, player.name)] = player
+    # endregion
+
+    # region игры
+    def create_game(self, code: str, game_id: int = None) -> Game:
+        """
+        Создает игру в памяти и ставит ее запись в журнал БД
+        :param code: Код игры
+        :param game_id: id из общего счетчика воркеров, иначе назначается здесь
+        :return: Game с уже назначенным id
+        """
+        if game_id is None:
+            game_id = self._next_game_id
+        self._next_game_id = max(self._next_game_id, game_id + 1)
+        game = Game(id=game_id, code=code, now_round=0, time_created=datetime.now())
+
+        self.__index_game(game)
+        self.__write_merge(game)
+        return game
+
+    def get_game(self, game_id: int) -> Optional[Game]:
+        return self.games.get(game_id)
+
+    def get_game_by_code(self, code: str) -> Optional[Game]:
+        return self.games_by_code.get(code)
+
+    async def fetch_game(self, game_id: int, refresh: bool = False) -> Optional[Game]:
+        """
+        Игра из памяти, а если ее создал другой воркер - из БД
+        :param game_id:
+        :param refresh: Перечитать из БД, даже если игра есть в памяти
+        :return:
+        """
+        if game_id in self.games and not refresh:
+            return self.games[game_id]
+        await self.flush()  # иначе прочитаем строку без изменений, которые еще ждут в журнале
+        async with session_scope() as session:
+            game = (await session.execute(select(Game).where(Game.id == game_id))).scalars().first()
+        return self.__adopt_game(game)
+
+    async def fetch_game_by_code(self, code: str) -> Optional[Game]:
+        if code in self.games_by_code:
+            return self.games_by_code[code]
+        async with session_scope() as session:
+            game = (await session.execute(select(Game).where(Game.code == code))).scalars().first()
+        return self.__adopt_game(game)
+
+    def __adopt_game(self, game: Optional[Game]) -> Optional[Game]:
+        """
+        Кладет в реестр игру, прочитанную из БД, вместо старой копии
+        """
+        if game is None:
+            return None
+        old = self.games.get(game.id)
+        if old is not None and self.games_by_code.get(old.code) is old:
+            del self.games_by_code[old.code]
+        self.__index_game(game)
+        return game
+
+    def forget_game(self, game_id: int) -> Optional[Game]:
+        """
+        Убирает игру и ее игроков только из памяти (игру удалил другой воркер)
+        :param game_id:
+        :return: Убранная игра
+        """
+        game = self.games.pop(game_id, None)
+        if game is None:
+            return None
+
+        if self.games_by_code.get(game.code) is game:
+            del self.games_by_code[game.code]
+
+        for player in self.players_by_game.pop(game_id, {}).values():
+            self.players.pop(player.GUID, None)
+            if player.name:
+                self.players_by_name.pop((game_id, player.name), None)
+        return game
+
+    def update_game(self, game: Game):
+        """
+        Сохраняет изменения игры (настройки, пак, раунд)
+        :param game:
+        :return:
+        """
+        self.__write_merge(game)
+
+    def remove_game(self, game_id: int) -> Optional[Game]:
+        """
+        Удаляет игру и всех ее игроков из памяти и из БД
+        :param game_id:
+        :return: Удаленная игра
+        """
+        game = self.forget_game(game_id)
+        if game is None:
+            return None
+
+        self.delete_games([game_id])
+        return game
+
+    def delete_games(self, game_ids: List[int]):
+        """
+        Ставит в журнал удаление игр и их игроков из БД одним запросом на таблицу
+        :param game_ids:
+        :return:
+        """
+        if not game_ids:
+            return
+
+        async def delete_games(session: AsyncSession):
+            await session.execute(delete(Player).where(Player.game_id.in_(game_ids)))
+            await session.execute(delete(Game).where(Game.id.in_(game_ids)))
+
+        self.__write(delete_games)
+    # endregion
+
+    # region игроки
+    def add_player(self, player: Player, player_id: int = None) -> Player:
+        """
+        Регистрирует игрока, id назначается сразу
+        :param player:
+        :param player_id: id из общего счетчика воркеров, иначе назначается здесь
+        :return:
+        """
+        if player_id is None:
+            player_id = self._next_player_id
+        self._next_player_id = max(self._next_player_id, player_id + 1)
+        player.id = player_id
+        if player.is_leader is None:
+            player.is_leader = False
+        if player.is_screen is None:
+            player.is_screen = False
+
+        self.__index_player(player)
+        self.__write_merge(player)
+        return player
+
+    def get_player(self, user_GUID: str) -> Optional[Player]:
+        return self.players.get(user_GUID)
+
+    async def fetch_player(self, user_GUID: str) -> Optional[Player]:
+        """
+        Игрок из памяти, а если его создал другой воркер - из БД вместе с игрой
+        :param user_GUID:
+        :return:
+        """
+        if user_GUID in self.players:
+            return self.players[user_GUID]
+        async with session_scope() as session:
+            player = (await session.execute(select(Player).where(Player.GUID == user_GUID))).scalars().first()
+        if player is None or await self.fetch_game(player.game_id) is None:
+            return None
+        self.__index_player(player)
+        return player
+
+    def last_ids(self) -> Dict[str, int]:
+        """
+        Последние выданные id, для общего счетчика воркеров
+        """
+        return {"game": self._next_game_id - 1, "player": self._next_player_id - 1}
+
+    def find_player_by_name(self, game_id: int, name: str) -> Optional[Player]:
+        return self.players_by_name.get((game_id, name))
+
+    def get_players(self, game_id: int) -> List[Player]:
+        return list(self.players_by_game.get(game_id, {}).values())
+    # endregion
+
+    # region запись в БД
+    def __write_merge(self, obj):
+        """
+        Ставит в журнал сохранение снимка объекта
+        """
+        model = type(obj)
+        values = _columns(obj)  # снимок берем сейчас, пока объект не изменили
+
+        async def merge(session: AsyncSession):
+            await session.merge(model(**values))
+
+        self.__write(merge, (model.__name__, values["id"]))
+
+    def __write(self, operation: WriteOperation, key: Tuple[str, int] = None):
+        """
+        Добавляет операцию в журнал, не дожидаясь ее выполнения
+        :param key: (модель, id) для сохранения снимка: несохраненный снимок того же объекта заменяется
+        """
+        if key is not None and key in self._merges:
+            self._journal[self._merges[key]] = operation
+            return
+
+        if key is not None:
+            self._merges[key] = len(self._journal)
+        else:
+            self._merges.clear()  # снимки до удаления нельзя заменять снимками после него
+        self._journal.append(operation)
+        self._idle.clear()
+        self._has_data.set()
+        if len(self._journal) >= settings["journal_batch_size"]:
+            self._full.set()
+
+    async def __write_loop(self):
+        while True:
+            await self._has_data.wait()
+            try:  # ждем, пока наберется пачка, но не дольше journal_flush_ms
+                await asyncio.wait_for(self._full.wait(), settings["journal_flush_ms"] / 1000)
+            except asyncio.TimeoutError:
+                pass
+
+            batch, self._journal, self._merges = self._journal, [], {}
+            self._has_data.clear()
+            self._full.clear()
+            await self.__commit(batch)
+            if not self._journal:
+                self._idle.set()
+
+    async def __commit(self, batch: List[WriteOperation]):
+        """
+        Пишет пачку одной транзакцией, при ошибке - по одной операции, чтобы не потерять остальные
+        """
+        self.batches += 1
+        self.batch_ops.observe(len(batch))
+        try:
+            async with session_scope() as session:
+                for operation in batch:
+                    await operation(session)
+                    await session.flush()  # удаление запросом должно видеть снимки, записанные до него
+            return
+        except Exception as e:
+            print(f"Ошибка записи пачки реестра в БД, пишем по одной: {e}")
+
+        for operation in batch:
+            try:
+                async with session_scope() as session:
+                    await operation(session)
+            except Exception as e:
+                print(f"Ошибка записи реестра в БД: {e}")
+
+    async def flush(self):
+        """
+        Записывает журнал сразу, не дожидаясь интервала. Вызывается при остановке
+        и перед чтением из БД, которое должно видеть последние изменения.
+        """
+        if self._idle is not None and not self._idle.is_set():
+            self._full.set()
+            await self._idle.wait()
+    # endregion
+
+
+# Реестр для всего приложения
+registry = GameRegistry()
@@ -0,0 +1,87 @@
+# Склейка событий лобби (готовность, подключения) в одно сообщение за такт
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from Settings import settings
+
+# Отправка на экран и ведущего: (сообщение) -> None
+Cast = Callable[[dict], Awaitable[None]]
+
+
+class LobbyBatch:
+    """
+    Копит изменения лобби одной игры и раз в lobby_tick_ms отправляет экрану и ведущему
+    одно сообщение lobby_update только с тем, что изменилось.
+    Если игрок за такт нажал "готов" и "не готов", уйдет только последнее состояние.
+    """
+
+    def __init__(self, game_id: int, cast: Cast, tick_ms: float = None):
+        self.game_id: int = game_id
+        self._cast: Cast = cast
+        self.tick: float = (tick_ms if tick_ms is not None else settings["lobby_tick_ms"]) / 1000
+
+        # {user_GUID: готов ли}
+        self._ready: Dict[str, bool] = {}
+        # {user_GUID: {"user_GUID", "user_name", "user_ready"}}
+        self._connected: Dict[str, dict] = {}
+        self._disconnected: Set[str] = set()
+
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def player_ready(self, user_GUID: str, is_ready: bool):
+        if user_GUID in self._connected:  # о подключении еще не сообщили, правим его
+            self._connected[user_GUID]["user_ready"] = is_ready
+        else:
+            self._ready[user_GUID] = is_ready
+        self.__schedule()
+
+    def player_connected(self, user_GUID: str, user_name: str, user_ready: bool):
+        self._disconnected.discard(user_GUID)
+        self._ready.pop(user_GUID, None)
+        self._connected[user_GUID] = {"user_GUID": user_GUID, "user_name": user_name, "user_ready": user_ready}
+        self.__schedule()
+
+    def player_disconnected(self, user_GUID: str):
+        self._connected.pop(user_GUID, None)
+        self._ready.pop(user_GUID, None)
+        self._disconnected.add(user_GUID)
+        self.__schedule()
+
+    def __schedule(self):
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.tick, lambda: asyncio.create_task(self.flush()))
+
+    async def flush(self):
+        """
+        Отправляет накопленное сразу, например перед началом игры
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        update = {"event": "lobby_update"}
+        if self._connected:
+            update["connected"] = list(self._connected.values())
+        if self._disconnected:
+            update["disconnected"] = list(self._disconnected)
+        ready = [user_GUID for user_GUID, is_ready in self._ready.items() if is_ready]
+        unready = [user_GUID for user_GUID, is_ready in self._ready.items() if not is_ready]
+        if ready:
+            update["ready"] = ready
+        if unready:
+            update["unready"] = unready
+
+        self._connected, self._disconnected, self._ready = {}, set(), {}
+        if len(update) == 1:
+            return
+
+        try:
+            await self._cast(update)
+        except Exception as e:
+            print(f"Ошибка отправки лобби игры {self.game_id}: {e}")
+
+    def stop(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -0,0 +1,348 @@
+# Отдача медиа файлов паков (Audio, Images, Video)
+import asyncio
+import hashlib
+import mimetypes
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Union, Tuple
+from urllib.parse import quote
+
+from sqlalchemy import select
+from starlette.responses import Response, StreamingResponse, JSONResponse
+from starlette.types import Scope, Receive, Send
+
+from PackageModel import package_cache, CompiledPackage, Round
+from Settings import settings
+from ZipMedia import ZipMedia, MediaEntry
+from models import session_scope, Package
+
+# Источник медиа пака: индекс архива или папка распакованного пака
+MediaSource = Union[ZipMedia, str]
+
+# Файлы пака не меняются: пак хранится по хэшу архива
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Сколько читаем за раз, если сервер не умеет sendfile
+READ_CHUNK_SIZE = 256 * 1024
+
+
+class MediaFile:
+    """
+    Где лежит файл пака: файл на диске со смещением (обычный файл или несжатый член архива)
+    либо сжатый член архива
+    """
+    __slots__ = ("path", "offset", "size", "etag", "media_type", "zip_media", "entry", "sha256")
+
+    def __init__(self, path: Optional[str], offset: int, size: int, etag: str, media_type: str,
+                 zip_media: ZipMedia = None, entry: MediaEntry = None, sha256: str = ""):
+        self.path: Optional[str] = path
+        self.offset: int = offset
+        self.size: int = size
+        self.etag: str = etag
+        self.media_type: str = media_type
+        self.zip_media: Optional[ZipMedia] = zip_media
+        self.entry: Optional[MediaEntry] = entry
+        self.sha256: str = sha256  # считается при разборе пака или при первом запросе манифеста
+
+    @property
+    def compressed(self) -> bool:
+        return self.path is None
+
+    def compute_sha256(self) -> str:
+        """
+        Хэш содержимого, читает файл целиком, вызывается в потоке
+        """
+        hasher = hashlib.sha256()
+        if self.compressed:
+            for chunk in self.zip_media.iter_range(self.entry):
+                hasher.update(chunk)
+        else:
+            with open(self.path, "rb") as f:
+                position, end = self.offset, self.offset + self.size
+                while position < end:
+                    chunk = os.pread(f.fileno(), min(READ_CHUNK_SIZE, end - position), position)
+                    if not chunk:
+                        break
+                    position += len(chunk)
+                    hasher.update(chunk)
+        return hasher.hexdigest()
+
+
+class FileRangeResponse(Response):
+    """
+    Отдает count байт файла начиная с offset.
+    Если сервер поддерживает расширение http.response.zerocopysend, данные идут через sendfile.
+    """
+
+    def __init__(self, path: str, offset: int, count: int, status_code: int, headers: dict, media_type: str):
+        super().__init__(status_code=status_code, headers=headers, media_type=media_type)
+        self.path: str = path
+        self.offset: int = offset
+        self.count: int = count
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+
+        with open(self.path, "rb") as f:
+            if "http.response.zerocopysend" in scope.get("extensions", {}):
+                await send({"type": "http.response.zerocopysend", "file": f,
+                            "offset": self.offset, "count": self.count, "more_body": False})
+                return
+
+            position, end = self.offset, self.offset + self.count
+            while position < end:
+                chunk = await asyncio.to_thread(os.pread, f.fileno(), min(READ_CHUNK_SIZE, end - position), position)
+                if not chunk:
+                    break
+                position += len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": position < end})
+        if position < end or self.count == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+class HotCache:
+    """
+    LRU кэш небольших файлов в памяти, ограниченный по объему
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes: int = max_bytes
+        self.used_bytes: int = 0
+        self._entries: "OrderedDict[Tuple[int, str], bytes]" = OrderedDict()
+
+    def get(self, key: Tuple[int, str]) -> Optional[bytes]:
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        return data
+
+    def put(self, key: Tuple[int, str], data: bytes):
+        if key in self._entries:
+            return
+        self._entries[key] = data
+        self.used_bytes += len(data)
+        while self.used_bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self.used_bytes -= len(evicted)
+
+    def invalidate(self, package_id: int):
+        for key in [key for key in self._entries if key[0] == package_id]:
+            self.used_bytes -= len(self._entries.pop(key))
+
+
+def parse_range(header: Optional[str], size: int) -> Union[Tuple[int, int], None, bool]:
+    """
+    Разбирает заголовок Range с одним диапазоном
+    :param header: Например bytes=0-1023, bytes=1000- или bytes=-500
+    :param size: Размер файла
+    :return: (start, end) с end не включительно; None - отдать файл целиком; False - диапазон вне файла
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None  # несколько диапазонов не поддерживаем, отдаем файл целиком
+    first, _, last = header[len("bytes="):].strip().partition("-")
+    try:
+        if first == "":  # последние N байт
+            length = int(last)
+            if length <= 0:
+                return False
+            return max(size - length, 0), size
+        start = int(first)
+        end = int(last) + 1 if last else size
+    except ValueError:
+        return None
+    if start >= size or end <= start:
+        return False
+    return start, min(end, size)
+
+
+class MediaLibrary:
+    """
+    Находит файл пака по имени из content.xml и отдает его
+    из архива (без распаковки) или из папки распакованного пака.
+    Поддерживает Range, ETag и держит мелкие файлы в памяти.
+    """
+
+    def __init__(self):
+        # {package_id: MediaSource}
+        self._sources: Dict[int, MediaSource] = {}
+        # {(package_id, ref): MediaFile}
+        self._files: Dict[Tuple[int, str], MediaFile] = {}
+        self.hot_cache = HotCache(settings["media_hot_cache_bytes"])
+        # одно чтение файла с диска, даже если его запросила вся комната
+        self._loading: Dict[Tuple[int, str], asyncio.Future] = {}
+        # {(package_id, номер раунда): манифест предзагрузки}
+        self._manifests: Dict[Tuple[int, int], List[dict]] = {}
+
+    async def source(self, package_id: int) -> Optional[MediaSource]:
+        if package_id in self._sources:
+            return self._sources[package_id]
+
+        async with session_scope() as session:  # тяжелый content не читаем
+            directory = (await session.execute(
+                select(Package.templates_pack).where(Package.id == package_id))).scalar()
+        if directory is None:
+            return None
+
+        if ZipMedia.is_zip_package(directory):
+            source: MediaSource = await asyncio.to_thread(ZipMedia, directory)
+        else:
+            source = directory
+        self._sources[package_id] = source
+        return source
+
+    def invalidate(self, package_id: int):
+        source = self._sources.pop(package_id, None)
+        if isinstance(source, ZipMedia):
+            source.close()
+        for key in [key for key in self._files if key[0] == package_id]:
+            del self._files[key]
+        for key in [key for key in self._manifests if key[0] == package_id]:
+            del self._manifests[key]
+        self.hot_cache.invalidate(package_id)
+
+    async def resolve(self, package_id: int, ref: str) -> Optional[MediaFile]:
+        """
+        Находит файл пака, результат запоминается
+        :param package_id: id пака
+        :param ref: Имя файла, как в content.xml
+        :return:
+        """
+        key = (package_id, ref)
+        if key in self._files:
+            return self._files[key]
+
+        package: CompiledPackage = await package_cache.get(package_id)
+        item = package.media.get(ref) if package is not None else None
+        source = await self.source(package_id) if item is not None else None
+        if source is None:
+            return None
+
+        media_type = mimetypes.guess_type(ref)[0] or "application/octet-stream"
+
+        if isinstance(source, ZipMedia):
+            entry = source.get(item.path)
+            if entry is None:
+                return None
+            etag = f'"{package.content_hash[:16]}-{entry.crc:08x}-{entry.size:x}"'
+            if entry.stored:
+                media = MediaFile(source.zip_path, entry.offset, entry.size, etag, media_type, sha256=entry.sha256)
+            else:
+                media = MediaFile(None, 0, entry.size, etag, media_type, source, entry, entry.sha256)
+        else:
+            path = os.path.join(source, item.path)
+            if not os.path.isfile(path):
+                return None
+            stat = os.stat(path)
+            media = MediaFile(path, 0, stat.st_size, f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"', media_type)
+
+        self._files[key] = media
+        return media
+
+    async def manifest(self, package_id: int, round_index: int) -> List[dict]:
+        """
+        Манифест предзагрузки раунда: что клиенту скачать в фоне до показа вопросов.
+        Собирается один раз на пак и раунд.
+        :param package_id: id пака
+        :param round_index: Номер раунда
+        :return: [{"ref", "url", "size", "sha256", "type"}, ] в порядке игры
+        """
+        key = (package_id, round_index)
+        if key in self._manifests:
+            return self._manifests[key]
+
+        package: CompiledPackage = await package_cache.get(package_id)
+        round_: Optional[Round] = package.get_round(round_index) if package is not None else None
+        if round_ is None:
+            return []
+
+        manifest = []
+        for item in round_.media_items():
+            media = await self.resolve(package_id, item.value)
+            if media is None:  # файла нет в паке, клиент получит 404 при показе вопроса
+                continue
+            if not media.sha256:
+                media.sha256 = await asyncio.to_thread(media.compute_sha256)
+            manifest.append({"ref": item.value, "url": f"/media/{package_id}/{quote(item.value, safe='')}",
+                             "size": media.size, "sha256": media.sha256, "type": media.media_type})
+
+        self._manifests[key] = manifest
+        return manifest
+
+    async def __load(self, key: Tuple[int, str], media: MediaFile) -> bytes:
+        """
+        Читает небольшой файл целиком и кладет в кэш
+        """
+        if key in self._loading:
+            return await self._loading[key]
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            if media.compressed:
+                data = await asyncio.to_thread(lambda: b"".join(media.zip_media.iter_range(media.entry)))
+            else:
+                def read() -> bytes:
+                    with open(media.path, "rb") as f:
+                        return os.pread(f.fileno(), media.size, media.offset)
+                data = await asyncio.to_thread(read)
+            self.hot_cache.put(key, data)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # ошибку получит вызвавший, ждущих может и не быть
+            raise
+        finally:
+            if not future.done():  # первый запрос отменен: ждущие не должны висеть
+                future.cancel()
+            del self._loading[key]
+
+    async def response(self, package_id: int, ref: str, range_header: Optional[str] = None,
+                       if_none_match: Optional[str] = None) -> Response:
+        """
+        Ответ с файлом пака
+        :param package_id: id пака
+        :param ref: Имя файла, как в content.xml
+        :param range_header: Заголовок Range
+        :param if_none_match: Заголовок If-None-Match
+        :return:
+        """
+        media = await self.resolve(package_id, ref)
+        if media is None:
+            return JSONResponse(content={"error": "media_not_found"}, status_code=404)
+
+        headers = {"ETag": media.etag, "Cache-Control": CACHE_CONTROL, "Accept-Ranges": "bytes"}
+
+        if if_none_match is not None and media.etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        byte_range = parse_range(range_header, media.size)
+        if byte_range is False:
+            headers["Content-Range"] = f"bytes */{media.size}"
+            return Response(status_code=416, headers=headers)
+
+        status_code = 200
+        start, end = 0, media.size
+        if byte_range is not None:
+            start, end = byte_range
+            status_code = 206
+            headers["Content-Range"] = f"bytes {start}-{end - 1}/{media.size}"
+
+        key = (package_id, ref)
+        data = self.hot_cache.get(key)
+        if data is None and media.size <= settings["media_hot_cache_item_bytes"]:
+            data = await self.__load(key, media)
+        if data is not None:
+            return Response(content=data[start:end], status_code=status_code, headers=headers,
+                            media_type=media.media_type)
+
+        headers["Content-Length"] = str(end - start)
+        if media.compressed:
+            return StreamingResponse(media.zip_media.iter_range(media.entry, start, end), status_code=status_code,
+                                     headers=headers, media_type=media.media_type)
+        return FileRangeResponse(media.path, media.offset + start, end - start, status_code, headers,
+                                 media.media_type)
+
+
+# Медиа паков для всего приложения
+media_library = MediaLibrary()
@@ -0,0 +1,198 @@
+# Метрики в текстовом формате Prometheus, без внешних зависимостей
+import asyncio
+import bisect
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from Settings import settings
+
+# Границы гистограмм по умолчанию, в секундах
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Значения метрики, которые считаются при сборе: {(значения меток, ): число}
+Collect = Callable[[], Dict[Tuple[str, ...], float]]
+
+
+def escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()):
+        self.name: str = name
+        self.help: str = help_text
+        self.labels: Tuple[str, ...] = labels
+
+    def key(self, labels: dict) -> Tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def samples(self) -> List[str]:
+        return []
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()):
+        super().__init__(name, help_text, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self.key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> List[str]:
+        return [f"{self.name}{format_labels(self.labels, key)} {format_value(value)}"
+                for key, value in self._values.items()]
+
+
+class Gauge(Metric):
+    """
+    Текущее значение: задается через set() или считается при сборе функцией collect
+    """
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = (), collect: Collect = None):
+        super().__init__(name, help_text, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self.collect: Optional[Collect] = collect
+
+    def set(self, value: float, **labels):
+        self._values[self.key(labels)] = value
+
+    def samples(self) -> List[str]:
+        values = self.collect() if self.collect is not None else self._values
+        return [f"{self.name}{format_labels(self.labels, key)} {format_value(value)}"
+                for key, value in values.items()]
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = (), buckets: Tuple[float, ...] = None):
+        super().__init__(name, help_text, labels)
+        self.buckets: Tuple[float, ...] = tuple(buckets or DEFAULT_BUCKETS)
+        # {(значения меток, ): [счетчики по границам, сумма, количество]}
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self.key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            state[0][index] += 1
+        state[1] += value
+        state[2] += 1
+
+    def samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total, count) in self._values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = 'le="' + format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{format_labels(self.labels, key, le)} {cumulative}")
+            le = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{format_labels(self.labels, key, le)} {count}")
+            lines.append(f"{self.name}_sum{format_labels(self.labels, key)} {format_value(total)}")
+            lines.append(f"{self.name}_count{format_labels(self.labels, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Все метрики процесса, отдаются эндпоинтом /metrics
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: Tuple[str, ...] = (), collect: Collect = None) -> Gauge:
+        return self.register(Gauge(name, help_text, labels, collect))
+
+    def histogram(self, name: str, help_text: str, labels: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = None) -> Histogram:
+        return self.register(Histogram(name, help_text, labels, buckets))
+
+    def render(self) -> str:
+        parts = []
+        for metric in self._metrics.values():
+            try:
+                parts.append(metric.render())
+            except Exception as e:  # сбой одной метрики не ломает остальные
+                print(f"Ошибка сбора метрики {metric.name}: {e}")
+        return "\n".join(parts) + "\n"
+
+
+# Метрики для всего приложения
+metrics = MetricsRegistry()
+
+# region метрики, которые пишутся из разных модулей
+events_total = metrics.counter("sigame_ws_events_total", "Входящие события сокетов", ("event",))
+fanout_seconds = metrics.histogram("sigame_fanout_seconds", "Нумерация, кодирование и раскладка сообщения по очередям",
+                                   ("audience",))
+db_query_seconds = metrics.histogram("sigame_db_query_seconds", "Время SQL запросов", ("statement",))
+db_commit_seconds = metrics.histogram("sigame_db_commit_seconds", "Время commit сессии")
+ingest_seconds = metrics.histogram("sigame_ingest_seconds", "Разбор загруженного пака", ("result",),
+                                   (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0))
+ingest_bytes_total = metrics.counter("sigame_ingest_bytes_total", "Размер загруженных архивов", ("result",))
+loop_lag_seconds = metrics.histogram("sigame_event_loop_lag_seconds", "Задержка цикла событий")
+# endregion
+
+
+class LoopLagMonitor:
+    """
+    Засыпает на loop_lag_interval и меряет, насколько позже проснулся: это время цикл был занят
+    """
+
+    def __init__(self):
+        self.last_lag: float = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self._task = asyncio.create_task(self.__loop())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    async def __loop(self):
+        interval = settings["loop_lag_interval"]
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(interval)
+            self.last_lag = max(0.0, time.perf_counter() - started - interval)
+            loop_lag_seconds.observe(self.last_lag)
+
+
+# Замер задержки цикла событий для всего приложения
+loop_lag_monitor = LoopLagMonitor()
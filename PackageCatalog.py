@@ -0,0 +1,150 @@
+# Каталог паков для выбора ведущим: сводки без чтения Package.content
+import asyncio
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select, delete
+
+from PackageModel import CompiledPackage, load_package, decode_content
+from Settings import settings
+from ZipMedia import INDEX_NAME, ZipMedia, load_index
+from models import session_scope, Package, PackageSummary
+
+
+def summarize(compiled: CompiledPackage, media_bytes: int) -> dict:
+    """
+    Сводка пака для каталога, считается один раз при разборе
+    :param compiled: Собранный пак
+    :param media_bytes: Размер медиа файлов пака
+    :return: Значения колонок PackageSummary без package_id
+    """
+    themes = [theme for round_ in compiled.rounds for theme in round_.themes]
+    return {"name": compiled.name, "author": compiled.author, "difficulty": compiled.difficulty,
+            "rounds": len(compiled.rounds), "themes": len(themes),
+            "questions": sum(len(theme.questions) for theme in themes), "media_bytes": media_bytes}
+
+
+def media_size(directory: str) -> int:
+    """
+    Размер медиа уже сохраненного пака: по индексу архива или по файлам папки
+    """
+    if ZipMedia.is_zip_package(directory):
+        return sum(entry.size for name, entry in load_index(os.path.join(directory, INDEX_NAME)).items()
+                   if name != "content.xml")
+    size = 0
+    for path, _, files in os.walk(directory):
+        for file_name in files:
+            if os.path.join(path, file_name) != os.path.join(directory, "content.xml"):
+                size += os.path.getsize(os.path.join(path, file_name))
+    return size
+
+
+def _summary_dict(summary: PackageSummary) -> dict:
+    return {"package_id": summary.package_id, "name": summary.name, "author": summary.author,
+            "difficulty": summary.difficulty, "rounds": summary.rounds, "themes": summary.themes,
+            "questions": summary.questions, "media_bytes": summary.media_bytes,
+            "default": bool(summary.default) or summary.package_id == settings["default_package_id"]}
+
+
+class PackageCatalog:
+    """
+    Сводки всех паков в памяти, отсортированные по имени.
+    Таблица package_catalog легкая, поэтому каталог перечитывается целиком
+    раз в catalog_refresh_seconds - так видны паки, загруженные другими воркерами.
+    """
+
+    def __init__(self):
+        # {package_id: сводка}
+        self._entries: Dict[int, dict] = {}
+        self._ordered: Optional[List[dict]] = None  # по имени, собирается при первом запросе
+        self._loaded_at: Optional[float] = None
+        self._backfill: Optional[asyncio.Task] = None
+
+    async def load(self):
+        """
+        Читает каталог и в фоне досчитывает сводки паков, загруженных до его появления
+        """
+        await self.__reload()
+        self._backfill = asyncio.create_task(self.__backfill_missing())
+
+    def stop(self):
+        if self._backfill is not None:
+            self._backfill.cancel()
+
+    async def __reload(self):
+        async with session_scope() as session:
+            summaries = (await session.execute(select(PackageSummary))).scalars().all()
+        self._entries = {summary.package_id: _summary_dict(summary) for summary in summaries}
+        self._ordered = None
+        self._loaded_at = time.monotonic()
+
+    async def __backfill_missing(self):
+        """
+        Старые паки без сводки: content каждого читается один раз, по одному
+        """
+        async with session_scope() as session:
+            missing = (await session.execute(
+                select(Package.id).where(Package.id.notin_(select(PackageSummary.package_id))))).scalars().all()
+        for package_id in missing:
+            try:
+                async with session_scope() as session:
+                    package: Package = await session.get(Package, package_id)
+                    if package is None:
+                        continue
+                    compiled = await asyncio.to_thread(load_package, decode_content(package.content), package_id)
+                    media_bytes = await asyncio.to_thread(media_size, package.templates_pack)
+                    is_default = bool(package.default) or package_id == settings["default_package_id"]
+                    summary = PackageSummary(package_id=package_id, default=is_default,
+                                             **summarize(compiled, media_bytes))
+                    session.add(summary)
+                self.add(summary)
+            except Exception as e:
+                print(f"Ошибка сводки пака {package_id}: {e}")
+
+    def add(self, summary: PackageSummary):
+        """
+        Новый пак, сводка уже записана в БД
+        """
+        self._entries[summary.package_id] = _summary_dict(summary)
+        self._ordered = None
+
+    def remove(self, package_ids: Iterable[int]):
+        for package_id in package_ids:
+            self._entries.pop(package_id, None)
+        self._ordered = None
+
+    @staticmethod
+    async def delete(session, package_ids: List[int]):
+        """
+        Удаляет сводки в сессии, которая удаляет сами паки
+        """
+        await session.execute(delete(PackageSummary).where(PackageSummary.package_id.in_(package_ids)))
+
+    async def page(self, query: str = "", offset: int = 0, limit: int = None) -> dict:
+        """
+        Страница каталога
+        :param query: Часть имени или автора, без учета регистра
+        :param offset:
+        :param limit: По умолчанию catalog_page_size, не больше catalog_max_page_size
+        :return: {"packages": [сводка, ], "total": сколько всего подходит}
+        """
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > settings["catalog_refresh_seconds"]:
+            await self.__reload()
+        if self._ordered is None:
+            self._ordered = sorted(self._entries.values(),
+                                   key=lambda entry: (not entry["default"], entry["name"].casefold()))
+
+        entries = self._ordered
+        query = query.strip().casefold()
+        if query:
+            entries = [entry for entry in entries
+                       if query in entry["name"].casefold() or query in entry["author"].casefold()]
+
+        limit = min(limit or settings["catalog_page_size"], settings["catalog_max_page_size"])
+        offset = max(offset, 0)
+        return {"packages": entries[offset:offset + limit], "total": len(entries)}
+
+
+# Каталог паков для всего приложения
+package_catalog = PackageCatalog()
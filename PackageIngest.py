@@ -0,0 +1,218 @@
+# Разбор загруженных паков в отдельных процессах
+import asyncio
+import os
+import shutil
+import time
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from GameRegistry import registry
+from Metrics import ingest_seconds, ingest_bytes_total
+from PackageCatalog import package_catalog, summarize
+from PackageStore import package_store, store_path, dedupe_tree
+from Settings import settings
+from SiqParser import parse_siq, missing_media, SiqError
+from ZipMedia import ARCHIVE_NAME, INDEX_NAME, SUPPORTED_COMPRESSION, build_index, hash_entries, save_index
+from models import session_scope, Package, PackageSummary, Player
+from my_db_func import unpack_zip_advanced
+
+
+def ingest_archive(upload_path: str, unpack_path: str, media_mode: str) -> dict:
+    """
+    Разбор content.xml прямо из архива, проверка ссылок на медиа и подготовка медиа:
+    в режиме zip архив кладется в хранилище с индексом членов, в режиме extracted
+    распаковывается, а медиа заменяются на общие blob. Выполняется в процессе пула,
+    поэтому только принимает пути и возвращает простой словарь.
+    :param upload_path: Путь к принятому архиву
+    :param unpack_path: Папка хранилища по хэшу архива
+    :param media_mode: zip или extracted
+    :return: {"content": ...} или {"error": ...}
+    """
+    try:
+        with zipfile.ZipFile(upload_path) as archive:
+            names = archive.namelist()
+            if "content.xml" not in names:
+                return {"error": "error_decryption_content"}
+
+            with archive.open("content.xml") as xml_file:  # читаем потоком, без распаковки на диск
+                compiled = parse_siq(xml_file)
+            media_bytes = sum(info.file_size for info in archive.infolist()
+                              if not info.is_dir() and info.filename != "content.xml")
+        summary = summarize(compiled, media_bytes)  # сводка для каталога, content потом не читаем
+
+        missing = missing_media(compiled, names)
+        if missing:
+            return {"error": "missing_media", "missing": missing}
+
+        if os.path.isdir(unpack_path):  # остатки прошлой загрузки без записи в БД
+            shutil.rmtree(unpack_path)
+
+        if media_mode == "zip":
+            entries = build_index(upload_path)
+            if all(entry.compress_type in SUPPORTED_COMPRESSION for entry in entries.values()):
+                hash_entries(upload_path, entries)
+                os.makedirs(unpack_path)
+                os.replace(upload_path, os.path.join(unpack_path, ARCHIVE_NAME))  # медиа читаются из архива
+                save_index(entries, os.path.join(unpack_path, INDEX_NAME))
+                return {"content": compiled.to_dict(), "summary": summary, "saved_bytes": 0}
+
+        if not unpack_zip_advanced(upload_path, unpack_path):
+            return {"error": "fail_extract_file"}
+
+        return {"content": compiled.to_dict(), "summary": summary, "saved_bytes": dedupe_tree(unpack_path)}
+    except zipfile.BadZipFile:
+        return {"error": "fail_extract_file"}
+    except SiqError as e:
+        return {"error": "error_decryption_content", "detail": str(e)}
+    finally:
+        if os.path.exists(upload_path):
+            os.remove(upload_path)  # архив больше не нужен
+
+
+class IngestPipeline:
+    """
+    Очередь разбора паков: тяжелая работа идет в ProcessPoolExecutor,
+    в цикле событий остается только запись в БД и уведомление загрузившего.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # {job_id: asyncio.Task}
+        self.jobs: Dict[str, asyncio.Task] = {}
+        # {хэш архива: future с id пака}, один архив разбирается один раз
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:  # процессы поднимаем при первой загрузке, а не при старте
+            self._executor = ProcessPoolExecutor(max_workers=settings["ingest_workers"])
+        return self._executor
+
+    def submit(self, upload_path: str, archive_hash: str, name_file: str, player: Player,
+               on_done: Callable[[dict], Awaitable[None]]) -> str:
+        """
+        Ставит архив в разбор
+        :param upload_path: Путь к принятому архиву
+        :param archive_hash: sha256 архива
+        :param name_file: Имя пака
+        :param player: Кто загрузил
+        :param on_done: Получит событие о завершении
+        :return: job_id
+        """
+        job_id = str(uuid.uuid4())
+        self.jobs[job_id] = asyncio.create_task(
+            self.__run(job_id, upload_path, archive_hash, name_file, player, on_done))
+        return job_id
+
+    async def __run(self, job_id: str, upload_path: str, archive_hash: str, name_file: str, player: Player,
+                    on_done: Callable[[dict], Awaitable[None]]):
+        try:
+            try:
+                result = await self.ingest(upload_path, archive_hash, name_file, player)
+            except Exception as e:  # упал пул процессов, БД или диск - загрузивший все равно получает ответ
+                print(f"Ошибка разбора пака {name_file}: {e}")
+                if os.path.exists(upload_path):
+                    os.remove(upload_path)
+                result = {"error": "ingest_failed"}
+            # ошибки из процесса пула приходят без event, клиент разбирает ответы по нему
+            result["event"] = "package_uploaded"
+            result["job_id"] = job_id
+            await on_done(result)
+        except Exception as e:
+            print(f"Ошибка отправки результата разбора пака {name_file}: {e}")
+        finally:
+            del self.jobs[job_id]
+
+    async def ingest(self, upload_path: str, archive_hash: str, name_file: str, player: Player) -> dict:
+        """
+        Разбирает архив в пуле, сохраняет пак и привязывает его к игре.
+        Уже известный архив сразу привязывается без распаковки и разбора.
+        :return: Ошибка или событие о загрузке
+        """
+        started = time.perf_counter()
+        size = os.path.getsize(upload_path)
+
+        package_id = await package_store.claim(archive_hash)
+        if package_id is None and archive_hash in self._in_flight:  # такой же архив уже разбирается
+            package_id = await asyncio.shield(self._in_flight[archive_hash])
+            if package_id is not None:
+                package_store.acquire(package_id)
+
+        if package_id is not None:
+            os.remove(upload_path)
+            self.__assign(player, package_id)
+            self.__observe("cached", started, size)
+            return {"event": "package_uploaded", "package_id": package_id, "cached": True,
+                    "duration": round(time.perf_counter() - started, 3)}
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[archive_hash] = future
+        package_id = None
+        try:
+            package_id, result = await self.__ingest_new(upload_path, archive_hash, name_file)
+        finally:
+            del self._in_flight[archive_hash]
+            future.set_result(package_id)  # ждущие такой же архив получат id или None
+
+        if package_id is None:
+            self.__observe("error", started, size)
+            return result
+
+        package_store.acquire(package_id)
+        self.__assign(player, package_id)
+        self.__observe("new", started, size)
+        return {"event": "package_uploaded", "package_id": package_id, "cached": False,
+                "duration": round(time.perf_counter() - started, 3)}
+
+    async def __ingest_new(self, upload_path: str, archive_hash: str, name_file: str) -> Tuple[Optional[int], dict]:
+        unpack_path = store_path(archive_hash)
+
+        loop = asyncio.get_running_loop()
+        result: dict = await loop.run_in_executor(self.executor, ingest_archive, upload_path, unpack_path,
+                                                  settings["media_mode"])
+
+        if "error" in result:
+            shutil.rmtree(unpack_path, ignore_errors=True)
+            return None, result
+
+        async with session_scope() as session:
+            package: Package = Package(templates_pack=unpack_path, name=name_file, archive_hash=archive_hash,
+                                       content=result["content"])  # загрузили пак
+            session.add(package)  # сохраняем в БД
+            await session.flush()  # получаем id пака
+            summary = PackageSummary(package_id=package.id, default=False, **result["summary"])
+            session.add(summary)
+        package_catalog.add(summary)
+        return package.id, result
+
+    @staticmethod
+    def __observe(result: str, started: float, size: int):
+        """
+        Длительность и объем разбора в метрики
+        :param result: cached, new или error
+        """
+        ingest_seconds.observe(time.perf_counter() - started, result=result)
+        ingest_bytes_total.inc(size, result=result)
+
+    @staticmethod
+    def __assign(player: Player, package_id: int):
+        """
+        Привязывает пак к игре, ссылка на прошлый пак игры освобождается
+        """
+        game = registry.get_game(player.game_id)  # ищем игру
+        if game is None:
+            package_store.release(package_id)
+            return
+        package_store.release(game.package_id)
+        game.package_id = package_id
+        registry.update_game(game)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Разбор паков для всего приложения
+ingest_pipeline = IngestPipeline()
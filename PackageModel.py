@@ -0,0 +1,386 @@
+# Компактная модель пака вопросов и кэш собранных паков
+import asyncio
+import hashlib
+import json
+import sys
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union, Any
+from urllib.parse import unquote
+
+from Settings import settings
+from models import session_scope, Package
+
+# Метка компактной формы пака в Package.content
+COMPACT_FORMAT = "siq-compact-1"
+
+# Папки архива SIQ по типу медиа
+MEDIA_FOLDERS: Dict[str, str] = {
+    "image": "Images",
+    "audio": "Audio",
+    "voice": "Audio",
+    "video": "Video",
+    "html": "Html",
+}
+
+
+def as_list(value) -> list:
+    """
+    xmltodict отдает один элемент как dict, а несколько как list, приводим к списку
+    """
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def text_of(value) -> str:
+    """
+    Текст узла xmltodict: строка или {"#text": ...}
+    """
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return value.get("#text", "") or ""
+    return str(value)
+
+
+class Item:
+    """
+    Элемент содержимого вопроса: текст или ссылка на медиа файл
+    """
+    __slots__ = ("type", "value", "is_ref", "path")
+
+    def __init__(self, type: str, value: str, is_ref: bool = False):
+        self.type: str = type or "text"
+        self.value: str = value
+        self.is_ref: bool = is_ref
+        # путь внутри архива для файлов из пака, например Audio/Neco Arc - Monster.mp3
+        self.path: Optional[str] = None
+        if is_ref:
+            self.path = MEDIA_FOLDERS.get(self.type, self.type.capitalize()) + "/" + value
+
+    def to_dict(self) -> dict:
+        return {"type": self.type, "value": self.value, "is_ref": self.is_ref}
+
+
+class Question:
+    __slots__ = ("price", "type", "content", "answer_content", "params", "right", "wrong")
+
+    def __init__(self, price: int, type: str, content: Tuple[Item, ...], answer_content: Tuple[Item, ...],
+                 params: Dict[str, Any], right: Tuple[str, ...], wrong: Tuple[str, ...]):
+        self.price: int = price
+        self.type: str = type
+        self.content: Tuple[Item, ...] = content
+        self.answer_content: Tuple[Item, ...] = answer_content
+        self.params: Dict[str, Any] = params
+        self.right: Tuple[str, ...] = right
+        self.wrong: Tuple[str, ...] = wrong
+
+    def to_dict(self) -> dict:
+        return {
+            "price": self.price,
+            "type": self.type,
+            "content": [item.to_dict() for item in self.content],
+            "answer_content": [item.to_dict() for item in self.answer_content],
+            "params": self.params,
+            "right": list(self.right),
+            "wrong": list(self.wrong),
+        }
+
+
+class Theme:
+    __slots__ = ("name", "comment", "questions")
+
+    def __init__(self, name: str, comment: str, questions: Tuple[Question, ...]):
+        self.name: str = name
+        self.comment: str = comment
+        self.questions: Tuple[Question, ...] = questions
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "comment": self.comment,
+                "questions": [question.to_dict() for question in self.questions]}
+
+
+class Round:
+    __slots__ = ("name", "type", "themes", "info")
+
+    def __init__(self, name: str, type: str, themes: Tuple[Theme, ...]):
+        self.name: str = name
+        self.type: str = type
+        self.themes: Tuple[Theme, ...] = themes
+        # готовое сообщение о раунде, собирается один раз
+        self.info: dict = {"name": name, "type": type, "themes": [theme.to_dict() for theme in themes]}
+
+    def media_items(self) -> Tuple[Item, ...]:
+        """
+        Медиа раунда в порядке игры: темы и вопросы по порядку пака, сначала вопрос, потом ответ.
+        Каждый файл один раз.
+        """
+        items: Dict[str, Item] = {}
+        for theme in self.themes:
+            for question in theme.questions:
+                for item in question.content + question.answer_content:
+                    if item.is_ref and item.value not in items:
+                        items[item.value] = item
+        return tuple(items.values())
+
+
+class CompiledPackage:
+    """
+    Собранный пак: раунды -> темы -> вопросы в кортежах, медиа по имени файла
+    """
+    __slots__ = ("package_id", "content_hash", "name", "author", "difficulty", "date", "rounds", "media",
+                 "info", "size")
+
+    def __init__(self, package_id: int, content_hash: str, name: str, author: str, difficulty: str, date: str,
+                 rounds: Tuple[Round, ...]):
+        self.package_id: int = package_id
+        self.content_hash: str = content_hash
+        self.name: str = name
+        self.author: str = author
+        self.difficulty: str = difficulty
+        self.date: str = date
+        self.rounds: Tuple[Round, ...] = rounds
+
+        # {имя_файла: Item}
+        self.media: Dict[str, Item] = {}
+        for round_ in rounds:
+            for theme in round_.themes:
+                for question in theme.questions:
+                    for item in question.content + question.answer_content:
+                        if item.is_ref:
+                            self.media[item.value] = item
+
+        self.info: dict = {"name": name, "author": author, "difficulty": difficulty, "date": date,
+                           "rounds": [round_.name for round_ in rounds]}
+        self.size: int = 0
+        self.size = _estimate_size(self)
+
+    def to_dict(self) -> dict:
+        """
+        Компактная форма для хранения в Package.content
+        """
+        return {"format": COMPACT_FORMAT, "name": self.name, "author": self.author, "difficulty": self.difficulty,
+                "date": self.date, "rounds": [round_.info for round_ in self.rounds]}
+
+    def get_round(self, round_index: int) -> Optional[Round]:
+        if 0 <= round_index < len(self.rounds):
+            return self.rounds[round_index]
+        return None
+
+    def get_question(self, round_index: int, theme_index: int, question_index: int) -> Optional[Question]:
+        """
+        Вопрос по номерам раунда, темы и вопроса
+        """
+        try:
+            return self.rounds[round_index].themes[theme_index].questions[question_index]
+        except IndexError:
+            return None
+
+
+# region сборка из xmltodict
+def _compile_items(param: dict) -> Tuple[Item, ...]:
+    items = []
+    for item in as_list(param.get("item")):
+        if isinstance(item, dict):
+            items.append(Item(item.get("@type", "text"), text_of(item), item.get("@isRef") == "True"))
+        else:
+            items.append(Item("text", text_of(item)))
+    return tuple(items)
+
+
+def _compile_question(question: dict) -> Question:
+    content: Tuple[Item, ...] = ()
+    answer_content: Tuple[Item, ...] = ()
+    params: Dict[str, Any] = {}
+
+    for param in as_list((question.get("params") or {}).get("param")):
+        name = param.get("@name", "")
+        if name == "question":
+            content = _compile_items(param)
+        elif name == "answer":
+            answer_content = _compile_items(param)
+        elif "numberSet" in param:
+            params[name] = {key.lstrip("@"): value for key, value in param["numberSet"].items()}
+        else:
+            params[name] = text_of(param)
+
+    right = tuple(text_of(answer) for answer in as_list((question.get("right") or {}).get("answer")))
+    wrong = tuple(text_of(answer) for answer in as_list((question.get("wrong") or {}).get("answer")))
+
+    price = question.get("@price", "0")
+    return Question(int(price) if str(price).lstrip("-").isdigit() else 0, question.get("@type", "simple"),
+                    content, answer_content, params, right, wrong)
+
+
+def compile_package(content: dict, package_id: int = 0, content_hash: str = "") -> CompiledPackage:
+    """
+    Собирает пак из словаря xmltodict (содержимое content.xml)
+    :param content: {"package": {...}}
+    :param package_id: id пака в БД
+    :param content_hash: хэш содержимого
+    :return:
+    """
+    package = content["package"]
+
+    rounds = []
+    for round_ in as_list((package.get("rounds") or {}).get("round")):
+        themes = []
+        for theme in as_list((round_.get("themes") or {}).get("theme")):
+            questions = tuple(_compile_question(question)
+                              for question in as_list((theme.get("questions") or {}).get("question")))
+            comment = text_of((theme.get("info") or {}).get("comments"))
+            themes.append(Theme(theme.get("@name", ""), comment, questions))
+        rounds.append(Round(round_.get("@name", ""), round_.get("@type", "standart"), tuple(themes)))
+
+    authors = as_list(((package.get("info") or {}).get("authors") or {}).get("author"))
+
+    return CompiledPackage(package_id, content_hash, package.get("@name", ""), ", ".join(map(text_of, authors)),
+                           package.get("@difficulty", ""), package.get("@date", ""), tuple(rounds))
+# endregion
+
+
+# region сборка из компактной формы
+def _load_items(items: List[dict]) -> Tuple[Item, ...]:
+    return tuple(Item(item["type"], item["value"], item["is_ref"]) for item in items)
+
+
+def load_compact(content: dict, package_id: int = 0, content_hash: str = "") -> CompiledPackage:
+    """
+    Собирает пак из компактной формы CompiledPackage.to_dict
+    """
+    rounds = tuple(
+        Round(round_["name"], round_["type"], tuple(
+            Theme(theme["name"], theme["comment"], tuple(
+                Question(question["price"], question["type"], _load_items(question["content"]),
+                         _load_items(question["answer_content"]), question["params"],
+                         tuple(question["right"]), tuple(question["wrong"]))
+                for question in theme["questions"]))
+            for theme in round_["themes"]))
+        for round_ in content["rounds"])
+
+    return CompiledPackage(package_id, content_hash, content["name"], content["author"], content["difficulty"],
+                           content["date"], rounds)
+# endregion
+
+
+def load_package(content: dict, package_id: int = 0, content_hash: str = "") -> CompiledPackage:
+    """
+    Собирает пак из Package.content в любой из форм: компактной или xmltodict
+    """
+    if content.get("format") == COMPACT_FORMAT:
+        return load_compact(content, package_id, content_hash)
+    return compile_package(content, package_id, content_hash)
+
+
+def decode_content(raw: Union[str, dict]) -> dict:
+    """
+    Package.content хранится то словарем, то строкой (иногда дважды закодированной)
+    """
+    while isinstance(raw, str):
+        raw = json.loads(unquote(raw))
+    return raw
+
+
+def hash_content(content: dict) -> str:
+    return hashlib.sha256(json.dumps(content, sort_keys=True, ensure_ascii=False).encode("utf8")).hexdigest()
+
+
+def _estimate_size(obj, seen: set = None) -> int:
+    """
+    Примерный объем объекта в памяти вместе с вложенными
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_estimate_size(key, seen) + _estimate_size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_estimate_size(value, seen) for value in obj)
+    elif hasattr(obj, "__slots__"):
+        size += sum(_estimate_size(getattr(obj, slot), seen) for slot in obj.__slots__)
+    return size
+
+
+def _load_compiled(package_id: int, raw: Union[str, dict]) -> CompiledPackage:
+    content = decode_content(raw)
+    return load_package(content, package_id, hash_content(content))
+
+
+class PackageCache:
+    """
+    LRU кэш собранных паков по id с ограничением по памяти.
+    Content пака после загрузки не меняется, при удалении пака запись убирает invalidate
+    """
+
+    def __init__(self, max_bytes: int = None):
+        self.max_bytes: int = max_bytes or settings["package_cache_bytes"]
+        self.used_bytes: int = 0
+
+        # {package_id: CompiledPackage}
+        self._entries: "OrderedDict[int, CompiledPackage]" = OrderedDict()
+        # одна загрузка на пак, даже если игры стартуют одновременно
+        self._loading: Dict[int, asyncio.Future] = {}
+
+    def get_cached(self, package_id: int) -> Optional[CompiledPackage]:
+        compiled = self._entries.get(package_id)
+        if compiled is not None:
+            self._entries.move_to_end(package_id)
+        return compiled
+
+    async def get(self, package_id: int) -> Optional[CompiledPackage]:
+        """
+        Собранный пак из кэша, при промахе читает БД и собирает в фоне
+        :param package_id:
+        :return: None, если пака нет
+        """
+        compiled = self.get_cached(package_id)
+        if compiled is not None:
+            return compiled
+
+        if package_id in self._loading:
+            return await self._loading[package_id]
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[package_id] = future
+        try:
+            async with session_scope() as session:
+                package: Package = await session.get(Package, package_id)
+            if package is None:
+                compiled = None
+            else:
+                compiled = await asyncio.to_thread(_load_compiled, package_id, package.content)
+                self.put(compiled)
+            future.set_result(compiled)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # ошибку получит вызвавший, ждущих может и не быть
+            raise
+        finally:
+            if not future.done():  # первый запрос отменен: ждущие не должны висеть
+                future.cancel()
+            del self._loading[package_id]
+        return compiled
+
+    def put(self, compiled: CompiledPackage):
+        self.invalidate(compiled.package_id)
+        self._entries[compiled.package_id] = compiled
+        self.used_bytes += compiled.size
+
+        while self.used_bytes > self.max_bytes and len(self._entries) > 1:  # вытесняем самые старые
+            _, evicted = self._entries.popitem(last=False)
+            self.used_bytes -= evicted.size
+
+    def invalidate(self, package_id: int):
+        compiled = self._entries.pop(package_id, None)
+        if compiled is not None:
+            self.used_bytes -= compiled.size
+
+
+# Кэш паков для всего приложения
+package_cache = PackageCache()
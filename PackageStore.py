@@ -0,0 +1,195 @@
+# Хранилище паков по хэшу архива с общими медиа файлами и счетчиком ссылок
+import asyncio
+import hashlib
+import os
+import shutil
+import time
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import select, delete
+
+from MediaServer import media_library
+from PackageCatalog import package_catalog
+from PackageModel import package_cache
+from Settings import settings
+from models import session_scope, Package, Game
+
+# Распакованные паки: packages/store/<хэш архива>/
+STORE_DIR = "packages/store"
+# Медиа файлы по хэшу содержимого: packages/blobs/<2 символа>/<хэш>
+BLOBS_DIR = "packages/blobs"
+
+
+def store_path(archive_hash: str) -> str:
+    return os.path.join(STORE_DIR, archive_hash)
+
+
+def is_store_path(path: str) -> bool:
+    """
+    Лежит ли папка пака внутри хранилища по хэшу
+    """
+    store = os.path.realpath(STORE_DIR)
+    return os.path.commonpath([store, os.path.realpath(path)]) == store and os.path.realpath(path) != store
+
+
+def file_hash(path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def dedupe_tree(root: str) -> int:
+    """
+    Заменяет медиа файлы распакованного пака жесткими ссылками на общие blob.
+    Выполняется в процессе пула после распаковки.
+    :param root: Папка пака
+    :return: Сколько байт сэкономлено
+    """
+    saved = 0
+    for directory, _, files in os.walk(root):
+        for file_name in files:
+            path = os.path.join(directory, file_name)
+            if os.path.relpath(path, root) == "content.xml":
+                continue
+
+            digest = file_hash(path)
+            blob = os.path.join(BLOBS_DIR, digest[:2], digest)
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+
+            if os.path.exists(blob):  # такой файл уже есть в другом паке
+                saved += os.path.getsize(path)
+                os.remove(path)
+            else:
+                os.replace(path, blob)
+
+            try:
+                os.link(blob, path)
+            except OSError:  # файловая система без жестких ссылок
+                shutil.copyfile(blob, path)
+    return saved
+
+
+def prune_blobs() -> int:
+    """
+    Удаляет blob, на которые не ссылается ни один пак (осталась одна ссылка - сам blob)
+    :return: Сколько файлов удалено
+    """
+    removed = 0
+    if not os.path.isdir(BLOBS_DIR):
+        return removed
+    for directory, _, files in os.walk(BLOBS_DIR):
+        for file_name in files:
+            path = os.path.join(directory, file_name)
+            if os.stat(path).st_nlink <= 1:
+                os.remove(path)
+                removed += 1
+    return removed
+
+
+class PackageStore:
+    """
+    Счетчики ссылок игр на паки и фоновая очистка неиспользуемых паков.
+    Пак удаляется, только если на него package_keep_seconds не ссылается ни одна игра.
+    """
+
+    def __init__(self):
+        # {package_id: сколько игр используют пак}
+        self.refcounts: Dict[int, int] = {}
+        # {package_id: когда счетчик стал нулевым}
+        self.unused_since: Dict[int, float] = {}
+        self._reaper: Optional[asyncio.Task] = None
+        # очистка и захват пака по хэшу не должны пересекаться
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def claim(self, archive_hash: str) -> Optional[int]:
+        """
+        Ищет уже загруженный пак с тем же архивом и сразу занимает его
+        :param archive_hash: sha256 архива
+        :return: id пака или None
+        """
+        async with self._lock:
+            async with session_scope() as session:
+                package_id = (await session.execute(
+                    select(Package.id).where(Package.archive_hash == archive_hash))).scalars().first()
+            if package_id is not None:
+                self.acquire(package_id)
+            return package_id
+
+    # region счетчики ссылок
+    async def start(self, games: Iterable[Game]):
+        """
+        Считает ссылки живых игр и запускает очистку
+        :param games: Игры из реестра
+        """
+        for game in games:
+            if game.package_id is not None:
+                self.acquire(game.package_id)
+
+        async with session_scope() as session:  # паки без игр - кандидаты на удаление
+            rows = (await session.execute(select(Package.id).where(Package.default.isnot(True)))).scalars().all()
+        for package_id in rows:
+            if package_id not in self.refcounts and package_id != settings["default_package_id"]:
+                self.unused_since[package_id] = time.monotonic()
+
+        self._lock = asyncio.Lock()
+        self._reaper = asyncio.create_task(self.__reap_loop())
+
+    def acquire(self, package_id: int):
+        self.refcounts[package_id] = self.refcounts.get(package_id, 0) + 1
+        self.unused_since.pop(package_id, None)
+
+    def release(self, package_id: Optional[int]):
+        if package_id is None or package_id not in self.refcounts:
+            return
+        self.refcounts[package_id] -= 1
+        if self.refcounts[package_id] <= 0:
+            del self.refcounts[package_id]
+            self.unused_since[package_id] = time.monotonic()
+    # endregion
+
+    # region очистка
+    async def __reap_loop(self):
+        while True:
+            await asyncio.sleep(settings["package_reaper_interval"])
+            try:
+                await self.reap()
+            except Exception as e:
+                print(f"Ошибка очистки паков: {e}")
+
+    async def reap(self):
+        """
+        Удаляет паки без ссылок дольше package_keep_seconds
+        """
+        deadline = time.monotonic() - settings["package_keep_seconds"]
+        expired = [package_id for package_id, since in self.unused_since.items() if since <= deadline]
+        if not expired:
+            return
+
+        async with self._lock:
+            async with session_scope() as session:
+                rows = (await session.execute(select(Package.id, Package.templates_pack, Package.default)
+                                              .where(Package.id.in_(expired)))).all()
+                # пока шел запрос, пак могли снова занять
+                removable = [row for row in rows if not row.default and row.id != settings["default_package_id"]
+                             and row.id in self.unused_since]
+                await package_catalog.delete(session, [row.id for row in removable])
+                await session.execute(delete(Package).where(Package.id.in_([row.id for row in removable])))
+            package_catalog.remove(row.id for row in removable)
+
+            for package_id in expired:
+                if package_id not in self.refcounts:
+                    self.unused_since.pop(package_id, None)
+                    package_cache.invalidate(package_id)
+                    media_library.invalidate(package_id)  # закрываем архив до удаления папки
+
+        for row in removable:
+            if is_store_path(row.templates_pack):  # старые паки лежат вне хранилища, их папки не трогаем
+                await asyncio.to_thread(shutil.rmtree, row.templates_pack, True)
+        await asyncio.to_thread(prune_blobs)
+    # endregion
+
+
+# Хранилище паков для всего приложения
+package_store = PackageStore()
@@ -0,0 +1,81 @@
+# Потоковая загрузка пака по HTTP
+import asyncio
+import hashlib
+import os
+import uuid
+from typing import AsyncIterator, Awaitable, Callable, Optional, Tuple
+
+from Settings import settings
+
+# Папка для принимаемых архивов
+UPLOAD_DIR = "packages/uploads"
+
+
+class UploadError(Exception):
+    """
+    Ошибка загрузки, code уходит клиенту, status_code - HTTP статус
+    """
+
+    def __init__(self, code: str, status_code: int = 400):
+        super().__init__(code)
+        self.code: str = code
+        self.status_code: int = status_code
+
+
+async def receive_upload(stream: AsyncIterator[bytes], content_length: Optional[int],
+                         on_progress: Callable[[int, Optional[int]], Awaitable[None]] = None) -> Tuple[str, str]:
+    """
+    Пишет тело запроса на диск частями, в памяти не больше одного буфера
+    :param stream: Части тела запроса
+    :param content_length: Заявленный размер, если клиент его передал
+    :param on_progress: Вызывается после записи каждого буфера (получено, всего)
+    :return: Путь к принятому архиву и его sha256
+    """
+    max_bytes: int = settings["max_package_bytes"]
+    buffer_bytes: int = settings["upload_buffer_bytes"]
+
+    if content_length is not None and content_length > max_bytes:  # отказываем до чтения тела
+        raise UploadError("package_too_large", 413)
+
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    upload_path = os.path.join(UPLOAD_DIR, f"{uuid.uuid4()}.zip")
+    part_path = upload_path + ".part"
+
+    received = 0
+    buffer = bytearray()
+    hasher = hashlib.sha256()  # хэш считаем по ходу записи, второй раз файл не читаем
+    try:
+        with open(part_path, "wb") as f:
+
+            def write(data: bytes):
+                f.write(data)
+                hasher.update(data)
+
+            async for chunk in stream:
+                received += len(chunk)
+                if received > max_bytes:
+                    raise UploadError("package_too_large", 413)
+
+                buffer += chunk
+                if len(buffer) >= buffer_bytes:
+                    await asyncio.to_thread(write, bytes(buffer))  # диск не держит цикл событий
+                    buffer.clear()
+                    if on_progress is not None:
+                        await on_progress(received, content_length)
+
+            if buffer:
+                await asyncio.to_thread(write, bytes(buffer))
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+
+    if received == 0:
+        os.remove(part_path)
+        raise UploadError("empty_package")
+
+    if on_progress is not None:
+        await on_progress(received, content_length)
+
+    os.replace(part_path, upload_path)
+    return upload_path, hasher.hexdigest()
@@ -0,0 +1,87 @@
+# Выборочный профилировщик: включается на время, когда комната тормозит в продакшене
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from Settings import settings
+
+
+class SamplingProfiler:
+    """
+    Отдельный поток раз в interval_ms снимает стек потока цикла событий через sys._current_frames().
+    Стеки складываются в формате collapsed (a;b;c количество), из него строится flamegraph.
+    Выключенный профилировщик ничего не стоит: потока нет.
+    """
+
+    def __init__(self):
+        self.interval_ms: float = settings["profiler_interval_ms"]
+        self.samples: int = 0
+        self.started: Optional[float] = None
+        self.stopped: Optional[float] = None
+        self._stacks: Counter = Counter()
+        self._target: Optional[int] = None  # id потока, который профилируем
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval_ms: float = None):
+        """
+        Вызывается из цикла событий: профилируется поток, в котором он работает.
+        Прошлые замеры сбрасываются.
+        """
+        if self.running:
+            return
+        self.interval_ms = interval_ms or settings["profiler_interval_ms"]
+        self._stacks.clear()
+        self.samples = 0
+        self.started = time.time()
+        self.stopped = None
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.__run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self.stopped = time.time()
+
+    def __run(self):
+        interval = self.interval_ms / 1000
+        limit = settings["profiler_max_samples"]
+        while not self._stop.wait(interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})")
+                frame = frame.f_back
+            self._stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+            if self.samples >= limit:  # забытый включенным профилировщик не съест память
+                self.stopped = time.time()
+                break
+
+    def status(self) -> dict:
+        return {"running": self.running, "interval_ms": self.interval_ms, "samples": self.samples,
+                "started": self.started, "stopped": self.stopped}
+
+    def collapsed(self, top: int = None) -> str:
+        """
+        :param top: Сколько самых частых стеков отдать, None - все
+        :return: Строки "стек количество" для flamegraph.pl или speedscope
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self._stacks.most_common(top))
+
+
+# Профилировщик для всего приложения
+profiler = SamplingProfiler()
@@ -0,0 +1,74 @@
+# Последние сообщения игры с номерами для догонки после переподключения
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from Broadcaster import Frame
+from Settings import settings
+from models import Player
+
+# region кому адресовано сообщение
+AUDIENCE_ALL = "all"  # все сокеты комнаты
+AUDIENCE_PLAYERS = "players"  # все, кроме экрана и ведущего
+AUDIENCE_SCREEN = "screen"
+AUDIENCE_LEADER = "leader"
+AUDIENCE_MAIN = "main"  # экран и ведущий
+# endregion
+
+
+def personal(user_GUID: str) -> str:
+    """
+    Адресат одного пользователя
+    """
+    return "user:" + user_GUID
+
+
+def is_addressed(audience: str, player: Player) -> bool:
+    """
+    Получил бы игрок это сообщение, если бы был подключен
+    """
+    if audience == AUDIENCE_ALL:
+        return True
+    if audience == AUDIENCE_PLAYERS:
+        return not player.is_screen and not player.is_leader
+    if audience == AUDIENCE_SCREEN:
+        return bool(player.is_screen)
+    if audience == AUDIENCE_LEADER:
+        return bool(player.is_leader)
+    if audience == AUDIENCE_MAIN:
+        return bool(player.is_screen or player.is_leader)
+    return audience == personal(player.GUID)
+
+
+class ReplayBuffer:
+    """
+    Кольцевой буфер исходящих сообщений одной игры.
+    Каждое сообщение игры получает номер seq, клиент запоминает последний,
+    а при переподключении получает только пропущенное.
+    """
+
+    def __init__(self, size: int = None):
+        # [(seq, адресат, кадр, event), ]
+        self._entries: Deque[Tuple[int, str, Frame, Optional[str]]] = deque(
+            maxlen=size or settings["replay_buffer_size"])
+        self.seq: int = 0  # последний известный номер
+
+    def append(self, seq: int, audience: str, frame: Frame, event: Optional[str]):
+        self._entries.append((seq, audience, frame, event))
+        self.seq = max(self.seq, seq)
+
+    def since(self, last_seq: int, player: Player) -> Optional[List[Tuple[Frame, Optional[str]]]]:
+        """
+        Сообщения игрока после last_seq
+        :param last_seq: Последний номер, который видел клиент
+        :param player:
+        :return: [(кадр, event), ] по порядку или None, если буфер уже не помнит часть пропущенного
+            или клиент видел номера, которых здесь нет (сервер перезапускался)
+        """
+        if last_seq == self.seq:
+            return []
+        if last_seq > self.seq:
+            return None
+        if not self._entries or min(entry[0] for entry in self._entries) > last_seq + 1 or last_seq < 0:
+            return None
+        return [(frame, event) for seq, audience, frame, event in sorted(self._entries, key=lambda entry: entry[0])
+                if seq > last_seq and is_addressed(audience, player)]
@@ -1,5 +1,47 @@
+import os
+
 settings: dict = {
     "game_lifetime": 12,  # время жизни игры в часах
+    "send_queue_size": 64,  # максимум неотправленных сообщений на одно соединение
+    "slow_consumer_policy": "coalesce",  # что делать с медленным клиентом: drop, coalesce, disconnect
+    "package_cache_bytes": 64 * 1024 * 1024,  # память под собранные паки
+    "default_package_id": 1,  # пак, если ведущий не загрузил свой
+    "max_package_bytes": 300 * 1024 * 1024,  # максимальный размер архива пака
+    "upload_buffer_bytes": 1024 * 1024,  # сколько копим в памяти перед записью на диск
+    "ingest_workers": 2,  # процессов для распаковки и разбора паков
+    "package_keep_seconds": 600,  # сколько хранить пак без игр перед удалением
+    "package_reaper_interval": 60,  # как часто искать паки для удаления, в секундах
+    "media_mode": "zip",  # zip - медиа отдаются прямо из архива, extracted - архив распаковывается
+    "media_hot_cache_bytes": 32 * 1024 * 1024,  # память под часто запрашиваемые файлы паков
+    "media_hot_cache_item_bytes": 512 * 1024,  # файлы больше этого в памяти не держим
+    "state_backend": os.environ.get("STATE_BACKEND", "local"),  # local - один воркер, shared - общее состояние
+    "redis_url": os.environ.get("REDIS_URL"),  # для shared; без него общий брокер в памяти процесса
+    "workers": int(os.environ.get("WEB_CONCURRENCY", 1)),  # сколько процессов запускает uvicorn или gunicorn
+    "worker_heartbeat_seconds": 10,  # как часто воркер продлевает свои участники и роли в shared
+    "worker_lease_seconds": 30,  # через сколько без продления участники и роли воркера не считаются
+    "game_inbox_size": 256,  # необработанных событий на игру, дальше чтение сокетов ждет
+    "buzz_window_ms": 30,  # окно арбитража после первого нажатия
+    "ping_interval": 5,  # как часто мерить RTT игроков, в секундах
+    "rtt_ewma_alpha": 0.2,  # вес нового замера RTT в сглаживании
+    "max_rtt_correction_ms": 250,  # больше этого задержку игрока не вычитаем
+    "lobby_tick_ms": 20,  # за сколько склеиваются готовность и подключения в одно сообщение
+    "replay_buffer_size": 128,  # последних сообщений игры для догонки после переподключения
+    "empty_game_grace_seconds": 120,  # сколько пустая игра ждет переподключения
+    "teardown_interval": 10,  # как часто удалять пустые игры, в секундах
+    "expiry_sweep_interval": 300,  # как часто удалять игры старше game_lifetime, в секундах
+    "expiry_sweep_batch": 500,  # игр в одном запросе удаления
+    "expiry_sweep_budget_ms": 200,  # сколько может длиться один проход очистки
+    "journal_flush_ms": 50,  # как долго изменения реестра копятся перед записью в БД
+    "journal_batch_size": 200,  # операций в журнале, после которых запись начинается сразу
+    "game_code_min": 100000,  # коды игр - шестизначные числа
+    "game_code_max": 999999,
+    "catalog_page_size": 20,  # паков на странице выбора по умолчанию
+    "catalog_max_page_size": 100,
+    "catalog_refresh_seconds": 30,  # как часто перечитывать каталог, чтобы видеть паки других воркеров
+    "loop_lag_interval": 0.5,  # как часто мерить задержку цикла событий, в секундах
+    "profiler_interval_ms": 5,  # шаг выборочного профилировщика
+    "profiler_max_samples": 100000,  # после стольких замеров профилировщик останавливается сам
+    "debug_token": os.environ.get("DEBUG_TOKEN"),  # заголовок X-Debug-Token для /debug, без него /debug выключен
     "origins": [
         "http://localhost.tiangolo.com",
         "https://localhost.tiangolo.com",
@@ -11,7 +53,3 @@ settings: dict = {
         "https://gross01.github.io"
     ]
 }
-
-
-
-json_test = {"package": {"@name": "\u0421\u043e\u043b\u044f\u043d\u043a\u0430 \u0438\u0437 \u043c\u043e\u0440\u043e\u0437\u0438\u043b\u043a\u0438 \u0432 \u0434\u0443\u0448\u043d\u0438\u043b\u043a\u0443", "@version": "5", "@id": "ebcb094f-4d1f-45d9-bdc4-c97f8e3ca6cf", "@date": "23.11.2023", "@difficulty": "5", "@xmlns": "https://github.com/VladimirKhil/SI/blob/master/assets/siq_5.xsd", "info": {"authors": {"author": "\u0418\u0445\u0442\u0438\u0430\u043d\u0434\u0440"}}, "rounds": {"round": [{"@name": "\u0414\u043e\u0441\u0442\u0430\u0435\u043c \u0438\u0437 \u043c\u043e\u0440\u043e\u0437\u0438\u043b\u043a\u0438", "themes": {"theme": [{"@name": "AI \u043a\u043e\u0432\u0440\u044b", "info": {"comments": "\u0427\u0435\u0439 \u0433\u043e\u043b\u043e\u0441 \u0438\u0441\u043f\u043e\u043b\u044c\u0437\u043e\u0432\u0430\u043d \u0434\u043b\u044f \u043a\u0430\u0432\u0435\u0440\u0430?"}, "questions": {"question": [{"@price": "100", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "audio", "@isRef": "True", "#text": "Neco Arc - Monster.mp3"}}}, "right": {"answer": "Neco Arc - Monster"}}, {"@price": "200", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "audio", "@isRef": "True", "#text": "\u0415\u0433\u043e\u0440 \u041b\u0435\u0442\u043e\u0432 - \u0411\u0435\u043b\u0430\u044f \u043d\u043e\u0447\u044c.mp3"}}}, "right": {"answer": "\u0415\u0433\u043e\u0440 \u041b\u0435\u0442\u043e\u0432 - \u0411\u0435\u043b\u0430\u044f \u043d\u043e\u0447\u044c"}}, {"@price": "300", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "audio", "@isRef": "True", "#text": "\u0414\u043e\u0440\u0430 - \u0417\u043d\u0430\u0435\u0448\u044c \u043b\u0438 \u0442\u044b.mp3"}}}, "right": {"answer": "\u0414\u043e\u0440\u0430 - \u0417\u043d\u0430\u0435\u0448\u044c \u043b\u0438 \u0442\u044b"}}, {"@price": "400", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "audio", "@isRef": "True", "#text": "\u0422\u0438\u043b\u043b\u044c \u041b\u0438\u043d\u0434\u0435\u043c\u0430\u043d\u043d - \u041a\u043e\u043c\u0430\u0440\u043e\u0432\u043e.mp3"}}}, "right": {"answer": "\u0422\u0438\u043b\u043b\u044c \u041b\u0438\u043d\u0434\u0435\u043c\u0430\u043d\u043d - \u041a\u043e\u043c\u0430\u0440\u043e\u0432\u043e"}}, {"@price": "500", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "audio", "@isRef": "True", "#text": "\u0411\u043e\u0440\u0438\u0441 \u0415\u043b\u044c\u0446\u0438\u043d - \u0420\u044e\u043c\u043a\u0430 \u0432\u043e\u0434\u043a\u0438 \u043d\u0430 \u0441\u0442\u043e\u043b\u0435.mp3"}}}, "right": {"answer": "\u0411\u043e\u0440\u0438\u0441 \u0415\u043b\u044c\u0446\u0438\u043d - \u0420\u044e\u043c\u043a\u0430 \u0432\u043e\u0434\u043a\u0438 \u043d\u0430 \u0441\u0442\u043e\u043b\u0435"}}]}}, {"@name": "\u0418\u0433\u0440\u0430 \u043f\u043e \u0441\u043a\u0440\u0438\u043d\u0443", "info": {"comments": "\u041d\u0443\u0436\u043d\u043e \u043e\u043f\u0440\u0435\u0434\u0435\u043b\u0438\u0442\u044c \u0438\u0433\u0440\u0443 \u043f\u043e \u0441\u043a\u0440\u0438\u043d\u0448\u043e\u0442\u0443 \u0438\u0437 \u043d\u0435\u0435"}, "questions": {"question": [{"@price": "100", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "gtasan_2.png"}}}, "right": {"answer": "GTA San Andres"}}, {"@price": "200", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "atheart.png"}}}, "right": {"answer": "Atomc Heart"}}, {"@price": "300", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "2fort_1.png"}}}, "right": {"answer": "Team Fortress 2"}}, {"@price": "400", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "celest_2.png"}}}, "right": {"answer": "Celeste"}}, {"@price": "500", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "frostp.jpg"}}}, "right": {"answer": "FrostPunk"}}]}}, {"@name": "\u0424\u0438\u043b\u044c\u043c \u043f\u043e \u043a\u0430\u0441\u0442\u0443", "info": {"comments": "\u041d\u0430\u0437\u043e\u0432\u0438\u0442\u0435 \u0444\u0438\u043b\u044c\u043c \u043f\u043e \u0435\u0433\u043e \u0430\u043a\u0442\u0435\u0440\u0441\u043a\u043e\u043c\u0443 \u0441\u043e\u0441\u0442\u0430\u0432\u0443"}, "questions": {"question": [{"@price": "100", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "pulpf.png"}}}, "right": {"answer": "\u041a\u0440\u0438\u043c\u0438\u043d\u0430\u043b\u044c\u043d\u043e\u0435 \u0447\u0442\u0438\u0432\u043e"}}, {"@price": "200", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "1plus1.png"}}}, "right": {"answer": "1 + 1"}}, {"@price": "300", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "wolfwall.png"}}}, "right": {"answer": "\u0412\u043e\u043b\u043a \u0441 \u0423\u043e\u043b\u043b \u0421\u0442\u0440\u0438\u0442"}}, {"@price": "400", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "godfat.png"}}}, "right": {"answer": "\u041a\u0440\u0451\u0441\u0442\u043d\u044b\u0439 \u043e\u0442\u0435\u0446"}}, {"@price": "500", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "jackhouse.png"}}}, "right": {"answer": "\u0414\u043e\u043c, \u043a\u043e\u0442\u043e\u0440\u044b\u0439 \u043f\u043e\u0441\u0442\u0440\u043e\u0438\u043b \u0414\u0436\u0435\u043a"}}]}}, {"@name": "\u0416\u0438\u0432\u043e\u043f\u0438\u0441\u044c", "info": {"comments": "\u041e\u043f\u0440\u0435\u0434\u0435\u043b\u0438\u0442\u0435 \u0430\u0432\u0442\u043e\u0440\u0430 \u043a\u0430\u0440\u0442\u0438\u043d\u044b \u0438\u043b\u0438 \u0435\u0435 \u043d\u0430\u0437\u0432\u0430\u043d\u0438\u0435"}, "questions": {"question": [{"@price": "100", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "vangog.png"}}}, "right": {"answer": "\u0417\u0432\u0435\u0437\u0434\u043d\u0430\u044f \u043d\u043e\u0447\u044c - \u0412\u0430\u043d \u0413\u043e\u0433"}}, {"@price": "200", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "veresh.png"}}}, "right": {"answer": "\u0410\u043f\u043e\u0444\u0435\u043e\u0437 \u0432\u043e\u0439\u043d\u044b - \u0412\u0435\u0440\u0435\u0449\u0430\u0433\u0438\u043d"}}, {"@price": "300", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "aiv.png"}}}, "right": {"answer": "9 \u0432\u0430\u043b - \u0410\u0439\u0432\u0430\u0437\u043e\u0432\u0441\u043a\u0438\u0439"}}, {"@price": "400", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "rembrant.png"}}}, "right": {"answer": "\u0412\u043e\u0437\u0432\u0440\u0430\u0449\u0435\u043d\u0438\u0435 \u0431\u043b\u0443\u0434\u043d\u043e\u0433\u043e \u0441\u044b\u043d\u0430 - \u0420\u0435\u043c\u0431\u0440\u0430\u043d\u0434\u0442"}}, {"@price": "500", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "seled.png"}}}, "right": {"answer": "\u0421\u0435\u043b\u0435\u0434\u043a\u0430 - \u041f\u0435\u0442\u0440\u043e\u0432-\u0412\u043e\u0434\u043a\u0438\u043d"}}]}}, {"@name": "\u041e\u0440\u0443\u0436\u0438\u0435 \u0434\u0440\u0435\u0432\u043d\u043e\u0441\u0442\u0438", "info": {"comments": "\u041a\u0430\u043a \u043d\u0430\u0437\u044b\u0432\u0430\u0435\u0442\u0441\u044f \u044d\u0442\u043e \u043e\u0440\u0443\u0436\u0438\u0435"}, "questions": {"question": [{"@price": "100", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "tomag.png"}}}, "right": {"answer": "\u0422\u043e\u043c\u0430\u0433\u0430\u0432\u043a"}}, {"@price": "200", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "alebard.png"}}}, "right": {"answer": "\u0410\u043b\u0435\u0431\u0430\u0440\u0434\u0430"}}, {"@price": "300", "@type": "noRisk", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "arkeb.png"}}}, "right": {"answer": "\u0410\u0440\u043a\u0435\u0431\u0443\u0437\u0430"}}, {"@price": "400", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "hvacha.png"}}}, "right": {"answer": "\u0425\u0432\u0430\u0447\u0445\u0430"}}, {"@price": "500", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "shenb.png"}}}, "right": {"answer": "\u0428\u0435\u043d\u0431\u044f\u043e"}}]}}, {"@name": "\u0420\u044d\u043f\u0435\u0440 \u0438\u043b\u0438 \u043f\u043e\u044d\u0442", "info": {"comments": "\u041e\u0442\u0432\u0435\u0442\u044c\u0442\u0435, \u043a\u043e\u043c\u0443 \u043f\u0440\u0438\u043d\u0430\u0434\u043b\u0435\u0436\u0430\u0442 \u044d\u0442\u0438 \u0441\u0442\u0440\u043e\u043a\u0438 - \u0440\u044d\u043f\u0435\u0440\u0443 \u0438\u043b\u0438 \u043f\u043e\u044d\u0442\u0443"}, "questions": {"question": [{"@price": "300", "@type": "secret", "params": {"param": {"@name": "question", "@type": "content", "item": "\u0422\u043e\u043b\u044c\u043a\u043e \u0443\u0441\u0442\u0430\u043b\u044b\u0439 \u0434\u043e\u0441\u0442\u043e\u0438\u043d \u043c\u043e\u043b\u0438\u0442\u044c\u0441\u044f \u0431\u043e\u0433\u0430\u043c,\n\u0422\u043e\u043b\u044c\u043a\u043e \u0432\u043b\u044e\u0431\u043b\u0435\u043d\u043d\u044b\u0439 - \u0441\u0442\u0443\u043f\u0430\u0442\u044c \u043f\u043e \u0432\u0435\u0441\u0435\u043d\u043d\u0438\u043c \u043b\u0443\u0433\u0430\u043c!\n\u041d\u0430 \u043d\u0435\u0431\u0435 \u0437\u0432\u0435\u0437\u0434\u044b, \u0438 \u0442\u0438\u0445\u0430\u044f \u0433\u0440\u0443\u0441\u0442\u044c \u043d\u0430 \u0437\u0435\u043c\u043b\u0435,\n\u0422\u0438\u0445\u043e\u0435 \"\u043f\u0443\u0441\u0442\u044c\" \u043f\u0440\u043e\u0437\u0432\u0443\u0447\u0430\u043b\u043e \u0438 \u0442\u0430\u0435\u0442 \u0432\u043e \u043c\u0433\u043b\u0435..."}}, "right": {"answer": "\u0413\u0443\u043c\u0438\u043b\u0435\u0432 - \u043f\u043e\u044d\u0442"}}, {"@price": "300", "@type": "secret", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041a\u043d\u0438\u0433\u0438 \u0434\u0435\u043b\u044f\u0442\u0441\u044f \u043c\u043d\u0435\u043d\u044c\u0435\u043c,\n\u043c\u043d\u0435\u043d\u044c\u044f \u0441\u0435\u044e\u0442 \u0441\u043e\u043c\u043d\u0435\u043d\u044c\u044f.\n\u041e\u0442 \u0441\u043e\u043c\u043d\u0435\u043d\u044c\u044f \u043b\u0435\u043d\u044c,\n\u0430 \u043e\u0442 \u043b\u0435\u043d\u0438 \u0432\u0435\u0435\u0442 \u0437\u0430\u0431\u0432\u0435\u043d\u044c\u0435\u043c"}}, "right": {"answer": "Oxxxymiron - \u0440\u044d\u043f\u0435\u0440"}}, {"@price": "300", "@type": "secret", "params": {"param": {"@name": "question", "@type": "content", "item": "\u042f \u0437\u0430\u0433\u043b\u044f\u0434\u044b\u0432\u0430\u044e \u0432 \u043f\u044c\u044f\u043d\u044b\u0435 \u0440\u0442\u044b \u043a\u0430\u0431\u0430\u043a\u043e\u0432,\n\u0413\u0434\u0435 \u0442\u0432\u043e\u0438 \u0437\u0430\u043f\u0430\u0445\u0438 \u043b\u0438\u043f\u043d\u0443\u0442 \u043a \u0440\u0443\u043a\u0430\u043c \u0434\u0443\u0440\u0430\u043a\u043e\u0432\n\u0413\u0434\u0435, \u043f\u0440\u0438\u043a\u0438\u0434\u044b\u0432\u0430\u044f\u0441\u044c \u043c\u043d\u043e\u0439, \u0448\u0430\u043b\u044b\u0439 \u043e\u0442 \u0441\u043b\u0435\u043f\u043e\u0442\u044b\n\u0410\u043a\u0442\u0451\u0440\u0438\u0448\u043a\u0430-\u0433\u043e\u0441\u043f\u043e\u0434\u044c \u0446\u0435\u043b\u0443\u0435\u0442 \u0442\u0432\u043e\u0438 \u0441\u043b\u0435\u0434\u044b"}}, "right": {"answer": "\u0425\u0430\u0441\u043a\u0438 - \u0440\u044d\u043f\u0435\u0440"}}, {"@price": "300", "@type": "secret", "params": {"param": {"@name": "question", "@type": "content", "item": "\u042d\u0442\u043e\u0442 \u0441\u043e\u0440\u0442 \u043d\u0430\u0440\u043e\u0434\u0430 \u2013 \u0442\u0438\u0445\n\u0438 \u0431\u0435\u0441\u0444\u043e\u0440\u043c\u0435\u043d, \u0441\u043b\u043e\u0432\u043d\u043e \u0441\u0442\u0443\u0434\u0435\u043d\u044c.\n\u041e\u0447\u0435\u043d\u044c \u043c\u043d\u043e\u0433\u0438\u0435 \u0438\u0437 \u043d\u0438\u0445\n\u0432 \u043d\u0430\u0448\u0438 \u0434\u043d\u0438 \u0432\u044b\u0445\u043e\u0434\u044f\u0442 \u0432 \u043b\u044e\u0434\u0438"}}, "right": {"answer": "\u041c\u0430\u044f\u043a\u043e\u0432\u0441\u043a\u0438\u0439 - \u043f\u043e\u044d\u0442"}}, {"@price": "300", "@type": "secret", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041c\u0438\u043c\u043e \u0440\u0438\u0441\u0442\u0430\u043b\u0438\u0449, \u043a\u0430\u043f\u0438\u0449,\n\u043c\u0438\u043c\u043e \u0445\u0440\u0430\u043c\u043e\u0432 \u0438 \u0431\u0430\u0440\u043e\u0432,\n\u043c\u0438\u043c\u043e \u0448\u0438\u043a\u0430\u0440\u043d\u044b\u0445 \u043a\u043b\u0430\u0434\u0431\u0438\u0449, \u043c\u0438\u043c\u043e \u0431\u043e\u043b\u044c\u0448\u0438\u0445 \u0431\u0430\u0437\u0430\u0440\u043e\u0432"}}, "right": {"answer": "\u0411\u0440\u043e\u0434\u0441\u043a\u0438\u0439 - \u043f\u043e\u044d\u0442"}}]}}]}}, {"@name": "\u0420\u0430\u0437\u043e\u0433\u0440\u0435\u0432\u0430\u0435\u043c", "themes": {"theme": [{"@name": "\u0414\u0443\u0448\u043d\u0438\u043b\u043a\u0430 \u043f\u043e \u0444\u043e\u0442\u043e\u043a\u0430\u0440\u0442\u043e\u0447\u043a\u0435", "info": {"comments": "\u041d\u0430\u0437\u043e\u0432\u0438\u0442\u0435 \u0438\u0437\u0432\u0435\u0441\u0442\u043d\u043e\u0433\u043e \u0434\u0435\u044f\u0442\u0435\u043b\u044f \u043f\u0440\u043e\u0448\u043b\u043e\u0433\u043e \u043f\u043e \u0438\u0437\u043e\u0431\u0440\u0430\u0436\u0435\u043d\u0438\u044e"}, "questions": {"question": [{"@price": "200", "@type": "stake", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "nithe.png"}}}, "right": {"answer": "\u0424\u0440\u0438\u0434\u0440\u0438\u0445 \u041d\u0438\u0446\u0448\u0435"}}, {"@price": "400", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "newton.png"}}}, "right": {"answer": "\u0418\u0441\u0430\u0430\u043a \u041d\u044c\u044e\u0442\u043e\u043d"}}, {"@price": "600", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "necr.png"}}}, "right": {"answer": "\u0418\u0432\u0430\u043d \u041d\u0435\u043a\u0440\u0430\u0441\u043e\u0432"}}, {"@price": "800", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "eiz.png"}}}, "right": {"answer": "\u0421\u0435\u0440\u0433\u0435\u0439 \u042d\u0439\u0437\u0435\u043d\u0448\u0442\u0435\u0439\u043d"}}, {"@price": "1000", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "shost.png"}}}, "right": {"answer": "\u0414\u043c\u0438\u0442\u0440\u0438\u0439 \u0428\u043e\u0441\u0442\u0430\u043a\u043e\u0432\u0438\u0447"}}]}}, {"@name": "\u0410\u043d\u0438\u043c\u0435 \u043f\u043e \u0441\u0442\u0440\u0430\u043d\u043d\u043e\u043c\u0443 \u043a\u0430\u0434\u0440\u0443", "info": {"comments": "\u041d\u0443\u0436\u043d\u043e \u043e\u043f\u0440\u0435\u0434\u0435\u043b\u0438\u0442\u044c \u0430\u043d\u0438\u043c\u0435 \u043f\u043e \u043a\u0430\u0434\u0440\u0443 \u0438\u0437 \u043d\u0435\u0433\u043e"}, "questions": {"question": [{"@price": "200", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "jojo.png"}}}, "right": {"answer": "\u0414\u0436\u043e\u0434\u0436\u043e"}}, {"@price": "400", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "attit.png"}}}, "right": {"answer": "\u0410\u0442\u0430\u043a\u0430 \u0442\u0438\u0442\u0430\u043d\u043e\u0432"}}, {"@price": "600", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "narutoetokruto_1.png"}}}, "right": {"answer": "\u041d\u0430\u0440\u0443\u0442\u043e"}}, {"@price": "800", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "evang.png"}}}, "right": {"answer": "\u0415\u0432\u0430\u043d\u0433\u0435\u043b\u0438\u043e\u043d"}}, {"@price": "1000", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "gto.jpg"}}}, "right": {"answer": "\u041a\u0440\u0443\u0442\u043e\u0439 \u0443\u0447\u0438\u0442\u0435\u043b\u044c \u041e\u043d\u0438\u0434\u0437\u0443\u043a\u0430"}}]}}, {"@name": "\u0421\u0442\u0440\u0430\u043d\u0430 \u043f\u043e \u0444\u043e\u0442\u043e", "info": {"comments": "\u041d\u0430\u0437\u043e\u0432\u0438\u0442\u0435 \u0441\u0442\u0440\u0430\u043d\u0443 \u043f\u043e \u0444\u043e\u0442\u043e\u0433\u0440\u0430\u0444\u0438\u0438, \u043a\u043e\u0442\u043e\u0440\u0430\u044f \u0431\u044b\u043b\u0430 \u0432 \u043d\u0435\u0439 \u0441\u0434\u0435\u043b\u0430\u043d\u0430"}, "questions": {"question": [{"@price": "200", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "greatbrit.png"}}}, "right": {"answer": "\u0412\u0435\u043b\u0438\u043a\u043e\u0431\u0440\u0438\u0442\u0430\u043d\u0438\u044f"}}, {"@price": "400", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "braz.png"}}}, "right": {"answer": "\u0411\u0440\u0430\u0437\u0438\u043b\u0438\u044f"}}, {"@price": "600", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "norkor_1.png"}}}, "right": {"answer": "\u0421\u0435\u0432\u0435\u0440\u043d\u0430\u044f \u041a\u043e\u0440\u0435\u044f"}}, {"@price": "800", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "iord.png"}}}, "right": {"answer": "\u0418\u043e\u0440\u0434\u0430\u043d\u0438\u044f"}}, {"@price": "1000", "@type": "noRisk", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "austral.png"}}}, "right": {"answer": "\u0410\u0432\u0441\u0442\u0440\u0430\u043b\u0438\u044f"}}]}}, {"@name": "\u041f\u043e\u043b\u044c\u0441\u043a\u0438\u0435 \u043d\u0430\u0437\u0432\u0430\u043d\u0438\u044f", "info": {"comments": "\u041d\u0430\u0437\u043e\u0432\u0438\u0442\u0435 \u044d\u0442\u043e\u0442 \u0444\u0438\u043b\u044c\u043c \u0438\u043b\u0438 \u043c\u0443\u043b\u044c\u0442\u0444\u0438\u043b\u044c\u043c \u043f\u043e-\u0440\u0443\u0441\u0441\u043a\u0438."}, "questions": {"question": [{"@price": "200", "params": {"param": {"@name": "question", "@type": "content", "item": "Czas Apokalipsy (1979)"}}, "right": {"answer": "\u0410\u043f\u043e\u043a\u0430\u043b\u0438\u043f\u0441\u0438\u0441 \u0441\u0435\u0433\u043e\u0434\u043d\u044f"}}, {"@price": "400", "params": {"param": {"@name": "question", "@type": "content", "item": "Kevin sam w domu (1990)"}}, "right": {"answer": "\u041e\u0434\u0438\u043d \u0434\u043e\u043c\u0430"}}, {"@price": "600", "params": {"param": {"@name": "question", "@type": "content", "item": "Teksa\u0144ska masakra pi\u0142\u0105 mechaniczn\u0105 (1974)"}}, "right": {"answer": "\u0422\u0435\u0445\u0430\u0441\u0441\u043a\u0430\u044f \u0440\u0435\u0437\u043d\u044f \u0431\u0435\u043d\u0437\u043e\u043f\u0438\u043b\u043e\u0439"}}, {"@price": "800", "params": {"param": {"@name": "question", "@type": "content", "item": "Upi\u00f3r w operze (2004)"}}, "right": {"answer": "\u041f\u0440\u0438\u0437\u0440\u0430\u043a \u043e\u043f\u0435\u0440\u044b"}}, {"@price": "1000", "params": {"param": {"@name": "question", "@type": "content", "item": "Jak wytresowa\u0107 smoka (2010)"}}, "right": {"answer": "\u041a\u0430\u043a \u043f\u0440\u0438\u0440\u0443\u0447\u0438\u0442\u044c \u0434\u0440\u0430\u043a\u043e\u043d\u0430"}}]}}, {"@name": "\u0421\u0442\u0430\u0440\u044b\u0435 \u0441\u0435\u0440\u0438\u0430\u043b\u044b \u0421\u0422\u0421", "info": {"comments": "\u041d\u0430\u0437\u043e\u0432\u0438\u0442\u0435 \u0441\u0435\u0440\u0438\u0430\u043b"}, "questions": {"question": [{"@price": "200", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "kuhnya.png"}}}, "right": {"answer": "\u041a\u0443\u0445\u043d\u044f"}}, {"@price": "400", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "papdoch.png"}}}, "right": {"answer": "\u041f\u0430\u043f\u0438\u043d\u044b \u0434\u043e\u0447\u043a\u0438"}}, {"@price": "600", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "molod.png"}}}, "right": {"answer": "\u041c\u043e\u043b\u043e\u0434\u0435\u0436\u043a\u0430"}}, {"@price": "800", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "80.png"}}}, "right": {"answer": "\u0412\u043e\u0441\u044c\u043c\u0438\u0434\u0435\u0441\u044f\u0442\u044b\u0435"}}, {"@price": "1000", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "nerodk.png"}}}, "right": {"answer": "\u041d\u0435 \u0440\u043e\u0434\u0438\u0441\u044c \u043a\u0440\u0430\u0441\u0438\u0432\u043e\u0439"}}]}}, {"@name": "\u0411\u043e\u043b\u0435\u0437\u043d\u0438", "info": {"comments": "\u041d\u0430\u0437\u043e\u0432\u0438\u0442\u0435 \u0431\u043e\u043b\u0435\u0437\u043d\u044c"}, "questions": {"question": [{"@price": "200", "params": {"param": {"@name": "question", "@type": "content", "item": "\u0412\u0440\u043e\u0436\u0434\u0435\u043d\u043d\u0430\u044f \u0445\u0440\u043e\u043c\u043e\u0441\u043e\u043c\u043d\u0430\u044f \u0430\u043d\u043e\u043c\u0430\u043b\u0438\u044f, \u0437\u0430\u043a\u043b\u044e\u0447\u0430\u044e\u0449\u0430\u044f\u0441\u044f \u0432 \u043d\u0430\u043b\u0438\u0447\u0438\u0438 \u043b\u0438\u0448\u043d\u0435\u0439 \u0445\u0440\u043e\u043c\u043e\u0441\u043e\u043c\u044b \u0432 21-\u0439 \u043f\u0430\u0440\u0435"}}, "right": {"answer": "\u0421\u0438\u043d\u0434\u0440\u043e\u043c \u0414\u0430\u0443\u043d\u0430"}}, {"@price": "400", "@type": "noRisk", "params": {"param": {"@name": "question", "@type": "content", "item": "\u0417\u0430\u0431\u043e\u043b\u0435\u0432\u0430\u043d\u0438\u0435, \u043a\u043e\u0442\u043e\u0440\u043e\u0435 \u0445\u0430\u0440\u0430\u043a\u0442\u0435\u0440\u0438\u0437\u0443\u0435\u0442\u0441\u044f \u0432\u0430\u0440\u0438\u043a\u043e\u0437\u043d\u044b\u043c \u0440\u0430\u0441\u0448\u0438\u0440\u0435\u043d\u0438\u0435\u043c \u0432\u0435\u043d \u0438 \u043f\u043e\u044f\u0432\u043b\u0435\u043d\u0438\u0435\u043c \u0432\u0435\u043d\u043e\u0437\u043d\u044b\u0445 \u0443\u0437\u043b\u043e\u0432 \u0432 \u043d\u0438\u0436\u043d\u0435\u0439 \u0447\u0430\u0441\u0442\u0438 \u043f\u0440\u044f\u043c\u043e\u0439 \u043a\u0438\u0448\u043a\u0438"}}, "right": {"answer": "\u0413\u0435\u043c\u043e\u0440\u0440\u043e\u0439"}}, {"@price": "600", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041e\u0441\u0442\u0440\u0430\u044f \u043a\u0438\u0448\u0435\u0447\u043d\u0430\u044f \u0430\u043d\u0442\u0440\u043e\u043f\u043e\u043d\u043e\u0437\u043d\u0430\u044f \u0438\u043d\u0444\u0435\u043a\u0446\u0438\u044f. \u0420\u0430\u0441\u043f\u0440\u043e\u0441\u0442\u0440\u0430\u043d\u044f\u0435\u0442\u0441\u044f, \u043a\u0430\u043a \u043f\u0440\u0430\u0432\u0438\u043b\u043e, \u0432 \u0444\u043e\u0440\u043c\u0435 \u044d\u043f\u0438\u0434\u0435\u043c\u0438\u0439. \u042d\u043d\u0434\u0435\u043c\u0438\u0447\u0435\u0441\u043a\u0438\u0435 \u043e\u0447\u0430\u0433\u0438 \u0440\u0430\u0441\u043f\u043e\u043b\u0430\u0433\u0430\u044e\u0442\u0441\u044f \u0432 \u0410\u0444\u0440\u0438\u043a\u0435, \u042e\u0436\u043d\u043e\u0439 \u0410\u043c\u0435\u0440\u0438\u043a\u0435, \u0418\u043d\u0434\u0438\u0438 \u0438 \u042e\u0433\u043e-\u0412\u043e\u0441\u0442\u043e\u0447\u043d\u043e\u0439 \u0410\u0437\u0438\u0438."}}, "right": {"answer": "\u0425\u043e\u043b\u0435\u0440\u0430"}}, {"@price": "800", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041f\u0430\u0442\u043e\u043b\u043e\u0433\u0438\u0447\u0435\u0441\u043a\u043e\u0435 \u0441\u043e\u0441\u0442\u043e\u044f\u043d\u0438\u0435, \u0445\u0430\u0440\u0430\u043a\u0442\u0435\u0440\u0438\u0437\u0443\u044e\u0449\u0435\u0435\u0441\u044f \u043e\u0441\u0442\u0440\u044b\u043c \u043d\u0430\u0440\u0443\u0448\u0435\u043d\u0438\u0435\u043c \u043a\u0440\u043e\u0432\u043e\u0441\u043d\u0430\u0431\u0436\u0435\u043d\u0438\u044f \u0433\u043e\u043b\u043e\u0432\u043d\u043e\u0433\u043e \u043c\u043e\u0437\u0433\u0430 \u0438 \u043f\u043e\u0432\u0440\u0435\u0436\u0434\u0435\u043d\u0438\u0435\u043c \u0442\u043a\u0430\u043d\u0435\u0439 \u043e\u0440\u0433\u0430\u043d\u0430"}}, "right": {"answer": "\u0418\u043d\u0441\u0443\u043b\u044c\u0442"}}, {"@price": "1000", "params": {"param": {"@name": "question", "@type": "content", "item": "\u0418\u043d\u0444\u0435\u043a\u0446\u0438\u043e\u043d\u043d\u043e\u0435 \u0437\u0430\u0431\u043e\u043b\u0435\u0432\u0430\u043d\u0438\u0435, \u043a\u043e\u0442\u043e\u0440\u043e\u0435 \u0432\u044b\u0437\u044b\u0432\u0430\u044e\u0442 \u043c\u0438\u043a\u0440\u043e\u0441\u043a\u043e\u043f\u0438\u0447\u0435\u0441\u043a\u0438\u0435 \u0434\u0440\u043e\u0436\u0436\u0435\u043f\u043e\u0434\u043e\u0431\u043d\u044b\u0435 \u0433\u0440\u0438\u0431\u044b \u0440\u043e\u0434\u0430 \u043a\u0430\u043d\u0434\u0438\u0434\u0430"}}, "right": {"answer": "\u041a\u0430\u043d\u0434\u0438\u0434\u043e\u0437"}}]}}]}}, {"@name": "\u041f\u0438\u0440\u0443\u0435\u043c", "themes": {"theme": [{"@name": "AI \u0433\u043e\u0431\u0435\u043b\u0435\u043d\u044b", "info": {"comments": "\u0427\u0435\u0439 \u0433\u043e\u043b\u043e\u0441 \u0438\u0441\u043f\u043e\u043b\u044c\u0437\u043e\u0432\u0430\u043d \u0434\u043b\u044f \u043a\u0430\u0432\u0435\u0440\u0430?"}, "questions": {"question": [{"@price": "300", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "audio", "@isRef": "True", "#text": "\u041c\u0430\u043a\u0441\u0438\u043c \u041a\u0430\u0446 - \u042f \u0420\u0423\u0421\u0421\u041a\u0418\u0419.mp3"}}}, "right": {"answer": "\u041c\u0430\u043a\u0441\u0438\u043c \u041a\u0430\u0446 - \u042f \u0420\u0423\u0421\u0421\u041a\u0418\u0419"}}, {"@price": "600", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "audio", "@isRef": "True", "#text": "\u0422\u0435\u0441\u0430\u043a - \u0412\u043e\u0441\u044c\u043c\u0438\u043a\u043b\u0430\u0441\u0441\u043d\u0438\u0446\u0430.mp3"}}}, "right": {"answer": "\u0422\u0435\u0441\u0430\u043a - \u0412\u043e\u0441\u044c\u043c\u0438\u043a\u043b\u0430\u0441\u0441\u043d\u0438\u0446\u0430"}}, {"@price": "900", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "audio", "@isRef": "True", "#text": "Stardust Crusaders - \u041d\u0438\u0447\u0435\u0433\u043e \u043d\u0430 \u0441\u0432\u0435\u0442\u0435 \u043b\u0443\u0447\u0448\u0435 \u043d\u0435\u0442\u0443 .mp3"}}}, "right": {"answer": "Stardust Crusaders - \u041d\u0438\u0447\u0435\u0433\u043e \u043d\u0430 \u0441\u0432\u0435\u0442\u0435 \u043b\u0443\u0447\u0448\u0435 \u043d\u0435\u0442\u0443"}}, {"@price": "1200", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "audio", "@isRef": "True", "#text": "Eric Cartman - Take On Me.mp3"}}}, "right": {"answer": "Eric Cartman - Take On Me"}}, {"@price": "1500", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "audio", "@isRef": "True", "#text": "Lain - Boa Duvet.mp3"}}}, "right": {"answer": "Lain - Boa Duvet"}}]}}, {"@name": "\u0414\u0435\u0448\u0435\u0432\u043e\u0435 \u043f\u0438\u0432\u043e", "info": {"comments": "\u041d\u0430\u0437\u043e\u0432\u0438\u0442\u0435 \u043c\u0430\u0440\u043a\u0443 \u0438\u0437\u043e\u0431\u0440\u0430\u0436\u0435\u043d\u043d\u043e\u0433\u043e \u043f\u0438\u0432\u0430"}, "questions": {"question": [{"@price": "300", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "whitebear.png"}}}, "right": {"answer": "\u0411\u0435\u043b\u044b\u0439 \u043c\u0435\u0434\u0432\u0435\u0434\u044c"}}, {"@price": "600", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "oldmelnik.png"}}}, "right": {"answer": "\u0421\u0442\u0430\u0440\u044b\u0439 \u043c\u0435\u043b\u044c\u043d\u0438\u043a"}}, {"@price": "900", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "halzan.png"}}}, "right": {"answer": "\u0425\u0430\u043b\u0437\u0430\u043d"}}, {"@price": "1200", "@type": "stake", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "jigu.png"}}}, "right": {"answer": "\u0416\u0438\u0433\u0443\u043b\u0435\u0432\u0441\u043a\u043e\u0435"}}, {"@price": "1500", "@type": "secretPublicPrice", "params": {"param": [{"@name": "question", "@type": "content", "item": "\u041b\u043e\u043a\u0430\u043b\u044c\u043d\u044b\u0439 \u0432\u043e\u043e\u0440\u0443\u0436\u0451\u043d\u043d\u044b\u0439 \u043a\u043e\u043d\u0444\u043b\u0438\u043a\u0442 \u043c\u0435\u0436\u0434\u0443 \u0441\u043e\u0432\u0435\u0442\u0441\u043a\u043e-\u043c\u043e\u043d\u0433\u043e\u043b\u044c\u0441\u043a\u0438\u043c\u0438 \u0432\u043e\u0439\u0441\u043a\u0430\u043c\u0438 \u0438 \u0412\u043e\u043e\u0440\u0443\u0436\u0451\u043d\u043d\u044b\u043c\u0438 \u0441\u0438\u043b\u0430\u043c\u0438 \u042f\u043f\u043e\u043d\u0438\u0438. \u041a\u043e\u043d\u0444\u043b\u0438\u043a\u0442 \u043f\u0440\u043e\u0434\u043e\u043b\u0436\u0430\u043b\u0441\u044f \u0441 \u0432\u0435\u0441\u043d\u044b \u043f\u043e \u043e\u0441\u0435\u043d\u044c 1939 \u0433\u043e\u0434\u0430 \u043d\u0430 \u0442\u0435\u0440\u0440\u0438\u0442\u043e\u0440\u0438\u0438 \u041c\u043e\u043d\u0433\u043e\u043b\u0438\u0438. \u041a\u0430\u043a \u043d\u0430\u0437\u044b\u0432\u0430\u043b\u0441\u044f \u043a\u043e\u043d\u0444\u043b\u0438\u043a\u0442 ?"}, {"@name": "selectionMode", "#text": "exceptCurrent"}, {"@name": "price", "@type": "numberSet", "numberSet": {"@minimum": "1000", "@maximum": "1000", "@step": "0"}}, {"@name": "theme", "#text": "\u0418\u0441\u0442\u043e\u0440\u0438\u044f"}]}, "right": {"answer": "\u0421\u0440\u0430\u0436\u0435\u043d\u0438\u0435 \u043d\u0430 \u0425\u0430\u043b\u0445\u0438\u043d-\u0413\u043e\u043b\u0435 | \u0418\u043d\u0446\u0438\u0434\u0435\u043d\u0442 \u0443 \u041d\u043e\u043c\u043e\u043d-\u0425\u0430\u043d\u0430"}}]}}, {"@name": "\u0415\u0434\u0430 \u0438\u0437 \u0432\u0438\u043a\u0438\u043f\u0435\u0434\u0438\u0438", "info": {"comments": "\u041d\u0443\u0436\u043d\u043e \u0443\u0433\u0430\u0434\u0430\u0442\u044c \u043d\u0430\u0437\u0432\u0430\u043d\u0438\u0435 \u0431\u043b\u044e\u0434\u0430 \u043f\u043e \u0435\u0433\u043e \u043e\u043f\u0440\u0435\u0434\u0435\u043b\u0435\u043d\u0438\u044e \u0438\u0437 \u0432\u0438\u043a\u0438\u043f\u0435\u0434\u0438\u0438."}, "questions": {"question": [{"@price": "300", "params": {"param": {"@name": "question", "@type": "content", "item": "\u0411\u043b\u044e\u0434\u043e, \u043f\u0440\u0438\u0433\u043e\u0442\u043e\u0432\u043b\u044f\u0435\u043c\u043e\u0435 \u043d\u0430 \u0441\u043a\u043e\u0432\u043e\u0440\u043e\u0434\u0435 \u0438\u0437 \u0440\u0430\u0437\u0431\u0438\u0442\u044b\u0445 \u044f\u0438\u0446."}}, "right": {"answer": "\u042f\u0438\u0447\u043d\u0438\u0446\u0430"}}, {"@price": "600", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041c\u0430\u043a\u0430\u0440\u043e\u043d\u043d\u043e\u0435 \u0438\u0437\u0434\u0435\u043b\u0438\u0435, \u0442\u043e\u043d\u043a\u0438\u0439 \u043b\u0438\u0441\u0442 \u0442\u0435\u0441\u0442\u0430 \u0432 \u0444\u043e\u0440\u043c\u0435 \u043a\u0432\u0430\u0434\u0440\u0430\u0442\u0430 \u0438\u043b\u0438 \u043f\u0440\u044f\u043c\u043e\u0443\u0433\u043e\u043b\u044c\u043d\u0438\u043a\u0430, \u0430 \u0442\u0430\u043a\u0436\u0435 \u0431\u043b\u044e\u0434\u043e \u0438\u0442\u0430\u043b\u044c\u044f\u043d\u0441\u043a\u043e\u0439 \u043a\u0443\u0445\u043d\u0438, \u0442\u0440\u0430\u0434\u0438\u0446\u0438\u043e\u043d\u043d\u043e \u043f\u0440\u0438\u0433\u043e\u0442\u043e\u0432\u043b\u044f\u0435\u043c\u043e\u0435 \u0438\u0437 \u0442\u043e\u043d\u043a\u0438\u0445 \u043b\u0438\u0441\u0442\u043e\u0432 \u0442\u0435\u0441\u0442\u0430 \u0441\u043e \u0441\u043b\u043e\u044f\u043c\u0438 \u0440\u0430\u0437\u043b\u0438\u0447\u043d\u043e\u0439 \u043d\u0430\u0447\u0438\u043d\u043a\u0438."}}, "right": {"answer": "\u041b\u0430\u0437\u0430\u043d\u044c\u044f"}}, {"@price": "900", "params": {"param": {"@name": "question", "@type": "content", "item": "\u0422\u0440\u0430\u0434\u0438\u0446\u0438\u043e\u043d\u043d\u043e\u0435 \u043e\u0432\u043e\u0449\u043d\u043e\u0435 \u0431\u043b\u044e\u0434\u043e \u043f\u0440\u043e\u0432\u0430\u043d\u0441\u043a\u043e\u0439 \u043a\u0443\u0445\u043d\u0438 \u0438\u0437 \u043f\u0435\u0440\u0446\u0430, \u0431\u0430\u043a\u043b\u0430\u0436\u0430\u043d\u043e\u0432 \u0438 \u043a\u0430\u0431\u0430\u0447\u043a\u043e\u0432, \u0432\u043e \u043c\u043d\u043e\u0433\u043e\u043c \u043f\u043e\u0445\u043e\u0436\u0435\u0435 \u043d\u0430 \u0432\u0435\u043d\u0433\u0435\u0440\u0441\u043a\u043e\u0435 \u043b\u0435\u0447\u043e."}}, "right": {"answer": "\u0420\u0430\u0442\u0430\u0442\u0443\u0439"}}, {"@price": "1200", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041f\u043e\u043f\u0443\u043b\u044f\u0440\u043d\u043e\u0435 \u0441\u0440\u0435\u0434\u043d\u0435\u0430\u0437\u0438\u0430\u0442\u0441\u043a\u043e\u0435 \u043d\u0430\u0446\u0438\u043e\u043d\u0430\u043b\u044c\u043d\u043e\u0435 \u0431\u043b\u044e\u0434\u043e \u0443\u0439\u0433\u0443\u0440\u043e\u0432 \u0438 \u0434\u0443\u043d\u0433\u0430\u043d, \u043f\u0440\u043e\u0436\u0438\u0432\u0430\u044e\u0449\u0438\u0445 \u0432 \u041a\u0430\u0437\u0430\u0445\u0441\u0442\u0430\u043d\u0435, \u041a\u0438\u0440\u0433\u0438\u0437\u0438\u0438 \u0438 \u041a\u0438\u0442\u0430\u0435 (\u0421\u0438\u043d\u044c\u0446\u0437\u044f\u043d), \u043a\u0438\u0442\u0430\u0439\u0446\u0435\u0432, \u043e\u0441\u043e\u0431\u0435\u043d\u043d\u043e \u0432 \u043f\u0440\u043e\u0432\u0438\u043d\u0446\u0438\u044f\u0445 \u0413\u0430\u043d\u044c\u0441\u0443 \u0438 \u0426\u0438\u043d\u0445\u0430\u0439, \u0430 \u0442\u0430\u043a\u0436\u0435 \u0443\u0437\u0431\u0435\u043a\u043e\u0432 \u0438 \u043a\u0438\u0440\u0433\u0438\u0437\u043e\u0432. \u0413\u043e\u0442\u043e\u0432\u0438\u0442\u0441\u044f \u0438\u0437 \u043c\u044f\u0441\u0430 (\u043f\u0440\u0435\u0438\u043c\u0443\u0449\u0435\u0441\u0442\u0432\u0435\u043d\u043d\u043e \u0431\u0430\u0440\u0430\u043d\u0438\u043d\u044b), \u043e\u0432\u043e\u0449\u0435\u0439 \u0438 \u0442\u044f\u043d\u0443\u0442\u043e\u0439 \u0434\u043b\u0438\u043d\u043d\u043e\u0439 \u043b\u0430\u043f\u0448\u0438."}}, "right": {"answer": "\u041b\u0430\u0433\u043c\u0430\u043d"}}, {"@price": "1500", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041f\u043e\u043f\u0443\u043b\u044f\u0440\u043d\u043e\u0435 \u044f\u043f\u043e\u043d\u0441\u043a\u043e\u0435 \u0431\u043b\u044e\u0434\u043e, \u0448\u0430\u0440\u0438\u043a\u0438 \u0438\u0437 \u0436\u0438\u0434\u043a\u043e\u0433\u043e \u0442\u0435\u0441\u0442\u0430 \u0441 \u043d\u0430\u0447\u0438\u043d\u043a\u043e\u0439 \u0438\u0437 \u043e\u0442\u0432\u0430\u0440\u043d\u043e\u0433\u043e \u043e\u0441\u044c\u043c\u0438\u043d\u043e\u0433\u0430 \u0438 \u0434\u0440\u0443\u0433\u0438\u0445 \u0438\u043d\u0433\u0440\u0435\u0434\u0438\u0435\u043d\u0442\u043e\u0432 (\u0437\u0435\u043b\u0451\u043d\u044b\u0439 \u043b\u0443\u043a, \u0442\u044d\u043d\u043a\u0430\u0441\u0443, \u0438\u043c\u0431\u0438\u0440\u044c \u0438 \u0442.\u043f.). \u0416\u0430\u0440\u044f\u0442\u0441\u044f \u0432 \u0441\u043f\u0435\u0446\u0438\u0430\u043b\u044c\u043d\u043e\u0439 \u0441\u043a\u043e\u0432\u043e\u0440\u043e\u0434\u0435 \u0441 \u043f\u043e\u043b\u0443\u0441\u0444\u0435\u0440\u0438\u0447\u0435\u0441\u043a\u0438\u043c\u0438 \u0432\u044b\u0435\u043c\u043a\u0430\u043c\u0438 \u0438 \u043f\u043e\u0434\u0430\u044e\u0442\u0441\u044f \u043f\u043e \u043d\u0435\u0441\u043a\u043e\u043b\u044c\u043a\u043e \u0448\u0442\u0443\u043a \u0432 \u0432\u044b\u0442\u044f\u043d\u0443\u0442\u043e\u0439 \u0442\u0430\u0440\u0435\u043b\u043a\u0435 \u0438\u043b\u0438, \u0432 \u0444\u0430\u0441\u0442\u0444\u0443\u0434\u0435, \u0432 \u043f\u043b\u043e\u0441\u043a\u043e\u0439 \u043a\u043e\u0440\u043e\u0431\u043a\u0435 \u0438\u0437 \u043f\u0438\u0449\u0435\u0432\u043e\u0433\u043e \u043a\u0430\u0440\u0442\u043e\u043d\u0430, \u043a\u0430\u043a \u043f\u0440\u0430\u0432\u0438\u043b\u043e \u043f\u043e\u043b\u0438\u0442\u044b\u043c\u0438 \u0441\u043f\u0435\u0446\u0438\u0430\u043b\u044c\u043d\u044b\u043c \u0441\u043e\u0443\u0441\u043e\u043c, \u043c\u0430\u0439\u043e\u043d\u0435\u0437\u043e\u043c \u0438 \u043f\u043e\u0441\u044b\u043f\u0430\u043d\u043d\u044b\u043c\u0438 \u0432 \u043a\u0430\u0447\u0435\u0441\u0442\u0432\u0435 \u0434\u043e\u043f\u043e\u043b\u043d\u0438\u0442\u0435\u043b\u044c\u043d\u043e\u0439 \u043f\u0440\u0438\u043f\u0440\u0430\u0432\u044b \u0430\u043e\u043d\u043e\u0440\u0438 \u0438 \u0442\u0443\u043d\u0446\u043e\u0432\u043e\u0439 \u0441\u0442\u0440\u0443\u0436\u043a\u043e\u0439 \u043a\u0430\u0446\u0443\u043e\u0431\u0443\u0441\u0438. \u0421\u0447\u0438\u0442\u0430\u044e\u0442\u0441\u044f \u0441\u0442\u0435\u0440\u0435\u043e\u0442\u0438\u043f\u043d\u043e\u0439 \u0443\u043b\u0438\u0447\u043d\u043e\u0439 \u0437\u0430\u043a\u0443\u0441\u043a\u043e\u0439 \u0432 \u041e\u0441\u0430\u043a\u0435 (\u0433\u0434\u0435 \u043e\u043d\u0438 \u0431\u044b\u043b\u0438 \u043f\u0440\u0438\u0434\u0443\u043c\u0430\u043d\u044b) \u0438 \u0417\u0430\u043f\u0430\u0434\u043d\u043e\u0439 \u042f\u043f\u043e\u043d\u0438\u0438 \u0432\u043e\u043e\u0431\u0449\u0435, \u0445\u043e\u0442\u044f \u0432 \u043f\u043e\u0441\u043b\u0435\u0434\u043d\u0435\u0435 \u0432\u0440\u0435\u043c\u044f \u043f\u0440\u0438\u043e\u0431\u0440\u0435\u043b\u0438 \u043e\u0431\u0449\u0435\u043d\u0430\u0446\u0438\u043e\u043d\u0430\u043b\u044c\u043d\u0443\u044e \u043f\u043e\u043f\u0443\u043b\u044f\u0440\u043d\u043e\u0441\u0442\u044c."}}, "right": {"answer": "\u0422\u0430\u043a\u043e\u044f\u043a\u0438"}}]}}, {"@name": "\u0416\u0435\u0441\u0442\u043a\u043e \u043e\u0442\u0432\u0435\u0442\u0438\u043b", "info": {"comments": "\u0412\u043e\u0441\u043f\u0440\u043e\u0438\u0437\u0432\u0435\u0434\u0438\u0442\u0435 \u044d\u0442\u043e\u0442 \u0436\u0435\u0441\u0442\u043a\u0438\u0439 \u043e\u0442\u0432\u0435\u0442"}, "questions": {"question": [{"@price": "300", "params": {"param": {"@name": "question", "@type": "content", "item": "\u0420\u0430\u0441\u0441\u043a\u0430\u0437\u044b\u0432\u0430\u043b\u0438, \u0447\u0442\u043e \u043e\u0434\u043d\u0430\u0436\u0434\u044b \u0424\u0438\u043b\u0438\u043f\u043f II, \u043c\u0430\u043a\u0435\u0434\u043e\u043d\u0441\u043a\u0438\u0439 \u0446\u0430\u0440\u044c, \u043d\u0430\u043f\u0438\u0441\u0430\u043b \u0438 \u043e\u0442\u043f\u0440\u0430\u0432\u0438\u043b \u0441\u043f\u0430\u0440\u0442\u0430\u043d\u0446\u0430\u043c \u0432\u043e\u0442 \u0442\u0430\u043a\u043e\u0433\u043e \u0441\u043e\u0434\u0435\u0440\u0436\u0430\u043d\u0438\u044f \u043f\u0438\u0441\u044c\u043c\u043e:\n\"\u042f \u043f\u043e\u043a\u043e\u0440\u0438\u043b \u0432\u0441\u044e \u0413\u0440\u0435\u0446\u0438\u044e, \u0443 \u043c\u0435\u043d\u044f \u0441\u0430\u043c\u043e\u0435 \u043b\u0443\u0447\u0448\u0435\u0435 \u0432 \u043c\u0438\u0440\u0435 \u0432\u043e\u0439\u0441\u043a\u043e. \u0421\u0434\u0430\u0432\u0430\u0439\u0442\u0435\u0441\u044c, \u043f\u043e\u0442\u043e\u043c\u0443 \u0447\u0442\u043e \u0435\u0441\u043b\u0438 \u044f \u0437\u0430\u0445\u0432\u0430\u0447\u0443 \u0421\u043f\u0430\u0440\u0442\u0443 \u0441\u0438\u043b\u043e\u0439, \u0435\u0441\u043b\u0438 \u044f \u0441\u043b\u043e\u043c\u0430\u044e \u0435\u0435 \u0432\u043e\u0440\u043e\u0442\u0430, \u0435\u0441\u043b\u0438 \u044f \u043f\u0440\u043e\u0431\u044c\u044e \u0442\u0430\u0440\u0430\u043d\u0430\u043c\u0438 \u0435\u0435 \u0441\u0442\u0435\u043d\u044b, \u0442\u043e \u0431\u0435\u0441\u043f\u043e\u0449\u0430\u0434\u043d\u043e \u0443\u043d\u0438\u0447\u0442\u043e\u0436\u0443 \u0432\u0430\u0448\u0438 \u0441\u0430\u0434\u044b, \u043f\u043e\u0440\u0430\u0431\u043e\u0449\u0443 \u043b\u044e\u0434\u0435\u0439 \u0438 \u0440\u0430\u0437\u0440\u0443\u0448\u0443 \u0433\u043e\u0440\u043e\u0434!\".\n\u0421\u043f\u0430\u0440\u0442\u0430\u043d\u0446\u044b \u043e\u0442\u0432\u0435\u0442\u0438\u043b\u0438 \u043e\u0434\u043d\u0438\u043c \u0441\u043b\u043e\u0432\u043e\u043c:"}}, "right": {"answer": "\u0415\u0441\u043b\u0438"}}, {"@price": "600", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041b\u0435\u0433\u0435\u043d\u0434\u0430 \u0433\u043b\u0430\u0441\u0438\u0442, \u0447\u0442\u043e \u041c\u0430\u0440\u0438\u044f-\u0410\u043d\u0442\u0443\u0430\u043d\u0435\u0442\u0442\u0430, \u0431\u0443\u0434\u0443\u0447\u0438 \u0443\u0436\u0435 \u0444\u0440\u0430\u043d\u0446\u0443\u0437\u0441\u043a\u043e\u0439 \u043a\u043e\u0440\u043e\u043b\u0435\u0432\u043e\u0439, \u043f\u043e\u0438\u043d\u0442\u0435\u0440\u0435\u0441\u043e\u0432\u0430\u043b\u0430\u0441\u044c, \u0447\u0435\u0433\u043e \u0436\u0435 \u0445\u043e\u0447\u0435\u0442 \u043f\u043e\u0441\u0442\u043e\u044f\u043d\u043d\u043e \u0431\u0443\u043d\u0442\u0443\u044e\u0449\u0430\u044f \u043f\u0430\u0440\u0438\u0436\u0441\u043a\u0430\u044f \u0447\u0435\u0440\u043d\u044c. \u0418, \u043f\u043e\u043b\u0443\u0447\u0438\u0432 \u043e\u0442\u0432\u0435\u0442: \"\u0423 \u044d\u0442\u0438\u0445 \u043b\u044e\u0434\u0435\u0439 \u043d\u0435\u0442 \u0445\u043b\u0435\u0431\u0430\", \u0437\u0430\u044f\u0432\u0438\u043b\u0430:"}}, "right": {"answer": "\u0415\u0441\u043b\u0438 \u0443 \u043d\u0438\u0445 \u043d\u0435\u0442 \u0445\u043b\u0435\u0431\u0430, \u043f\u0443\u0441\u0442\u044c \u0435\u0434\u044f\u0442 \u043f\u0438\u0440\u043e\u0436\u043d\u044b\u0435"}}, {"@price": "900", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041a\u0430\u043a-\u0442\u043e, \u0432\u044b\u0441\u0442\u0443\u043f\u0430\u044f \u0432 \u041f\u043e\u043b\u0438\u0442\u0435\u0445\u0435 \u043d\u0430 \u0434\u0438\u0441\u043f\u0443\u0442\u0435 \u043e \u043f\u0440\u043e\u043b\u0435\u0442\u0430\u0440\u0441\u043a\u043e\u043c \u0438\u043d\u0442\u0435\u0440\u043d\u0430\u0446\u0438\u043e\u043d\u0430\u043b\u0438\u0437\u043c\u0435, \u0412\u043b\u0430\u0434\u0438\u043c\u0438\u0440 \u041c\u0430\u044f\u043a\u043e\u0432\u0441\u043a\u0438\u0439 \u0441\u043a\u0430\u0437\u0430\u043b:\n\u2014 \u0421\u0440\u0435\u0434\u0438 \u0440\u0443\u0441\u0441\u043a\u0438\u0445 \u044f \u0447\u0443\u0432\u0441\u0442\u0432\u0443\u044e \u0441\u0435\u0431\u044f \u0440\u0443\u0441\u0441\u043a\u0438\u043c, \u0441\u0440\u0435\u0434\u0438 \u0433\u0440\u0443\u0437\u0438\u043d \u2014 \u0433\u0440\u0443\u0437\u0438\u043d\u043e\u043c...\n\u2014 \u0410 \u0441\u0440\u0435\u0434\u0438 \u0434\u0443\u0440\u0430\u043a\u043e\u0432? \u2014 \u0432\u0434\u0440\u0443\u0433 \u043a\u0442\u043e-\u0442\u043e \u0432\u044b\u043a\u0440\u0438\u043a\u043d\u0443\u043b \u0438\u0437 \u0437\u0430\u043b\u0430, \u043d\u0430 \u0447\u0442\u043e \u041c\u0430\u044f\u043a\u043e\u0432\u0441\u043a\u0438\u0439 \u043c\u0433\u043d\u043e\u0432\u0435\u043d\u043d\u043e \u043e\u0442\u0432\u0435\u0442\u0438\u043b: ..."}}, "right": {"answer": "\u0410 \u0441\u0440\u0435\u0434\u0438 \u0434\u0443\u0440\u0430\u043a\u043e\u0432 \u044f \u0432\u043f\u0435\u0440\u0432\u044b\u0435."}}, {"@price": "1200", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041a\u043e\u0433\u0434\u0430 \u0438\u043c\u043f\u0435\u0440\u0430\u0442\u043e\u0440 \u0440\u0438\u043c\u0441\u043a\u043e\u0439 \u0438\u043c\u043f\u0435\u0440\u0438\u0438 \u0412\u0435\u0441\u043f\u0430\u0441\u0438\u0430\u043d \u0432\u0432\u0435\u043b \u043f\u043b\u0430\u0442\u0443 \u0437\u0430 \u043f\u043e\u043b\u044c\u0437\u043e\u0432\u0430\u043d\u0438\u0435 \u0433\u043e\u0440\u043e\u0434\u0441\u043a\u0438\u043c\u0438 \u043e\u0431\u0449\u0435\u0441\u0442\u0432\u0435\u043d\u043d\u044b\u043c\u0438 \u0442\u0443\u0430\u043b\u0435\u0442\u0430\u043c\u0438 (\u0434\u043e \u0441\u0438\u0445 \u043f\u043e\u0440 \u0431\u044b\u0432\u0448\u0438\u043c\u0438 \u0431\u0435\u0441\u043f\u043b\u0430\u0442\u043d\u044b\u043c\u0438), \u0434\u0430\u0436\u0435 \u0435\u0433\u043e \u0441\u043e\u0431\u0441\u0442\u0432\u0435\u043d\u043d\u044b\u0439 \u0441\u044b\u043d \u0422\u0438\u0442 \u0432\u043e\u0437\u043c\u0443\u0442\u0438\u043b\u0441\u044f \u0438 \u0441\u043f\u0440\u043e\u0441\u0438\u043b \u043f\u0430\u043f\u0443, \u043d\u0435 \u043a\u0430\u0436\u0435\u0442\u0441\u044f \u043b\u0438 \u0435\u043c\u0443, \u0447\u0442\u043e \u044d\u0442\u043e \u0443\u0436\u0435 \u0447\u0435\u0440\u0435\u0441\u0447\u0443\u0440. \u0422\u043e\u0433\u0434\u0430 \u0412\u0435\u0441\u043f\u0430\u0441\u0438\u0430\u043d ..."}}, "right": {"answer": "...\u0434\u043e\u0441\u0442\u0430\u043b \u0438\u0437 \u043a\u043e\u0448\u0435\u043b\u044c\u043a\u0430 \u043c\u043e\u043d\u0435\u0442\u043a\u0443 \u0438 \u0432\u0435\u043b\u0435\u043b \u0422\u0438\u0442\u0443 \u0435\u0435 \u043f\u043e\u043d\u044e\u0445\u0430\u0442\u044c, \u0447\u0442\u043e\u0431\u044b \u043c\u0430\u043b\u044c\u0447\u0438\u043a \u0443\u0431\u0435\u0434\u0438\u043b\u0441\u044f: \u0434\u0435\u043d\u044c\u0433\u0438, \u043f\u043e\u043b\u0443\u0447\u0435\u043d\u043d\u044b\u0435 \u0438\u0437 \u0441\u043e\u0440\u0442\u0438\u0440\u0430, \u043f\u0430\u0445\u043d\u0443\u0442 \u043d\u0435 \u043c\u0435\u043d\u0435\u0435 \u043f\u0440\u0438\u044f\u0442\u043d\u043e, \u0447\u0435\u043c \u043b\u044e\u0431\u044b\u0435 \u0434\u0440\u0443\u0433\u0438\u0435."}}, {"@price": "1500", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041a\u043e\u0433\u0434\u0430 \u043a\u043e\u0440\u043e\u043b\u0438 \u0443\u043c\u0438\u0440\u0430\u044e\u0442 \u0431\u0435\u0437\u0434\u0435\u0442\u043d\u044b\u043c\u0438, \u0436\u0434\u0438 \u043d\u0435\u0440\u0430\u0437\u0431\u0435\u0440\u0438\u0445\u0438. \u041f\u043e\u0441\u043b\u0435 \u0442\u043e\u0433\u043e \u043a\u0430\u043a \u0432 1579 \u0433\u043e\u0434\u0443 \u043f\u043e\u0433\u0438\u0431 \u0413\u0435\u043d\u0440\u0438\u0445 III, \u0444\u0440\u0430\u043d\u0446\u0443\u0437\u0441\u043a\u0438\u0439 \u043f\u0440\u0435\u0441\u0442\u043e\u043b \u043e\u0441\u0442\u0430\u043b\u0441\u044f \u0432\u0430\u043a\u0430\u043d\u0442\u043d\u044b\u043c, \u0445\u043e\u0442\u044f \u043f\u0435\u0440\u0435\u0434 \u0441\u043c\u0435\u0440\u0442\u044c\u044e \u043a\u043e\u0440\u043e\u043b\u044c \u043e\u0444\u0438\u0446\u0438\u0430\u043b\u044c\u043d\u043e \u043e\u0431\u044a\u044f\u0432\u0438\u043b \u043d\u0430\u0441\u043b\u0435\u0434\u043d\u0438\u043a\u043e\u043c \u0441\u0432\u043e\u0435\u0433\u043e \u0431\u043b\u0438\u0436\u0430\u0439\u0448\u0435\u0433\u043e \u0440\u043e\u0434\u0441\u0442\u0432\u0435\u043d\u043d\u0438\u043a\u0430 \u0413\u0435\u043d\u0440\u0438\u0445\u0430 \u041d\u0430\u0432\u0430\u0440\u0440\u0441\u043a\u043e\u0433\u043e. \u041d\u043e \u043f\u0440\u043e\u0442\u0438\u0432 \u0433\u0443\u0433\u0435\u043d\u043e\u0442\u0430-\u043f\u0440\u043e\u0442\u0435\u0441\u0442\u0430\u043d\u0442\u0430 \u0438\u0437 \u041d\u0430\u0432\u0430\u0440\u0440\u044b \u0432\u043e\u0441\u0441\u0442\u0430\u043b\u043e \u043a\u0430\u0442\u043e\u043b\u0438\u0447\u0435\u0441\u043a\u043e\u0435 \u0431\u043e\u043b\u044c\u0448\u0438\u043d\u0441\u0442\u0432\u043e \u0436\u0438\u0442\u0435\u043b\u0435\u0439 \u0441\u0442\u0440\u0430\u043d\u044b, \u043f\u0440\u0435\u0442\u0435\u043d\u0434\u0435\u043d\u0442\u0430 \u0434\u0430\u0436\u0435 \u043f\u043e\u043f\u044b\u0442\u0430\u043b\u0438\u0441\u044c \u043d\u0435 \u043f\u0443\u0441\u0442\u0438\u0442\u044c \u0432 \u041f\u0430\u0440\u0438\u0436 \u043f\u043e\u0441\u043b\u0435 \u0435\u0433\u043e \u0432\u043e\u0437\u0432\u0440\u0430\u0449\u0435\u043d\u0438\u044f \u0438\u0437 \u0432\u043e\u0435\u043d\u043d\u043e\u0433\u043e \u043f\u043e\u0445\u043e\u0434\u0430. \u0422\u043e\u0433\u0434\u0430 \u0413\u0435\u043d\u0440\u0438\u0445 \u043f\u0435\u0440\u0435\u0448\u0435\u043b \u0432 \u043a\u0430\u0442\u043e\u043b\u0438\u0447\u0435\u0441\u0442\u0432\u043e \u0438 \u043f\u0440\u043e\u0438\u0437\u043d\u0435\u0441 \u0441\u0432\u043e\u044e \u0437\u043d\u0430\u043c\u0435\u043d\u0438\u0442\u0443\u044e \u0444\u0440\u0430\u0437\u0443 \u043e\u0442\u0440\u0435\u0447\u0435\u043d\u0438\u044f \u043e\u0442 \u0432\u0435\u0440\u044b: ..."}}, "right": {"answer": "\u041f\u0430\u0440\u0438\u0436 \u0441\u0442\u043e\u0438\u0442 \u043c\u0435\u0441\u0441\u044b"}}]}}, {"@name": "\u0418\u043c\u0435\u043d\u0430", "info": {"comments": "\u0423\u0433\u0430\u0434\u0430\u0439\u0442\u0435 \u0438\u043c\u044f \u043f\u043e \u0435\u0433\u043e \u044d\u0442\u0438\u043c\u043e\u043b\u043e\u0433\u0438\u0438"}, "questions": {"question": [{"@price": "300", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041f\u0440\u0438\u0448\u043b\u043e \u0438\u0437 \u0414\u0440\u0435\u0432\u043d\u0435\u0439 \u0413\u0440\u0435\u0446\u0438\u0438. \u0412 \u043f\u0435\u0440\u0435\u0432\u043e\u0434\u0435 \u043d\u0430 \u0440\u0443\u0441\u0441\u043a\u0438\u0439 \u044f\u0437\u044b\u043a \u043e\u0437\u043d\u0430\u0447\u0430\u0435\u0442 \u00ab\u043c\u0443\u0434\u0440\u043e\u0441\u0442\u044c\u00bb, \u00ab\u0431\u043b\u0430\u0433\u043e\u0440\u0430\u0437\u0443\u043c\u043d\u0430\u044f\u00bb, \u00ab\u0440\u0430\u0441\u0441\u0443\u0434\u0438\u0442\u0435\u043b\u044c\u043d\u0430\u044f\u00bb, \u00ab\u043c\u0443\u0434\u0440\u0430\u044f\u00bb."}}, "right": {"answer": "\u0421\u043e\u0444\u0438\u044f"}}, {"@price": "600", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041c\u0443\u0436\u0441\u043a\u043e\u0435 \u0438\u043c\u044f \u043b\u0430\u0442\u0438\u043d\u0441\u043a\u043e\u0433\u043e \u043f\u0440\u043e\u0438\u0441\u0445\u043e\u0436\u0434\u0435\u043d\u0438\u044f. \u042d\u0442\u0438\u043c\u043e\u043b\u043e\u0433\u0438\u0447\u0435\u0441\u043a\u043e\u0435 \u0437\u043d\u0430\u0447\u0435\u043d\u0438\u0435 \u00ab\u0441\u0430\u043c\u044b\u0439 \u0431\u043e\u043b\u044c\u0448\u043e\u0439\u00bb, \u00ab\u0432\u0435\u043b\u0438\u0447\u0430\u0439\u0448\u0438\u0439\u00bb"}}, "right": {"answer": "\u041c\u0430\u043a\u0441\u0438\u043c"}}, {"@price": "900", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041c\u0443\u0436\u0441\u043a\u043e\u0435 \u0438\u043c\u044f \u0432 \u0440\u0443\u0441\u0441\u043a\u043e\u043c \u044f\u0437\u044b\u043a\u0435, \u0432 \u043f\u0435\u0440\u0435\u0432\u043e\u0434\u0435 \u0441 \u0434\u0440\u0435\u0432\u043d\u0435\u0433\u0440\u0435\u0447\u0435\u0441\u043a\u043e\u0433\u043e \u044f\u0437\u044b\u043a\u0430 \u2014 \"\u0441\u043a\u0430\u043b\u0430, \u043a\u0430\u043c\u0435\u043d\u044c\""}}, "right": {"answer": "\u041f\u0451\u0442\u0440"}}, {"@price": "1200", "params": {"param": {"@name": "question", "@type": "content", "item": "\u041c\u0443\u0436\u0441\u043a\u043e\u0435 \u043b\u0438\u0447\u043d\u043e\u0435 \u0438\u043c\u044f \u0435\u0432\u0440\u0435\u0439\u0441\u043a\u043e\u0433\u043e \u043f\u0440\u043e\u0438\u0441\u0445\u043e\u0436\u0434\u0435\u043d\u0438\u044f.  \u0418\u043c\u0435\u0435\u0442 \u0434\u0432\u0430 \u0442\u043e\u043b\u043a\u043e\u0432\u0430\u043d\u0438\u044f: \u0447\u0430\u0449\u0435 \u0432\u0441\u0442\u0440\u0435\u0447\u0430\u0435\u0442\u0441\u044f \u0434\u043e\u0441\u043b\u043e\u0432\u043d\u043e\u2009\u2014 \"\u041a\u0442\u043e \u043a\u0430\u043a \u0411\u043e\u0433\", \u043d\u043e \u0442\u0430\u043a\u0436\u0435 \u0447\u0438\u0442\u0430\u0435\u0442\u0441\u044f \u0438 \u0432 \u0432\u043e\u043f\u0440\u043e\u0441\u0438\u0442\u0435\u043b\u044c\u043d\u043e\u0439 \u0444\u043e\u0440\u043c\u0435, \u043a\u0430\u043a \u0440\u0438\u0442\u043e\u0440\u0438\u0447\u0435\u0441\u043a\u0438\u0439 \u0432\u043e\u043f\u0440\u043e\u0441: \"\u041a\u0442\u043e \u043a\u0430\u043a \u0411\u043e\u0433?\" \u0438\u043b\u0438 \"\u041a\u0442\u043e \u043f\u043e\u0434\u043e\u0431\u0435\u043d \u0411\u043e\u0433\u0443?\" \u0432 \u0437\u043d\u0430\u0447\u0435\u043d\u0438\u0438 \u2014 \"\u043d\u0438\u043a\u0442\u043e \u043d\u0435 \u0440\u0430\u0432\u0435\u043d \u0411\u043e\u0433\u0443\""}}, "right": {"answer": "\u041c\u0438\u0445\u0430\u0438\u043b"}}, {"@price": "1500", "params": {"param": {"@name": "question", "@type": "content", "item": "\u0421\u0442\u0430\u0440\u0438\u043d\u043d\u043e\u0435 \u043c\u0443\u0436\u0441\u043a\u043e\u0435 \u0438\u043c\u044f. \u0418\u043c\u0435\u0435\u0442 \u0433\u0440\u0435\u0447\u0435\u0441\u043a\u0438\u0435 \u043a\u043e\u0440\u043d\u0438 \u0432 \u043f\u0440\u043e\u0438\u0441\u0445\u043e\u0436\u0434\u0435\u043d\u0438\u0438. \u0412 \u043f\u0435\u0440\u0435\u0432\u043e\u0434\u0435 \u043e\u0437\u043d\u0430\u0447\u0430\u0435\u0442 \u00ab\u0445\u043e\u0440\u043e\u0448\u0438\u0439\u00bb, \u00ab\u0431\u0435\u0437\u0437\u043b\u043e\u0431\u043d\u044b\u0439\u00bb, \u00ab\u043d\u0435 \u0434\u0435\u043b\u0430\u044e\u0449\u0438\u0439 \u0437\u043b\u0430\u00bb."}}, "right": {"answer": "\u0410\u043a\u0430\u043a\u0438\u0439"}}]}}, {"@name": "\u0414\u0440\u0435\u0432\u043d\u0438\u0435 \u043c\u0430\u0440\u0433\u0438\u043d\u0430\u043b\u044c\u043d\u044b\u0435 \u043c\u0435\u043c\u044b", "info": {"comments": "\u041d\u0443\u0436\u043d\u043e \u043e\u043f\u0438\u0441\u0430\u0442\u044c \u043e \u0447\u0435\u043c \u044d\u0442\u043e\u0442 \u043c\u0435\u043c, \u0438\u043b\u0438 \u043f\u0440\u0438\u0432\u0435\u0441\u0442\u0438 \u043a\u0440\u044b\u043b\u0430\u0442\u0443\u044e \u0444\u0440\u0430\u0437\u0443 \u0438\u0437 \u043d\u0435\u0433\u043e"}, "questions": {"question": [{"@price": "300", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "crocod.png"}}}, "right": {"answer": "\u041a\u0440\u043e\u043a\u043e\u0434\u0438\u043b \u0432 \u0432\u0430\u043d\u043d\u043e\u0439. \u0410\u043d\u0435\u043a\u0434\u043e\u0442 \u043f\u0440\u043e \u043a\u043e\u0441\u044f\u0447\u043e\u043a."}}, {"@price": "600", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "zhalko.png"}}}, "right": {"answer": "\u0416\u0430\u043b\u043a\u043e \u044d\u0442\u043e\u0433\u043e \u0434\u043e\u0431\u0440\u044f\u043a\u0430. \u041f\u0430\u0440\u0435\u043d\u044c \u043e\u0442\u0432\u0435\u0447\u0430\u0435\u0442, \u043a\u0430\u043a \u0443\u043c\u0435\u0440 \u041f\u0443\u0448\u043a\u0438\u043d."}}, {"@price": "900", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "affordable.png"}}}, "right": {"answer": "\u041e\u0447\u0435\u043d\u044c affordable... \u041f\u0440\u043e \u0441\u043c\u0435\u0448\u0435\u043d\u0438\u0435 \u0440\u0443\u0441\u0441\u043a\u043e\u0433\u043e \u0438 \u0430\u043d\u0433\u043b\u0438\u0439\u0441\u043a\u043e\u0433\u043e \u0432 \u0440\u0435\u0447\u0438"}}, {"@price": "1200", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "tibrosil.png"}}}, "right": {"answer": "\u0422\u044b \u0431\u0440\u043e\u0441\u0438\u043b \u043d\u0430\u0448\u0443 \u0444\u0438\u043b\u043e\u0441\u043e\u0444\u0441\u043a\u0443\u044e \u0436\u0438\u0437\u043d\u044c \u0440\u0430\u0434\u0438 \u0431\u0430\u0431"}}, {"@price": "1500", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "pohlop.png"}}}, "right": {"answer": "\u042f \u043f\u0440\u043e\u0441\u0442\u043e \u043f\u043e\u0445\u043b\u043e\u043f\u0430\u044e."}}]}}]}}, {"@name": "\u0424\u0418\u041d\u0410\u041b", "@type": "final", "themes": {"theme": [{"@name": "\u0416\u0435\u0441\u0442\u043e\u0447\u0430\u0439\u0448\u0435 \u043e\u0442\u0432\u0435\u0442\u0438\u043b", "questions": {"question": {"@price": "0", "params": {"param": {"@name": "question", "@type": "content", "item": "\u0418\u043c\u0435\u043d\u043d\u043e \u0442\u0430\u043a \u0436\u0435\u0441\u0442\u043a\u043e \u0432\u044b\u0440\u0430\u0437\u0438\u043b\u0441\u044f \u0432\u043e\u0436\u0434\u044c \u043f\u0440\u043e\u043b\u0435\u0442\u0430\u0440\u0438\u0430\u0442\u0430 15 \u0441\u0435\u043d\u0442\u044f\u0431\u0440\u044f 1919 \u0433\u043e\u0434\u0430 \u0432 \u043f\u0438\u0441\u044c\u043c\u0435 \u041c\u0430\u043a\u0441\u0438\u043c\u0443 \u0413\u043e\u0440\u044c\u043a\u043e\u043c\u0443, \u043a\u043e\u0433\u0434\u0430 \u0431\u0443\u0440\u0435\u0432\u0435\u0441\u0442\u043d\u0438\u043a \u0440\u0435\u0432\u043e\u043b\u044e\u0446\u0438\u0438 \u043f\u0440\u043e\u0441\u0438\u043b \u0442\u043e\u0432\u0430\u0440\u0438\u0449\u0430 \u0423\u043b\u044c\u044f\u043d\u043e\u0432\u0430 \u0438\u0437\u0431\u0430\u0432\u0438\u0442\u044c \u043e\u0442 \u043f\u0440\u0435\u0441\u043b\u0435\u0434\u043e\u0432\u0430\u043d\u0438\u0439 \u0438 \u0437\u0430\u043a\u043b\u044e\u0447\u0435\u043d\u0438\u044f \u043f\u0438\u0441\u0430\u0442\u0435\u043b\u044f \u041a\u043e\u0440\u043e\u043b\u0435\u043d\u043a\u043e. \u041f\u043e\u0434\u0441\u043a\u0430\u0437\u043a\u0430: \u0444\u0440\u0430\u0437\u0430 \u043d\u0430\u0447\u0438\u043d\u0430\u0435\u0442\u0441\u044f \u0441\u043e \u0441\u043b\u043e\u0432\u0430 \"\u0438\u043d\u0442\u0435\u043b\u043b\u0438\u0433\u0435\u043d\u0446\u0438\u044f\"."}}, "right": {"answer": "\u0418\u043d\u0442\u0435\u043b\u043b\u0438\u0433\u0435\u043d\u0446\u0438\u044f \u043d\u0435 \u043c\u043e\u0437\u0433 \u043d\u0430\u0446\u0438\u0438, \u0430 \u0435\u0435 \u0433\u043e\u0432\u043d\u043e"}}}}, {"@name": "\u041f\u043e\u043b\u044c\u0441\u043a\u043e\u0435 \u043d\u0430\u0437\u0432\u0430\u043d\u0438\u0435", "info": {"comments": "\u041d\u0430\u0437\u043e\u0432\u0438\u0442\u0435 \u044d\u0442\u043e\u0442 \u0444\u0438\u043b\u044c\u043c \u043f\u043e-\u0440\u0443\u0441\u0441\u043a\u0438."}, "questions": {"question": {"@price": "0", "params": {"param": {"@name": "question", "@type": "content", "item": "Ojciec chrzestny (1972)"}}, "right": {"answer": "The Godfather / \u041a\u0440\u0435\u0441\u0442\u043d\u044b\u0439 \u043e\u0442\u0435\u0446"}}}}, {"@name": "\u0418\u0433\u0440\u0430", "info": {"comments": "\u041e \u043a\u0430\u043a\u043e\u0439 \u0438\u0433\u0440\u0435 \u0438\u0434\u0435\u0442 \u0440\u0435\u0447\u044c?"}, "questions": {"question": {"@price": "0", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "terrar.png"}}}, "right": {"answer": "Terraria"}}}}, {"@name": "\u041c\u0443\u043b\u044c\u0442\u0444\u0438\u043b\u044c\u043c", "info": {"comments": "\u041d\u0430\u0437\u0432\u0430\u043d\u0438\u0435 \u043c\u0443\u043b\u044c\u0442\u0444\u0438\u043b\u044c\u043c\u0430 \u043f\u043e \u043e\u043f\u0438\u0441\u0430\u043d\u0438\u044e \u043d\u0435\u0439\u0440\u043e\u0441\u0435\u0442\u0438?"}, "questions": {"question": {"@price": "0", "params": {"param": {"@name": "question", "@type": "content", "item": "\u042d\u0442\u043e \u0433\u043b\u0443\u0431\u043e\u043a\u0438\u0439 \u0438 \u0430\u0442\u043c\u043e\u0441\u0444\u0435\u0440\u043d\u044b\u0439 \u043c\u0443\u043b\u044c\u0442\u0444\u0438\u043b\u044c\u043c, \u0441\u043e\u0437\u0434\u0430\u043d\u043d\u044b\u0439 \u043f\u0440\u043e\u0438\u0437\u0432\u043e\u0434\u0438\u0442\u0435\u043b\u0435\u043c \"\u0422\u0435\u043c\u043d\u043e\u0433\u043e \u0420\u044b\u0446\u0430\u0440\u044f\" \u041a\u0440\u0438\u0441\u0442\u043e\u0444\u0435\u0440\u043e\u043c \u041d\u043e\u043b\u0430\u043d\u043e\u043c \u0438 \u0440\u0435\u0436\u0438\u0441\u0441\u0435\u0440\u043e\u043c \u0428\u0435\u0439\u043d\u043e\u043c \u042d\u043a\u0435\u0440\u043e\u043c. \u041a\u0430\u0440\u0442\u0438\u043d\u0430 \u0440\u0430\u0441\u0441\u043a\u0430\u0437\u044b\u0432\u0430\u0435\u0442 \u043e \u043f\u043e\u0441\u0442\u0430\u043f\u043e\u043a\u0430\u043b\u0438\u043f\u0442\u0438\u0447\u0435\u0441\u043a\u043e\u043c \u043c\u0438\u0440\u0435 \u043f\u043e\u0441\u043b\u0435 \u0432\u043e\u0439\u043d\u044b \u043c\u0435\u0436\u0434\u0443 \u043c\u0430\u0448\u0438\u043d\u0430\u043c\u0438 \u0438 \u043b\u044e\u0434\u044c\u043c\u0438, \u0438 \u043e \u0436\u0438\u0437\u043d\u0438 \u0434\u0435\u0432\u044f\u0442\u0438 \u043c\u0430\u043b\u0435\u043d\u044c\u043a\u0438\u0445 \u0441\u043e\u0437\u0434\u0430\u043d\u0438\u0439, \u043a\u043e\u0442\u043e\u0440\u044b\u0435 \u0441\u0440\u0430\u0436\u0430\u044e\u0442\u0441\u044f \u0437\u0430 \u0432\u044b\u0436\u0438\u0432\u0430\u043d\u0438\u0435. \u041c\u0443\u043b\u044c\u0442\u0444\u0438\u043b\u044c\u043c \u0432\u043f\u0435\u0447\u0430\u0442\u043b\u044f\u0435\u0442 \u043a\u0440\u0430\u0441\u0438\u0432\u043e\u0439 \u0438 \u0434\u0435\u0442\u0430\u043b\u044c\u043d\u043e\u0439 \u0430\u043d\u0438\u043c\u0430\u0446\u0438\u0435\u0439, \u0438\u043d\u0442\u0440\u0438\u0433\u0443\u044e\u0449\u0438\u043c \u0441\u044e\u0436\u0435\u0442\u043e\u043c \u0438 \u043c\u0438\u0441\u0442\u0438\u0447\u0435\u0441\u043a\u043e\u0439 \u0430\u0442\u043c\u043e\u0441\u0444\u0435\u0440\u043e\u0439. \u041f\u0435\u0440\u0441\u043e\u043d\u0430\u0436\u0438 \u0432\u0441\u0435 \u0438\u043c\u0435\u044e\u0442 \u0441\u0432\u043e\u0438 \u0444\u0438\u0437\u0438\u0447\u0435\u0441\u043a\u0438\u0435 \u0438 \u043a\u0430\u043a\u0438\u0435-\u0442\u043e \u043b\u0438\u0447\u043d\u044b\u0435 \u0447\u0435\u0440\u0442\u044b, \u0447\u0442\u043e \u043f\u0440\u0438\u0434\u0430\u0435\u0442 \u043d\u0435\u043a\u043e\u0442\u043e\u0440\u0443\u044e \u0443\u043d\u0438\u043a\u0430\u043b\u044c\u043d\u043e\u0441\u0442\u044c \u043a\u0430\u0436\u0434\u043e\u043c\u0443. \u0412 \u0446\u0435\u043b\u043e\u043c, - \u044d\u0442\u043e \u043e\u0442\u043b\u0438\u0447\u043d\u044b\u0439 \u0441\u044e\u0436\u0435\u0442\u043d\u044b\u0439 \u043c\u0443\u043b\u044c\u0442\u0444\u0438\u043b\u044c\u043c \u0441 \u043a\u0440\u0430\u0441\u0438\u0432\u043e\u0439 \u0430\u043d\u0438\u043c\u0430\u0446\u0438\u0435\u0439, \u0440\u0435\u043a\u043e\u043c\u0435\u043d\u0434\u0443\u0435\u043c\u044b\u0439 \u0434\u043b\u044f \u043b\u044e\u0431\u0438\u0442\u0435\u043b\u0435\u0439 \u043d\u0430\u0443\u0447\u043d\u043e\u0439 \u0444\u0430\u043d\u0442\u0430\u0441\u0442\u0438\u043a\u0438 \u0438 \u043f\u0440\u0438\u043a\u043b\u044e\u0447\u0435\u043d\u0438\u0439."}}, "right": {"answer": "9"}}}}, {"@name": "\u0416\u0438\u0432\u043e\u0442\u043d\u043e\u0435", "info": {"comments": "\u0427\u0442\u043e \u044d\u0442\u043e \u0437\u0430 \u0437\u0432\u0435\u0440\u044c?"}, "questions": {"question": {"@price": "0", "params": {"param": {"@name": "question", "@type": "content", "item": {"@type": "image", "@isRef": "True", "#text": "vihuh_1.png"}}}, "right": {"answer": "\u0412\u044b\u0445\u0443\u0445\u043e\u043b\u044c"}}}}]}}]}}}
\ No newline at end of file
@@ -0,0 +1,155 @@
+# Потоковый разбор content.xml (SIQ v5) сразу в компактную модель пака
+import xml.etree.ElementTree as ET
+from typing import IO, Iterable, List, Optional, Set, Tuple, Union
+from urllib.parse import unquote
+
+from PackageModel import CompiledPackage, Round, Theme, Question, Item
+
+
+class SiqError(Exception):
+    """
+    content.xml не разобран или не похож на пак SIGame
+    """
+
+
+def _local(tag: str) -> str:
+    """
+    Имя тега без пространства имен: {https://...siq_5.xsd}question -> question
+    """
+    return tag.rsplit("}", 1)[-1]
+
+
+def _text(element: ET.Element) -> str:
+    return (element.text or "").strip()
+
+
+def _items(param: ET.Element) -> Tuple[Item, ...]:
+    items = []
+    for item in param:
+        if _local(item.tag) == "item":
+            items.append(Item(item.get("type", "text"), _text(item), item.get("isRef") == "True"))
+    if not items and _text(param):  # содержимое без item
+        items.append(Item("text", _text(param)))
+    return tuple(items)
+
+
+def _scenario(scenario: ET.Element) -> Tuple[Tuple[Item, ...], Tuple[Item, ...]]:
+    """
+    Вопрос в формате SIQ v4: atom, после atom type="marker" идет ответ
+    """
+    content, answer_content = [], []
+    target = content
+    for atom in scenario:
+        atom_type = atom.get("type", "text")
+        if atom_type == "marker":
+            target = answer_content
+            continue
+        value = _text(atom)
+        if value.startswith("@"):  # ссылка на файл архива
+            target.append(Item("audio" if atom_type == "voice" else atom_type, value[1:], True))
+        else:
+            target.append(Item(atom_type, value))
+    return tuple(content), tuple(answer_content)
+
+
+def _question(question: ET.Element) -> Question:
+    content: Tuple[Item, ...] = ()
+    answer_content: Tuple[Item, ...] = ()
+    params = {}
+    right: List[str] = []
+    wrong: List[str] = []
+
+    for child in question:
+        tag = _local(child.tag)
+        if tag == "params":
+            for param in child:
+                name = param.get("name", "")
+                number_set = next((node for node in param if _local(node.tag) == "numberSet"), None)
+                if name == "question":
+                    content = _items(param)
+                elif name == "answer":
+                    answer_content = _items(param)
+                elif number_set is not None:
+                    params[name] = dict(number_set.attrib)
+                else:
+                    params[name] = _text(param)
+        elif tag == "scenario":
+            content, answer_content = _scenario(child)
+        elif tag == "right":
+            right.extend(_text(answer) for answer in child)
+        elif tag == "wrong":
+            wrong.extend(_text(answer) for answer in child)
+
+    price = question.get("price", "0")
+    return Question(int(price) if price.lstrip("-").isdigit() else 0, question.get("type", "simple"),
+                    content, answer_content, params, tuple(right), tuple(wrong))
+
+
+def parse_siq(source: Union[str, IO[bytes]], package_id: int = 0) -> CompiledPackage:
+    """
+    Разбирает content.xml потоком: в памяти держится только текущий вопрос,
+    разобранные узлы сразу очищаются.
+    :param source: Путь или открытый файл (в том числе член zip архива)
+    :param package_id: id пака в БД
+    :return: Собранный пак
+    """
+    name = difficulty = date = ""
+    authors: List[str] = []
+    rounds: List[Round] = []
+    themes: List[Theme] = []
+    questions: List[Question] = []
+    theme_comment = ""
+    path: List[str] = []  # теги от корня до текущего узла
+    root: Optional[ET.Element] = None
+
+    try:
+        for event, element in ET.iterparse(source, events=("start", "end")):
+            tag = _local(element.tag)
+
+            if event == "start":
+                path.append(tag)
+                if tag == "package":
+                    root = element
+                    name = element.get("name", "")
+                    difficulty = element.get("difficulty", "")
+                    date = element.get("date", "")
+                continue
+
+            path.pop()
+            parent = path[-1] if path else ""
+
+            if tag == "question":
+                questions.append(_question(element))
+                element.clear()
+            elif tag == "comments" and parent == "info" and len(path) >= 2 and path[-2] == "theme":
+                theme_comment = _text(element)
+            elif tag == "author" and "round" not in path:
+                authors.append(_text(element))
+            elif tag == "theme":
+                themes.append(Theme(element.get("name", ""), theme_comment, tuple(questions)))
+                questions, theme_comment = [], ""
+                element.clear()
+            elif tag == "round":
+                rounds.append(Round(element.get("name", ""), element.get("type", "standart"), tuple(themes)))
+                themes = []
+                element.clear()
+                if root is not None:
+                    root.clear()  # отпускаем уже разобранные раунды
+    except ET.ParseError as e:
+        raise SiqError(f"content.xml не разобран: {e}")
+
+    if root is None:
+        raise SiqError("в content.xml нет package")
+
+    return CompiledPackage(package_id, "", name, ", ".join(authors), difficulty, date, tuple(rounds))
+
+
+def missing_media(package: CompiledPackage, archive_names: Iterable[str]) -> List[str]:
+    """
+    Файлы, на которые ссылается пак (isRef), но которых нет в архиве
+    :param package: Собранный пак
+    :param archive_names: Имена файлов архива, как в zip (могут быть в %-кодировке)
+    :return: Имена отсутствующих файлов
+    """
+    names: Set[str] = {unquote(archive_name) for archive_name in archive_names}
+    return [item.value for item in package.media.values() if item.path not in names]
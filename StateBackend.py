@@ -0,0 +1,576 @@
+# Состояние комнат и рассылка: в одном процессе или общее для нескольких воркеров
+import asyncio
+import json
+import multiprocessing
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from Settings import settings
+
+# Доставка кадра своим соединениям: (game_id, GUID получателей или None - всем, кадр, event, seq, адресат)
+Deliver = Callable[[int, Optional[List[str]], str, Optional[str], Optional[int], Optional[str]], None]
+# Служебное сообщение от другого воркера: (game_id, сообщение)
+Control = Callable[[int, dict], Awaitable[None]]
+
+# region роли
+ROLE_SCREEN = "screen_GUID"
+ROLE_LEADER = "leader_GUID"
+ROLES = (ROLE_SCREEN, ROLE_LEADER)
+# endregion
+
+# Канал, через который воркеры пересылают друг другу кадры
+EVENTS_CHANNEL = "sigame:events"
+
+
+class StateBackend(ABC):
+    """
+    Состояние комнат (кто подключен, роли, готовность, настройки) и рассылка по комнате.
+    ConnectionManager хранит у себя только сокеты этого процесса.
+    """
+
+    # состояние видят другие воркеры
+    shared: bool = False
+
+    @abstractmethod
+    async def start(self, deliver: Deliver, control: Control):
+        """
+        :param deliver: Раскладывает кадр по сокетам этого воркера
+        :param control: Обрабатывает служебные сообщения других воркеров
+        """
+
+    @abstractmethod
+    async def stop(self):
+        ...
+
+    @abstractmethod
+    async def seed_ids(self, last_ids: Dict[str, int]):
+        """
+        Начальные значения счетчиков id из БД
+        :param last_ids: {"game": последний id, "player": последний id}
+        """
+
+    @abstractmethod
+    async def next_id(self, kind: str) -> Optional[int]:
+        """
+        Следующий id игры или игрока
+        :return: None - id назначит реестр этого процесса
+        """
+
+    @abstractmethod
+    async def next_seq(self, game_id: int) -> int:
+        """
+        Следующий номер сообщения игры
+        """
+
+    # region коды игр
+    @abstractmethod
+    async def claim_code(self, code: str) -> bool:
+        """
+        Занимает код игры, чтобы другой воркер не выдал такой же
+        :return: Удалось ли занять
+        """
+
+    @abstractmethod
+    async def release_code(self, code: str):
+        ...
+    # endregion
+
+    # region участники
+    @abstractmethod
+    async def add_member(self, game_id: int, user_GUID: str):
+        ...
+
+    @abstractmethod
+    async def remove_member(self, game_id: int, user_GUID: str) -> int:
+        """
+        :return: Сколько участников осталось в комнате
+        """
+
+    @abstractmethod
+    async def members(self, game_id: int) -> Set[str]:
+        ...
+    # endregion
+
+    # region роли
+    @abstractmethod
+    async def claim_role(self, game_id: int, role: str, user_GUID: str) -> bool:
+        """
+        Занимает роль экрана или ведущего, если она свободна или уже у этого пользователя
+        :return: Получилось ли занять
+        """
+
+    @abstractmethod
+    async def release_role(self, game_id: int, role: str, user_GUID: str):
+        """
+        Освобождает роль, если ее держит этот пользователь
+        """
+
+    @abstractmethod
+    async def roles(self, game_id: int) -> Dict[str, Optional[str]]:
+        """
+        :return: {"screen_GUID": user_GUID, "leader_GUID": user_GUID}
+        """
+    # endregion
+
+    # region готовность и настройки
+    @abstractmethod
+    async def set_ready(self, game_id: int, user_GUID: str, is_ready: bool) -> Set[str]:
+        """
+        :return: Готовые игроки
+        """
+
+    @abstractmethod
+    async def ready(self, game_id: int) -> Set[str]:
+        ...
+
+    @abstractmethod
+    async def get_settings(self, game_id: int) -> str:
+        ...
+
+    @abstractmethod
+    async def set_settings(self, game_id: int, game_settings: str):
+        ...
+    # endregion
+
+    @abstractmethod
+    async def drop_game(self, game_id: int):
+        """
+        Удаляет все состояние комнаты
+        """
+
+    @abstractmethod
+    async def publish(self, game_id: int, to: Optional[List[str]], frame: str, event: Optional[str],
+                      seq: Optional[int] = None, audience: Optional[str] = None):
+        """
+        Отдает кадр воркерам, у которых есть сокеты получателей
+        """
+
+    @abstractmethod
+    async def control(self, game_id: int, message: dict):
+        """
+        Служебное сообщение остальным воркерам
+        """
+
+
+class LocalBackend(StateBackend):
+    """
+    Все в словарях одного процесса, как было до выделения бэкенда
+    """
+
+    def __init__(self):
+        # {game_id: {user_GUID, }}
+        self._members: Dict[int, Set[str]] = {}
+        # {game_id: {"screen_GUID": user_GUID, "leader_GUID": user_GUID}}
+        self._roles: Dict[int, Dict[str, Optional[str]]] = {}
+        # {game_id: {user_GUID, }}
+        self._ready: Dict[int, Set[str]] = {}
+        # {game_id: настройки}
+        self._settings: Dict[int, str] = {}
+        # {game_id: последний номер сообщения}
+        self._seq: Dict[int, int] = {}
+
+    async def start(self, deliver: Deliver, control: Control):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def seed_ids(self, last_ids: Dict[str, int]):
+        pass
+
+    async def next_id(self, kind: str) -> Optional[int]:
+        return None
+
+    async def next_seq(self, game_id: int) -> int:
+        self._seq[game_id] = self._seq.get(game_id, 0) + 1
+        return self._seq[game_id]
+
+    async def claim_code(self, code: str) -> bool:
+        return True  # выдача одна, занятые коды помнит сам распределитель
+
+    async def release_code(self, code: str):
+        pass
+
+    async def add_member(self, game_id: int, user_GUID: str):
+        self._members.setdefault(game_id, set()).add(user_GUID)
+
+    async def remove_member(self, game_id: int, user_GUID: str) -> int:
+        members = self._members.get(game_id, set())
+        members.discard(user_GUID)
+        return len(members)
+
+    async def members(self, game_id: int) -> Set[str]:
+        return set(self._members.get(game_id, ()))
+
+    async def claim_role(self, game_id: int, role: str, user_GUID: str) -> bool:
+        roles = self._roles.setdefault(game_id, dict.fromkeys(ROLES))
+        if roles[role] not in (None, user_GUID):  # тот же пользователь переподключается
+            return False
+        roles[role] = user_GUID
+        return True
+
+    async def release_role(self, game_id: int, role: str, user_GUID: str):
+        roles = self._roles.get(game_id)
+        if roles is not None and roles[role] == user_GUID:
+            roles[role] = None
+
+    async def roles(self, game_id: int) -> Dict[str, Optional[str]]:
+        return dict(self._roles.get(game_id) or dict.fromkeys(ROLES))
+
+    async def set_ready(self, game_id: int, user_GUID: str, is_ready: bool) -> Set[str]:
+        ready = self._ready.setdefault(game_id, set())
+        if is_ready:
+            ready.add(user_GUID)
+        else:
+            ready.discard(user_GUID)
+        return set(ready)
+
+    async def ready(self, game_id: int) -> Set[str]:
+        return set(self._ready.get(game_id, ()))
+
+    async def get_settings(self, game_id: int) -> str:
+        return self._settings.get(game_id, "")
+
+    async def set_settings(self, game_id: int, game_settings: str):
+        self._settings[game_id] = game_settings
+
+    async def drop_game(self, game_id: int):
+        for state in (self._members, self._roles, self._ready, self._settings, self._seq):
+            state.pop(game_id, None)
+
+    async def publish(self, game_id: int, to: Optional[List[str]], frame: str, event: Optional[str],
+                      seq: Optional[int] = None, audience: Optional[str] = None):
+        pass  # других воркеров нет, свои сокеты ConnectionManager уже обслужил
+
+    async def control(self, game_id: int, message: dict):
+        pass
+
+
+# region заглушка Redis в процессе
+class MemoryPubSub:
+    """
+    Подписка MemoryBroker с тем же интерфейсом, что у redis.asyncio PubSub
+    """
+
+    def __init__(self, broker: "MemoryBroker"):
+        self._broker = broker
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._channels: Set[str] = set()
+
+    async def subscribe(self, *channels: str):
+        for channel in channels:
+            self._channels.add(channel)
+            self._broker.subscribers.setdefault(channel, set()).add(self._queue)
+
+    async def listen(self):
+        while True:
+            yield await self._queue.get()
+
+    async def close(self):
+        for channel in self._channels:
+            self._broker.subscribers.get(channel, set()).discard(self._queue)
+        self._channels.clear()
+
+
+class MemoryBroker:
+    """
+    Часть команд Redis в памяти процесса: для тестов общего бэкенда без сервера
+    и для нескольких менеджеров в одном процессе
+    """
+
+    def __init__(self):
+        self._data: Dict[str, object] = {}
+        # {ключ: когда истекает (time.monotonic)}
+        self._expires: Dict[str, float] = {}
+        # {канал: {очередь подписчика, }}
+        self.subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    def __purge(self, name: str):
+        if name in self._expires and self._expires[name] <= time.monotonic():
+            del self._expires[name]
+            self._data.pop(name, None)
+
+    async def set(self, name: str, value, nx: bool = False, ex: int = None) -> bool:
+        self.__purge(name)
+        if nx and name in self._data:
+            return False
+        self._data[name] = str(value)
+        if ex is not None:
+            self._expires[name] = time.monotonic() + ex
+        else:
+            self._expires.pop(name, None)
+        return True
+
+    async def exists(self, *names: str) -> int:
+        for name in names:
+            self.__purge(name)
+        return sum(name in self._data for name in names)
+
+    async def incr(self, name: str) -> int:
+        value = int(self._data.get(name, 0)) + 1
+        self._data[name] = str(value)
+        return value
+
+    async def hsetnx(self, name: str, key: str, value: str) -> bool:
+        values = self._data.setdefault(name, {})
+        if key in values:
+            return False
+        values[key] = value
+        return True
+
+    async def hset(self, name: str, key: str, value: str) -> int:
+        values = self._data.setdefault(name, {})
+        added = key not in values
+        values[key] = value
+        return int(added)
+
+    async def hget(self, name: str, key: str) -> Optional[str]:
+        return self._data.get(name, {}).get(key)
+
+    async def hgetall(self, name: str) -> Dict[str, str]:
+        return dict(self._data.get(name, {}))
+
+    async def hdel(self, name: str, *keys: str) -> int:
+        values = self._data.get(name, {})
+        return sum(values.pop(key, None) is not None for key in keys)
+
+    async def sadd(self, name: str, *values: str) -> int:
+        members = self._data.setdefault(name, set())
+        added = len(set(values) - members)
+        members.update(values)
+        return added
+
+    async def srem(self, name: str, *values: str) -> int:
+        members = self._data.get(name, set())
+        removed = len(members & set(values))
+        members.difference_update(values)
+        return removed
+
+    async def smembers(self, name: str) -> Set[str]:
+        return set(self._data.get(name, ()))
+
+    async def scard(self, name: str) -> int:
+        return len(self._data.get(name, ()))
+
+    async def get(self, name: str) -> Optional[str]:
+        self.__purge(name)
+        value = self._data.get(name)
+        return value if isinstance(value, str) else None
+
+    async def delete(self, *names: str) -> int:
+        for name in names:
+            self._expires.pop(name, None)
+        return sum(self._data.pop(name, None) is not None for name in names)
+
+    async def publish(self, channel: str, message: str) -> int:
+        queues = self.subscribers.get(channel, set())
+        for queue in queues:
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(queues)
+
+    def pubsub(self) -> MemoryPubSub:
+        return MemoryPubSub(self)
+
+    async def close(self):
+        pass
+
+
+# общий брокер для всех SharedBackend процесса без redis_url
+memory_broker = MemoryBroker()
+# endregion
+
+
+class SharedBackend(StateBackend):
+    """
+    Состояние комнат в Redis (или в MemoryBroker), кадры ходят между воркерами через pub/sub.
+    Свои сокеты воркер обслуживает сразу, из канала берет только чужие кадры.
+    Участники и роли записаны вместе с воркером, который держит сокет. Воркер продлевает
+    ключ sigame:worker:<id> с TTL, записи воркера, у которого ключ истек (упал), не считаются.
+    """
+    shared = True
+
+    def __init__(self, broker):
+        self.broker = broker
+        self.worker_id: str = uuid.uuid4().hex
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+        self._deliver: Optional[Deliver] = None
+        self._control: Optional[Control] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _key(game_id: int, name: str) -> str:
+        return f"sigame:game:{game_id}:{name}"
+
+    @staticmethod
+    def _worker_key(worker_id: str) -> str:
+        return f"sigame:worker:{worker_id}"
+
+    async def start(self, deliver: Deliver, control: Control):
+        self._deliver = deliver
+        self._control = control
+        await self.broker.set(self._worker_key(self.worker_id), 1, ex=settings["worker_lease_seconds"])
+        self._heartbeat = asyncio.create_task(self.__heartbeat())
+        self._pubsub = self.broker.pubsub()
+        await self._pubsub.subscribe(EVENTS_CHANNEL)
+        self._listener = asyncio.create_task(self.__listen())
+
+    async def stop(self):
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+        if self._listener is not None:
+            self._listener.cancel()
+        if self._pubsub is not None:
+            await self._pubsub.close()
+        await self.broker.delete(self._worker_key(self.worker_id))  # оставшиеся записи воркера сразу не считаются
+
+    async def __heartbeat(self):
+        while True:
+            await asyncio.sleep(settings["worker_heartbeat_seconds"])
+            try:
+                await self.broker.set(self._worker_key(self.worker_id), 1, ex=settings["worker_lease_seconds"])
+            except Exception as e:
+                print(f"Ошибка продления воркера: {e}")
+
+    async def __alive(self, worker_ids: Set[str]) -> Set[str]:
+        """
+        Воркеры, у которых не истек ключ
+        """
+        return {worker_id for worker_id in worker_ids
+                if worker_id == self.worker_id or await self.broker.exists(self._worker_key(worker_id))}
+
+    async def __listen(self):
+        async for message in self._pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                data = json.loads(message["data"])
+                if data["worker"] == self.worker_id:
+                    continue
+                if "control" in data:
+                    await self._control(data["game_id"], data["control"])
+                else:
+                    self._deliver(data["game_id"], data["to"], data["frame"], data["event"],
+                                  data.get("seq"), data.get("audience"))
+            except Exception as e:
+                print(f"Ошибка сообщения от другого воркера: {e}")
+
+    async def seed_ids(self, last_ids: Dict[str, int]):
+        for kind, last_id in last_ids.items():
+            await self.broker.set(f"sigame:next_id:{kind}", last_id, nx=True)
+
+    async def next_id(self, kind: str) -> Optional[int]:
+        return int(await self.broker.incr(f"sigame:next_id:{kind}"))
+
+    async def next_seq(self, game_id: int) -> int:
+        return int(await self.broker.incr(self._key(game_id, "seq")))
+
+    async def claim_code(self, code: str) -> bool:
+        return bool(await self.broker.set(f"sigame:code:{code}", self.worker_id, nx=True))
+
+    async def release_code(self, code: str):
+        await self.broker.delete(f"sigame:code:{code}")
+
+    async def add_member(self, game_id: int, user_GUID: str):
+        await self.broker.hset(self._key(game_id, "members"), user_GUID, self.worker_id)
+
+    async def remove_member(self, game_id: int, user_GUID: str) -> int:
+        await self.broker.hdel(self._key(game_id, "members"), user_GUID)
+        return len(await self.members(game_id))
+
+    async def members(self, game_id: int) -> Set[str]:
+        owners = await self.broker.hgetall(self._key(game_id, "members"))  # {GUID: воркер}
+        alive = await self.__alive(set(owners.values()))
+        stale = [user_GUID for user_GUID, worker_id in owners.items() if worker_id not in alive]
+        if stale:  # сокеты упавшего воркера
+            await self.broker.hdel(self._key(game_id, "members"), *stale)
+        return {user_GUID for user_GUID, worker_id in owners.items() if worker_id in alive}
+
+    # region роли: значение "GUID:воркер"
+    async def __holder(self, game_id: int, role: str) -> Optional[str]:
+        """
+        Кто держит роль, если его воркер жив
+        """
+        value = await self.broker.hget(self._key(game_id, "roles"), role)
+        if value is None:
+            return None
+        user_GUID, worker_id = value.rsplit(":", 1)
+        return user_GUID if await self.__alive({worker_id}) else None
+
+    async def claim_role(self, game_id: int, role: str, user_GUID: str) -> bool:
+        key = self._key(game_id, "roles")
+        value = f"{user_GUID}:{self.worker_id}"
+        if await self.broker.hsetnx(key, role, value):
+            return True
+        holder = await self.__holder(game_id, role)
+        if holder == user_GUID:  # переподключение, возможно на другой воркер
+            await self.broker.hset(key, role, value)
+            return True
+        if holder is None:  # роль осталась за упавшим воркером
+            await self.broker.hdel(key, role)
+            return bool(await self.broker.hsetnx(key, role, value))
+        return False
+
+    async def release_role(self, game_id: int, role: str, user_GUID: str):
+        value = await self.broker.hget(self._key(game_id, "roles"), role)
+        if value is not None and value.rsplit(":", 1)[0] == user_GUID:
+            await self.broker.hdel(self._key(game_id, "roles"), role)
+
+    async def roles(self, game_id: int) -> Dict[str, Optional[str]]:
+        return {role: await self.__holder(game_id, role) for role in ROLES}
+    # endregion
+
+    async def set_ready(self, game_id: int, user_GUID: str, is_ready: bool) -> Set[str]:
+        if is_ready:
+            await self.broker.sadd(self._key(game_id, "ready"), user_GUID)
+        else:
+            await self.broker.srem(self._key(game_id, "ready"), user_GUID)
+        return await self.ready(game_id)
+
+    async def ready(self, game_id: int) -> Set[str]:
+        return set(await self.broker.smembers(self._key(game_id, "ready")))
+
+    async def get_settings(self, game_id: int) -> str:
+        return await self.broker.get(self._key(game_id, "settings")) or ""
+
+    async def set_settings(self, game_id: int, game_settings: str):
+        await self.broker.set(self._key(game_id, "settings"), game_settings)
+
+    async def drop_game(self, game_id: int):
+        await self.broker.delete(*(self._key(game_id, name) for name in ("members", "roles", "ready", "settings", "seq")))
+
+    async def publish(self, game_id: int, to: Optional[List[str]], frame: str, event: Optional[str],
+                      seq: Optional[int] = None, audience: Optional[str] = None):
+        await self.broker.publish(EVENTS_CHANNEL, json.dumps(
+            {"worker": self.worker_id, "game_id": game_id, "to": to, "frame": frame, "event": event,
+             "seq": seq, "audience": audience}, ensure_ascii=False))
+
+    async def control(self, game_id: int, message: dict):
+        await self.broker.publish(EVENTS_CHANNEL, json.dumps(
+            {"worker": self.worker_id, "game_id": game_id, "control": message}, ensure_ascii=False))
+
+
+def make_backend() -> StateBackend:
+    """
+    Бэкенд по настройкам: state_backend local или shared.
+    Для shared без redis_url используется MemoryBroker этого процесса - это не общее
+    состояние для нескольких процессов, поэтому с workers > 1 запуск отклоняется.
+    """
+    if settings["state_backend"] != "shared":
+        return LocalBackend()
+
+    if not settings["redis_url"]:
+        if settings["workers"] > 1:
+            raise RuntimeError("state_backend shared без redis_url работает только в одном процессе")
+        if multiprocessing.parent_process() is not None:  # uvicorn --workers N не всегда задает WEB_CONCURRENCY
+            print("ОШИБКА: state_backend shared без redis_url - состояние видно только этому процессу, "
+                  "комнаты на разных воркерах не будут общими")
+        return SharedBackend(memory_broker)
+
+    try:
+        import redis.asyncio as redis
+    except ImportError:
+        raise RuntimeError("для state_backend shared с redis_url нужен пакет redis")
+    return SharedBackend(redis.from_url(settings["redis_url"], decode_responses=True))
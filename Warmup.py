@@ -0,0 +1,63 @@
+# Прогрев экземпляра: сервер принимает соединения сразу, БД и состояние готовятся в фоне
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+# отсчет от импорта main, модуль импортируется первым
+IMPORT_STARTED = time.perf_counter()
+
+
+class Warmup:
+    """
+    Запускает инициализацию в фоне после того, как сервер начал принимать соединения.
+    Обработчики, которым нужны БД и реестр, ждут ее через wait().
+    """
+
+    def __init__(self):
+        self.time_to_accept_ms: Optional[float] = None  # от импорта до приема соединений
+        self.warmup_ms: Optional[float] = None  # сколько шла инициализация
+        self.error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, init: Callable[[], Awaitable[None]]):
+        """
+        Вызывается из lifespan: к этому моменту сервер уже готов принимать соединения
+        :param init: Инициализация БД и состояния
+        """
+        self.time_to_accept_ms = (time.perf_counter() - IMPORT_STARTED) * 1000
+        print(f"time to first accept: {self.time_to_accept_ms:.1f} мс")
+        self._task = asyncio.create_task(self.__run(init))
+
+    async def __run(self, init: Callable[[], Awaitable[None]]):
+        started = time.perf_counter()
+        try:
+            await init()
+        except Exception as e:
+            self.error = str(e)
+            print(f"Ошибка инициализации: {e}")
+            raise
+        self.warmup_ms = (time.perf_counter() - started) * 1000
+        print(f"warmup: {self.warmup_ms:.1f} мс")
+
+    @property
+    def ready(self) -> bool:
+        return self._task is not None and self._task.done() and self.error is None
+
+    async def wait(self):
+        """
+        Дожидается инициализации, если она еще идет
+        """
+        if not self.ready:
+            await asyncio.shield(self._task)
+
+    async def stop(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    def status(self) -> dict:
+        return {"status": "ready" if self.ready else "error" if self.error else "warming",
+                "time_to_accept_ms": self.time_to_accept_ms, "warmup_ms": self.warmup_ms, "error": self.error}
+
+
+# Прогрев для всего приложения
+warmup = Warmup()
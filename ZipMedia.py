@@ -0,0 +1,167 @@
+# Индекс членов zip архива для чтения медиа без распаковки
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zipfile
+import zlib
+from typing import Dict, Iterator, Optional
+from urllib.parse import unquote
+
+# Файлы индекса рядом с архивом в папке хранилища
+ARCHIVE_NAME = "archive.zip"
+INDEX_NAME = "media_index.json"
+
+# Локальный заголовок члена архива: 30 байт, длины имени и extra по смещениям 26 и 28
+LOCAL_HEADER_SIZE = 30
+LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+# Сколько отдаем за один раз при потоковой отдаче
+CHUNK_SIZE = 256 * 1024
+
+# Сжатия, которые читаем сами; с остальными пак распаковывается на диск
+SUPPORTED_COMPRESSION = (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+
+
+class MediaEntry:
+    """
+    Член архива: где лежат его данные и как они сжаты
+    """
+    __slots__ = ("name", "offset", "compressed_size", "size", "compress_type", "crc", "sha256")
+
+    def __init__(self, name: str, offset: int, compressed_size: int, size: int, compress_type: int, crc: int,
+                 sha256: str = ""):
+        self.name: str = name  # путь в архиве без %-кодировки, например Audio/Neco Arc - Monster.mp3
+        self.offset: int = offset  # начало данных в файле архива
+        self.compressed_size: int = compressed_size
+        self.size: int = size
+        self.compress_type: int = compress_type
+        self.crc: int = crc
+        self.sha256: str = sha256  # хэш содержимого для манифеста предзагрузки, пусто в старых индексах
+
+    @property
+    def stored(self) -> bool:
+        """
+        Член без сжатия можно отдавать прямо с диска по смещению
+        """
+        return self.compress_type == zipfile.ZIP_STORED
+
+    def to_dict(self) -> dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+def build_index(zip_path: str) -> Dict[str, MediaEntry]:
+    """
+    Читает центральный каталог один раз и находит начало данных каждого члена
+    :param zip_path: Путь к архиву
+    :return: {путь в архиве: MediaEntry}
+    """
+    entries: Dict[str, MediaEntry] = {}
+    with zipfile.ZipFile(zip_path) as archive, open(zip_path, "rb") as f:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            f.seek(info.header_offset)
+            header = f.read(LOCAL_HEADER_SIZE)
+            if header[:4] != LOCAL_HEADER_SIGNATURE:
+                raise zipfile.BadZipFile(f"битый локальный заголовок {info.filename}")
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            offset = info.header_offset + LOCAL_HEADER_SIZE + name_length + extra_length
+
+            name = unquote(info.filename)
+            entries[name] = MediaEntry(name, offset, info.compress_size, info.file_size, info.compress_type, info.CRC)
+    return entries
+
+
+def hash_entries(zip_path: str, entries: Dict[str, MediaEntry]):
+    """
+    Считает sha256 содержимого каждого члена архива. Выполняется в процессе пула при разборе пака.
+    :param zip_path: Путь к архиву
+    :param entries: Индекс из build_index, хэши записываются в него
+    """
+    with zipfile.ZipFile(zip_path) as archive:
+        for info in archive.infolist():
+            entry = entries.get(unquote(info.filename))
+            if entry is None:
+                continue
+            hasher = hashlib.sha256()
+            with archive.open(info) as member:
+                for chunk in iter(lambda: member.read(CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+            entry.sha256 = hasher.hexdigest()
+
+
+def save_index(entries: Dict[str, MediaEntry], index_path: str):
+    with open(index_path, "w", encoding="utf8") as f:
+        json.dump([entry.to_dict() for entry in entries.values()], f, ensure_ascii=False)
+
+
+def load_index(index_path: str) -> Dict[str, MediaEntry]:
+    with open(index_path, encoding="utf8") as f:
+        return {entry["name"]: MediaEntry(**entry) for entry in json.load(f)}
+
+
+class ZipMedia:
+    """
+    Медиа пака прямо из архива: несжатые члены читаются из mmap по смещению,
+    сжатые распаковываются потоком.
+    """
+
+    def __init__(self, directory: str):
+        self.zip_path: str = os.path.join(directory, ARCHIVE_NAME)
+        self.entries: Dict[str, MediaEntry] = load_index(os.path.join(directory, INDEX_NAME))
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+
+    @staticmethod
+    def is_zip_package(directory: str) -> bool:
+        return os.path.isfile(os.path.join(directory, INDEX_NAME))
+
+    def get(self, name: str) -> Optional[MediaEntry]:
+        return self.entries.get(name)
+
+    @property
+    def map(self) -> mmap.mmap:
+        if self._map is None:
+            self._file = open(self.zip_path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def iter_range(self, entry: MediaEntry, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Байты члена архива с start по end (не включая)
+        :param entry: Член архива
+        :param start: Смещение внутри файла
+        :param end: Конец диапазона, по умолчанию до конца файла
+        """
+        end = entry.size if end is None else min(end, entry.size)
+
+        if entry.stored:
+            view = memoryview(self.map)[entry.offset + start:entry.offset + end]
+            try:
+                for position in range(0, len(view), CHUNK_SIZE):
+                    yield bytes(view[position:position + CHUNK_SIZE])
+            finally:
+                view.release()
+            return
+
+        # сжатый член: распаковываем и пропускаем до start
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        position = 0
+        for compressed in range(0, entry.compressed_size, CHUNK_SIZE):
+            data = decompressor.decompress(
+                self.map[entry.offset + compressed:entry.offset + min(compressed + CHUNK_SIZE, entry.compressed_size)])
+            chunk_start, chunk_end = position, position + len(data)
+            position = chunk_end
+            if chunk_end <= start:
+                continue
+            yield data[max(start - chunk_start, 0):max(min(end, chunk_end) - chunk_start, 0)]
+            if chunk_end >= end:
+                return
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
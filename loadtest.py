@@ -0,0 +1,314 @@
+# Нагрузочный тест: N игр по M игроков через настоящие HTTP и WebSocket
+#
+# Запуск с отдельным сервером на копии БД:
+#   python loadtest.py --spawn --games 100 --players 8 --output results.json
+# Против уже запущенного сервера:
+#   python loadtest.py --url http://127.0.0.1:8000 --games 10 --players 8
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import httpx
+import websockets
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def percentiles(values: List[float]) -> dict:
+    """
+    p50/p95/p99 в миллисекундах
+    """
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+
+    def at(fraction: float) -> float:
+        return round(ordered[min(int(fraction * len(ordered)), len(ordered) - 1)], 3)
+
+    return {"count": len(ordered), "p50": at(0.50), "p95": at(0.95), "p99": at(0.99), "max": round(ordered[-1], 3)}
+
+
+def rss_kb(pid: Optional[int]) -> Optional[int]:
+    """
+    Память процесса сервера из /proc (только Linux)
+    """
+    if pid is None:
+        return None
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+class Stats:
+    def __init__(self):
+        # {метрика: [мс, ]}
+        self.latency: Dict[str, List[float]] = {"join": [], "connect": [], "ready_fanout": [], "start_fanout": [],
+                                                "round_fanout": []}
+        self.sent: int = 0
+        self.received: int = 0
+        self.received_bytes: int = 0
+        self.errors: Dict[str, int] = {}
+
+    def error(self, code: str):
+        self.errors[code] = self.errors.get(code, 0) + 1
+
+
+class Client:
+    """
+    Сокет одного участника: читает сообщения, отвечает на ping и будит ожидающих
+    """
+
+    def __init__(self, stats: Stats, GUID: str, codec: str = "json"):
+        self.stats = stats
+        self.GUID: str = GUID
+        self.codec: str = codec
+        self.websocket = None
+        self.messages: List[tuple] = []  # [(время получения, сообщение), ]
+        self._arrived = asyncio.Event()
+        self._reader: Optional[asyncio.Task] = None
+
+    async def connect(self, ws_url: str):
+        started = time.perf_counter()
+        self.websocket = await websockets.connect(f"{ws_url}/{self.GUID}?codec={self.codec}", max_size=None)
+        await self.wait_for(lambda message: True)  # первое сообщение - снимок состояния
+        self.stats.latency["connect"].append((time.perf_counter() - started) * 1000)
+
+    async def send(self, data: dict):
+        self.stats.sent += 1
+        if self.codec == "msgpack":
+            await self.websocket.send(msgpack.packb(data, use_bin_type=True))
+        else:
+            await self.websocket.send(json.dumps(data))
+
+    async def wait_for(self, predicate, timeout: float = 30, since: int = 0) -> float:
+        """
+        Ждет сообщение, подходящее под predicate
+        :param since: Смотреть сообщения начиная с этого номера
+        :return: Время его получения (perf_counter)
+        """
+        if self._reader is None:
+            self._reader = asyncio.create_task(self.__read())
+        deadline = time.perf_counter() + timeout
+        checked = since
+        while True:
+            for received_at, message in self.messages[checked:]:
+                if predicate(message):
+                    return received_at
+            checked = len(self.messages)
+            self._arrived.clear()
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            await asyncio.wait_for(self._arrived.wait(), remaining)
+
+    async def __read(self):
+        try:
+            async for raw in self.websocket:
+                received_at = time.perf_counter()
+                if isinstance(raw, bytes) and self.codec == "msgpack":
+                    message = msgpack.unpackb(raw, raw=False)
+                else:
+                    message = json.loads(raw)
+                self.stats.received += 1
+                self.stats.received_bytes += len(raw)
+                if message.get("event") == "ping":
+                    await self.send({"event": "pong", "t": message.get("t")})
+                    continue
+                if "error" in message:
+                    self.stats.error(message["error"])
+                self.messages.append((received_at, message))
+                self._arrived.set()
+        except websockets.ConnectionClosed:
+            pass
+
+    async def close(self):
+        if self.websocket is not None:
+            await self.websocket.close()
+        if self._reader is not None:
+            self._reader.cancel()
+
+
+async def join(http: httpx.AsyncClient, stats: Stats, body: dict) -> dict:
+    started = time.perf_counter()
+    response = await http.post("/creategame", json=body)
+    stats.latency["join"].append((time.perf_counter() - started) * 1000)
+    data = response.json()
+    if response.status_code != 200:
+        stats.error(data.get("error", str(response.status_code)))
+    return data
+
+
+async def run_game(index: int, args, http: httpx.AsyncClient, ws_url: str, stats: Stats):
+    """
+    Одна игра: экран, ведущий, M игроков, переключения готовности, старт и смены раунда
+    """
+    clients: List[Client] = []
+    try:
+        screen_data = await join(http, stats, {"is_screen": "true"})
+        code = screen_data["game_code"]
+        screen = Client(stats, screen_data["user_GUID"], args.codec)
+        await screen.connect(ws_url)
+        clients.append(screen)
+
+        leader_data = await join(http, stats, {"game_code": code, "is_leader": "true", "user_name": "leader"})
+        leader = Client(stats, leader_data["user_GUID"], args.codec)
+        await leader.connect(ws_url)
+        clients.append(leader)
+
+        players: List[Client] = []
+        for number in range(args.players):
+            player_data = await join(http, stats, {"game_code": code, "user_name": f"player{index}_{number}"})
+            player = Client(stats, player_data["user_GUID"], args.codec)
+            await player.connect(ws_url)
+            players.append(player)
+            clients.append(player)
+
+        # region готовность: от нажатия до lobby_update на экране
+        for toggle in range(args.toggles):
+            is_ready = toggle % 2 == 0 or toggle == args.toggles - 1
+            key = "ready" if is_ready else "unready"
+            for player in players:
+                since = len(screen.messages)
+                sent_at = time.perf_counter()
+                await player.send({"event": "player_ready" if is_ready else "player_unready"})
+                received_at = await screen.wait_for(
+                    lambda message, GUID=player.GUID, key=key:
+                    message.get("event") == "lobby_update" and GUID in message.get(key, ()), since=since)
+                stats.latency["ready_fanout"].append((received_at - sent_at) * 1000)
+        # endregion
+
+        # region старт игры и смены раунда: от команды ведущего до каждого игрока
+        sent_at = time.perf_counter()
+        await leader.send({"event": "start_game"})
+        for player in players:
+            try:
+                received_at = await player.wait_for(lambda message: message.get("event") == "game_start", 10)
+            except asyncio.TimeoutError:
+                stats.error("game_start_timeout")  # например, в БД нет пака по умолчанию
+                break
+            stats.latency["start_fanout"].append((received_at - sent_at) * 1000)
+
+        for round_index in range(args.rounds):
+            sent_at = time.perf_counter()
+            await leader.send({"event": "change_round", "round": round_index})
+            for client in clients:
+                try:
+                    received_at = await client.wait_for(
+                        lambda message: message.get("event") == "round_start" and message.get("round") == round_index,
+                        10)
+                except asyncio.TimeoutError:
+                    stats.error("round_start_timeout")
+                    break
+                stats.latency["round_fanout"].append((received_at - sent_at) * 1000)
+        # endregion
+    except Exception as e:
+        stats.error(type(e).__name__)
+    finally:
+        for client in clients:
+            await client.close()
+
+
+async def wait_ready(http: httpx.AsyncClient, timeout: float = 60):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if (await http.get("/ready")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("сервер не прогрелся")
+
+
+async def main(args) -> dict:
+    server = None
+    workdir = None
+    url = args.url
+    if args.spawn:
+        # отдельный сервер на копии БД, рабочая sql_app.db не меняется
+        workdir = tempfile.mkdtemp(prefix="sigame_load_")
+        db_path = os.path.join(workdir, "load.db")
+        if os.path.exists("sql_app.db"):
+            shutil.copyfile("sql_app.db", db_path)
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}")
+        server = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--port", str(args.port),
+                                   "--log-level", "warning"], env=env)
+        url = f"http://127.0.0.1:{args.port}"
+
+    ws_url = url.replace("http", "ws", 1)
+    stats = Stats()
+    try:
+        limits = httpx.Limits(max_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as http:
+            await wait_ready(http)
+            rss_before = rss_kb(server.pid if server else args.pid)
+
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            async def limited(index: int):
+                async with semaphore:
+                    await run_game(index, args, http, ws_url, stats)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(limited(index) for index in range(args.games)))
+            duration = time.perf_counter() - started
+            rss_after = rss_kb(server.pid if server else args.pid)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        if workdir is not None:
+            shutil.rmtree(workdir, True)
+
+    return {
+        "games": args.games,
+        "players": args.players,
+        "duration_s": round(duration, 3),
+        "messages_sent": stats.sent,
+        "messages_received": stats.received,
+        "codec": args.codec,
+        "received_bytes": stats.received_bytes,
+        "received_per_s": round(stats.received / duration, 1) if duration else None,
+        "latency_ms": {name: percentiles(values) for name, values in stats.latency.items()},
+        "rss_kb": {"before": rss_before, "after": rss_after},
+        "errors": stats.errors,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Нагрузочный тест SiGame сервера")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="адрес запущенного сервера")
+    parser.add_argument("--spawn", action="store_true", help="запустить свой uvicorn на копии sql_app.db")
+    parser.add_argument("--port", type=int, default=8765, help="порт для --spawn")
+    parser.add_argument("--pid", type=int, help="pid запущенного сервера для замера RSS")
+    parser.add_argument("--games", type=int, default=10, help="число игр")
+    parser.add_argument("--players", type=int, default=8, help="игроков в игре, кроме экрана и ведущего")
+    parser.add_argument("--toggles", type=int, default=3, help="переключений готовности на игрока")
+    parser.add_argument("--rounds", type=int, default=1, help="смен раунда после старта")
+    parser.add_argument("--concurrency", type=int, default=100, help="игр одновременно")
+    parser.add_argument("--codec", default="json", choices=("json", "orjson", "msgpack"),
+                        help="формат сообщений сокета")
+    parser.add_argument("--output", help="файл для JSON результата, иначе stdout")
+    arguments = parser.parse_args()
+
+    result = asyncio.run(main(arguments))
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf8") as f:
+            f.write(text)
+    print(text)
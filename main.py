@@ -1,22 +1,74 @@
+from Warmup import warmup  # первым: от его импорта считается время до приема соединений
+
 import json
+import os
+from contextlib import asynccontextmanager
 import uuid
-import random
+from typing import Optional
 
-from fastapi import FastAPI, Cookie, Response, Header, Body
+from fastapi import FastAPI, Cookie, Response, Header, Body, Request
 from starlette.middleware.cors import CORSMiddleware
 
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, PlainTextResponse
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
-from ConnectionManager import ConnectionManager, upload_package
+from Broadcaster import negotiate, receive
+from Buzzer import now_ms
+from ConnectionManager import ConnectionManager
+from GameCodes import code_allocator
+from GameRegistry import registry
+from Metrics import metrics, loop_lag_monitor
+from MediaServer import media_library
+from PackageCatalog import package_catalog
+from PackageIngest import ingest_pipeline
+from PackageStore import package_store
+from PackageUpload import receive_upload, UploadError
+from Profiler import profiler
 from Settings import settings
-from models import Player, Package, Game, db
+from migrations import run_migrations
+from models import Player, Package, init_db
 
 # region Константы
 length_GUID = 24
 # endregion
 
-app = FastAPI()  # запуск приложения
+
+# экземпляр класса ConnectionManager
+manager = ConnectionManager()
+
+
+async def startup():
+    """
+    Схема БД и состояние игр, выполняется в фоне после начала приема соединений
+    """
+    await init_db()
+    await run_migrations()
+    await manager.startup()
+    await package_store.start(registry.games.values())
+    await package_catalog.load()
+
+
+async def shutdown():
+    loop_lag_monitor.stop()
+    profiler.stop()
+    if not warmup.ready:
+        await warmup.stop()
+        return
+    await manager.shutdown()
+    package_catalog.stop()
+    await registry.flush()  # дописываем изменения игр в БД
+    ingest_pipeline.shutdown()
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    warmup.start(startup)
+    loop_lag_monitor.start()
+    yield
+    await shutdown()
+
+
+app = FastAPI(lifespan=lifespan)  # запуск приложения
 
 app.add_middleware(  # настраиваем CORS
     CORSMiddleware,
@@ -26,8 +78,58 @@ app.add_middleware(  # настраиваем CORS
     allow_headers=["*"],
 )
 
-# экземпляр класса ConnectionManager
-manager = ConnectionManager()
+
+@app.get("/ready")
+async def ready():
+    """
+    Готов ли экземпляр: 200 после инициализации, пока она идет - 503
+    :return:
+    """
+    status = warmup.status()
+    return JSONResponse(content=status, status_code=200 if warmup.ready else 503)
+
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """
+    Метрики этого воркера в текстовом формате Prometheus
+    :return:
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def debug_allowed(token: Optional[str]) -> bool:
+    """
+    /debug открыт только с токеном из DEBUG_TOKEN, без настройки выключен
+    """
+    return settings["debug_token"] is not None and token == settings["debug_token"]
+
+
+@app.post("/debug/profiler")
+async def switch_profiler(data=Body(), x_debug_token: Optional[str] = Header(None)):
+    """
+    Включает или выключает выборочный профилировщик: {"enabled": true, "interval_ms": 5}
+    :return:
+    """
+    if not debug_allowed(x_debug_token):
+        return JSONResponse(content={"error": "forbidden"}, status_code=403)
+    if data.get("enabled"):
+        profiler.start(data.get("interval_ms"))
+    else:
+        profiler.stop()
+    return JSONResponse(content=profiler.status())
+
+
+@app.get("/debug/profiler")
+async def profiler_report(top: Optional[int] = None, x_debug_token: Optional[str] = Header(None)):
+    """
+    Снятые стеки в формате collapsed для flamegraph
+    :return:
+    """
+    if not debug_allowed(x_debug_token):
+        return JSONResponse(content={"error": "forbidden"}, status_code=403)
+    return PlainTextResponse(profiler.collapsed(top))
+
 
 @app.post("/creategame")
 async def create_game(data=Body()):
@@ -35,6 +137,7 @@ async def create_game(data=Body()):
     Подключает и создает нового игрока
     :return:
     """
+    await warmup.wait()  # первый запрос после холодного старта ждет загрузку реестра
 
     # region получение входящих данных из полученного Headers.new_received_data
     received_game_code = data["game_code"] if "game_code" in data else ""
@@ -50,11 +153,8 @@ async def create_game(data=Body()):
 
     if received_user_is_screen:  # если это экран
 
-        code_game = str(random.randint(100000, 999999))  # случайный код игры
-        game = Game(code=code_game)  # создаем игру
-        db.add(game)
-        db.commit()
-        db.refresh(game)  # обновляем данные
+        code_game = await code_allocator.allocate(manager.backend.claim_code)  # код, которого нет у живых игр
+        game = registry.create_game(code_game, await manager.backend.next_id("game"))  # id назначается сразу
 
         player = Player(GUID=GUID, game_id=game.id, is_screen=True)  # создаем пользователя экран
 
@@ -62,7 +162,7 @@ async def create_game(data=Body()):
 
     elif received_game_code != "":  # если не экран, то код должен быть
 
-        game = db.query(Game).filter(Game.code == received_game_code).first()  # ищем игру по коду
+        game = await registry.fetch_game_by_code(received_game_code)  # ищем игру по коду
         if game is None:  # если игры с таким кодом нет
             return JSONResponse(content={"error": "game_not_found"}, status_code=400)
 
@@ -75,13 +175,14 @@ async def create_game(data=Body()):
     # endregion
 
     # region проверка возможности подключения игрока
-    error: dict = manager.check_add_player(player)
+    error: dict = await manager.check_add_player(player)
     if error != {}:
         return JSONResponse(content=error, status_code=400)
     # endregion
 
-    db.add(player)
-    db.commit()
+    registry.add_player(player, await manager.backend.next_id("player"))  # запись в БД уходит в фоне
+    if manager.backend.shared:  # сокет может открыться на другом воркере, он найдет игрока в БД
+        await registry.flush()
 
     content.update({"event": "user_created", "user_GUID": player.GUID})
 
@@ -90,44 +191,89 @@ async def create_game(data=Body()):
     return JSONResponse(content=content)
 
 
-@app.websocket("/{user_GUID}")
-async def websocket_endpoint_lobby(websocket: WebSocket, user_GUID: str):
-
-    player = await manager.connect(websocket, user_GUID)
+@app.put("/package/{user_GUID}")
+async def upload_package_stream(user_GUID: str, request: Request, name: str = ""):
+    """
+    Загрузка пака: тело запроса - zip архив, пишется на диск потоком.
+    Прогресс приходит ведущему по сокету событием upload_progress,
+    после разбора - package_uploaded с тем же job_id.
+    :return:
+    """
+    await warmup.wait()
+    player = await registry.fetch_player(user_GUID)
     if player is None:
-        await websocket.close(403, "bad_user_GUID")
-        return
+        return JSONResponse(content={"error": "bad_user_GUID"}, status_code=403)
+    if not player.is_leader:
+        return JSONResponse(content={"error": "is_not_leader"}, status_code=403)
+
+    name = os.path.basename(name.strip())
+    if name in ("", ".", ".."):
+        return JSONResponse(content={"error": "не передано имя пака"}, status_code=400)
+
+    content_length = request.headers.get("content-length")
+
+    async def on_progress(received: int, total: int):
+        await manager.send_personal(player, {"event": "upload_progress", "received": received, "total": total})
 
     try:
-        while True:
-            data: dict = await websocket.receive_json()
-            if "event" in data:
+        upload_path, archive_hash = await receive_upload(request.stream(),
+                                                         int(content_length) if content_length else None,
+                                                         on_progress)
+    except UploadError as e:
+        return JSONResponse(content={"error": e.code}, status_code=e.status_code)
+
+    async def on_done(result: dict):
+        await manager.send_personal(player, result)
 
-                if data["event"] in ("player_ready", "player_unready"):
-                    ready_players = await manager.player_ready(player, data["event"] == "player_ready")
-                    await websocket.send_json({"event": data["event"]})
-                    await manager.main_cast({"event": data["event"], "user_GUID": player.GUID,
-                                               "ready_players": ready_players}, player.game_id)
+    # разбор идет в пуле процессов, результат придет по сокету событием package_uploaded
+    job_id = ingest_pipeline.submit(upload_path, archive_hash, name, player, on_done)
+    return JSONResponse(content={"event": "package_ingest_started", "job_id": job_id}, status_code=202)
 
-                if data["event"] == "start_game":
-                    await websocket.send_json(manager.start_game(player))
 
-                if data["event"] == "file_upload" and "package" in data:
+@app.get("/packages")
+async def package_list(q: str = "", offset: int = 0, limit: Optional[int] = None):
+    """
+    Каталог паков для выбора ведущим: поиск по имени и автору, постранично
+    :return: {"packages": [сводка, ], "total": ...}
+    """
+    await warmup.wait()
+    return JSONResponse(content=await package_catalog.page(q, offset, limit))
 
-                    package = data["package"]
 
-                    if "name" not in package or package["name"]:
-                        await websocket.send_json({"error": "не передано имя пака"})
-                        continue
-                    if "bin_data" not in package:
-                        await websocket.send_json({"error": "не переданы бинарные данные пака"})
-                        continue
+@app.get("/media/{package_id}/{ref}")
+async def package_media(package_id: int, ref: str, request: Request):
+    """
+    Файл пака по имени из content.xml (например, Neco Arc - Monster.mp3).
+    Поддерживает Range для перемотки аудио и If-None-Match.
+    :return:
+    """
+    await warmup.wait()
+    return await media_library.response(package_id, ref, request.headers.get("range"),
+                                        request.headers.get("if-none-match"))
+
 
-                    error = await upload_package(package["bin_data"], package["name"], player)
-                    await websocket.send_json(error)
+@app.websocket("/{user_GUID}")
+async def websocket_endpoint_lobby(websocket: WebSocket, user_GUID: str, last_seq: Optional[int] = None,
+                                   codec: Optional[str] = None):
+
+    await warmup.wait()
+    # формат сообщений: ?codec=msgpack или подпротокол sigame.msgpack, по умолчанию JSON
+    codec, subprotocol = negotiate(codec, websocket.scope.get("subprotocols", ()))
+    # last_seq - догонка после переподключения
+    player = await manager.connect(websocket, user_GUID, last_seq, codec, subprotocol)
+    if player is None:
+        await websocket.close(403, "bad_user_GUID")
+        return
 
-            if "settings" in data and player.is_leader:
-                await manager.append_settings(data["settings"])
+    try:
+        while True:
+            data: dict = await receive(websocket, codec)
+            received_ms = now_ms()  # время нажатия кнопки считается отсюда
+            await manager.dispatch(player, data, received_ms)  # события игры обрабатывает ее актор по порядку
 
     except WebSocketDisconnect:
-        await manager.disconnect(player)
+        pass
+    except ValueError:  # битое сообщение или не объект (например [1] или число в msgpack)
+        await websocket.close(1007, "bad_message")
+    finally:
+        await manager.disconnect(player, websocket)  # роль, участие в комнате и писатель не остаются висеть
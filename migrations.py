@@ -0,0 +1,94 @@
+# Доведение схемы существующей БД до моделей
+from sqlalchemy import inspect, select, update, func, Index
+from sqlalchemy.engine import Connection
+
+from Settings import settings
+from models import Base, engine, Package
+
+
+def add_missing_columns(connection: Connection) -> list:
+    """
+    create_all не меняет уже созданные таблицы, поэтому новые колонки моделей
+    добавляем сами через ALTER TABLE (колонки добавляются как nullable)
+    :param connection: Синхронное соединение из run_sync
+    :return: Добавленные колонки в виде ["таблица.колонка", ]
+    """
+    inspector = inspect(connection)
+    added = []
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_type = column.type.compile(dialect=connection.dialect)
+            connection.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}')
+            added.append(f"{table.name}.{column.name}")
+    return added
+
+
+def backfill_package_defaults(connection: Connection) -> int:
+    """
+    Колонка packages.default добавлена как nullable: старые паки получают False,
+    пак по умолчанию из настроек - True, иначе очистка хранилища сочтет его ненужным
+    :return: Сколько строк изменено
+    """
+    changed = connection.execute(update(Package).where(Package.default.is_(None))
+                                 .values(default=False)).rowcount
+    changed += connection.execute(update(Package).where(Package.id == settings["default_package_id"],
+                                                        Package.default.isnot(True))
+                                  .values(default=True)).rowcount
+    return changed
+
+
+def dedupe_for_index(connection: Connection, index: Index) -> int:
+    """
+    Перед уникальным индексом: у дублей, кроме самой новой строки, к последней колонке индекса
+    дописывается -<id> (старый код игры перестает находиться, живая игра остается)
+    :return: Сколько строк изменено
+    """
+    table = index.table
+    columns = list(index.columns)
+    target = columns[-1]
+    newest = select(func.max(table.c.id)).where(*[column.isnot(None) for column in columns]).group_by(*columns)
+    duplicates = connection.execute(select(table.c.id, target).where(
+        table.c.id.notin_(newest), *[column.isnot(None) for column in columns])).all()
+    for row_id, value in duplicates:
+        connection.execute(update(table).where(table.c.id == row_id).values({target.key: f"{value}-{row_id}"}))
+    return len(duplicates)
+
+
+def add_missing_indexes(connection: Connection) -> list:
+    """
+    create_all не добавляет индексы в уже созданные таблицы, создаем их сами.
+    Для уникальных индексов сначала убираем дубли, накопившиеся без них.
+    :param connection: Синхронное соединение из run_sync
+    :return: Добавленные индексы
+    """
+    inspector = inspect(connection)
+    added = []
+    for table in Base.metadata.sorted_tables:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            if index.unique:
+                renamed = dedupe_for_index(connection, index)
+                if renamed:
+                    print(f"{index.name}: переименовано дублей: {renamed}")
+            index.create(connection)
+            added.append(index.name)
+    return added
+
+
+async def run_migrations():
+    """
+    Выполняется при старте после create_all
+    """
+    async with engine.begin() as connection:
+        added = await connection.run_sync(add_missing_columns)
+        await connection.run_sync(backfill_package_defaults)
+        indexes = await connection.run_sync(add_missing_indexes)
+    if added:
+        print("добавлены колонки:", added)
+    if indexes:
+        print("добавлены индексы:", indexes)
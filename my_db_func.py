@@ -1,16 +1,19 @@
-from models import db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from models import Player, Game
 import zipfile
 import urllib.parse
 import os
 import shutil
 
-def find_screen_player(game_id: int) -> Player:
-    return db.query(Player).filter(Player.game_id == game_id, Player.is_screen == True).first()
+async def find_screen_player(session: AsyncSession, game_id: int) -> Player:
+    return (await session.execute(
+        select(Player).where(Player.game_id == game_id, Player.is_screen == True))).scalars().first()
 
 
-def find_game_id_for_user(user_GUID: str) -> int:
-    return db.query(Player).filter(Player.GUID == user_GUID).first().game_id
+async def find_game_id_for_user(session: AsyncSession, user_GUID: str) -> int:
+    return (await session.execute(select(Player.game_id).where(Player.GUID == user_GUID))).scalar()
 
 
 
@@ -22,6 +25,9 @@ def unpack_zip_advanced(zip_path, extract_to=None, max_length=255) -> bool:
         zip_path (str): Путь к zip-файлу
         extract_to (str): Папка для распаковки
         max_length (int): Максимальная длина пути (по умолчанию 255)
+
+    Returns:
+        bool: Распакован ли архив целиком
     """
     if extract_to is None:
         extract_to = os.path.splitext(zip_path)[0] + "_extracted"
@@ -56,6 +62,8 @@ def unpack_zip_advanced(zip_path, extract_to=None, max_length=255) -> bool:
         print(f"Ошибка при работе с zip-файлом: {e}")
         return False
 
+    return True
+
 
 def make_path_safe(original_path, base_dir, max_length=255):
     """
@@ -0,0 +1,114 @@
+import asyncio
+
+from Buzzer import Buzzer
+from Settings import settings
+
+
+def make_buzzer():
+    sent = {"broad": [], "main": []}
+
+    async def broad_cast(data):
+        sent["broad"].append(data)
+
+    async def main_cast(data):
+        sent["main"].append(data)
+
+    return Buzzer(1, broad_cast, main_cast), sent
+
+
+async def wait_decision():
+    await asyncio.sleep(settings["buzz_window_ms"] / 1000 + 0.05)
+
+
+def test_closed_buzzer_rejects():
+    async def run():
+        buzzer, sent = make_buzzer()
+        assert not buzzer.buzz("a", 1000.0)
+        await wait_decision()
+        assert sent["broad"] == []
+
+    asyncio.run(run())
+
+
+def test_second_press_of_same_player_is_ignored():
+    async def run():
+        buzzer, _ = make_buzzer()
+        buzzer.open()
+        assert buzzer.buzz("a", 1000.0)
+        assert not buzzer.buzz("a", 1001.0)
+        buzzer.stop()
+
+    asyncio.run(run())
+
+
+def test_rtt_correction_decides_winner():
+    async def run():
+        buzzer, sent = make_buzzer()
+        buzzer.rtt = {"near": 10.0, "far": 100.0}
+        buzzer.open()
+        buzzer.buzz("near", 1000.0)  # исправленное 995
+        buzzer.buzz("far", 1020.0)  # исправленное 970
+        await wait_decision()
+
+        assert sent["broad"] == [{"event": "buzz_winner", "user_GUID": "far"}]
+        order = sent["main"][0]["order"]
+        assert [entry["user_GUID"] for entry in order] == ["far", "near"]
+        assert order[1]["offset_ms"] == 25.0
+        assert not buzzer.is_open
+
+    asyncio.run(run())
+
+
+def test_rtt_correction_is_capped():
+    async def run():
+        buzzer, sent = make_buzzer()
+        cap = settings["max_rtt_correction_ms"]
+        buzzer.rtt = {"honest": 0.0, "slow": 10 * cap}
+        buzzer.open()
+        buzzer.buzz("honest", 1000.0)
+        buzzer.buzz("slow", 1000.0 + cap + 1)  # без ограничения выиграл бы
+        await wait_decision()
+
+        assert sent["broad"][0]["user_GUID"] == "honest"
+
+    asyncio.run(run())
+
+
+def test_press_after_decision_is_rejected():
+    async def run():
+        buzzer, sent = make_buzzer()
+        buzzer.open()
+        buzzer.buzz("a", 1000.0)
+        await wait_decision()
+
+        assert not buzzer.buzz("b", 1100.0)
+        assert len(sent["broad"]) == 1
+
+    asyncio.run(run())
+
+
+def test_close_drops_pending_presses():
+    async def run():
+        buzzer, sent = make_buzzer()
+        buzzer.open()
+        buzzer.buzz("a", 1000.0)
+        buzzer.close()
+        await wait_decision()
+
+        assert sent["broad"] == []
+
+    asyncio.run(run())
+
+
+def test_pong_smooths_rtt_and_ignores_bad_samples():
+    buzzer, _ = make_buzzer()
+    buzzer.pong("a", 1000.0, 1100.0)
+    assert buzzer.rtt["a"] == 100.0
+
+    buzzer.pong("a", 2000.0, 2200.0)
+    assert buzzer.rtt["a"] == 100.0 + settings["rtt_ewma_alpha"] * 100.0
+
+    buzzer.pong("a", "x", 3000.0)
+    buzzer.pong("a", 5000.0, 4000.0)  # ответ раньше пинга
+    buzzer.pong("a", 0.0, 100_000.0)  # слишком старый пинг
+    assert buzzer.rtt["a"] == 100.0 + settings["rtt_ewma_alpha"] * 100.0